@@ -25,6 +25,9 @@ from .pype_commands import PypeCommands
               help=("Change OpenPype log level (debug - critical or 0-50)"))
 @click.option("--automatic-tests", is_flag=True, expose_value=False,
               help=("Run in automatic tests mode"))
+@click.option("--profile-startup", is_flag=True, expose_value=False,
+              help=("Write startup profile report (path can be defined"
+                    " with OPENPYPE_STARTUP_PROFILE)"))
 def main(ctx):
     """Pype is main command serving as entry point to pipeline system.
 
@@ -418,9 +421,14 @@ def repack_version(directory):
     "--dirpath", help="Directory where package is stored", default=None)
 @click.option(
     "--dbonly", help="Store only Database data", default=False, is_flag=True)
-def pack_project(project, dirpath, dbonly):
+@click.option(
+    "--volume-size",
+    help="Maximum size of project files in one zip volume in MB",
+    type=int,
+    default=None)
+def pack_project(project, dirpath, dbonly, volume_size):
     """Create a package of project with all files and database dump."""
-    PypeCommands().pack_project(project, dirpath, dbonly)
+    PypeCommands().pack_project(project, dirpath, dbonly, volume_size)
 
 
 @main.command()
@@ -435,6 +443,21 @@ def unpack_project(zipfile, root, dbonly):
     PypeCommands().unpack_project(zipfile, root, dbonly)
 
 
+@main.command()
+@click.option("--project", required=True, help="Project name")
+@click.option(
+    "--min-age", type=int, default=86400,
+    help="Minimal age in seconds of unused stored files to remove"
+)
+@click.option(
+    "--dry-run", is_flag=True, default=False,
+    help="Only report unused stored files"
+)
+def cleanup_content_store(project, min_age, dry_run):
+    """Remove files from content store not used by any published file."""
+    PypeCommands().cleanup_content_store(project, min_age, dry_run)
+
+
 @main.command()
 def interactive():
     """Interactive (Python like) console.
@@ -5,6 +5,7 @@ from .mongo import (
 from .entities import (
     get_projects,
     get_project,
+    get_project_entities_change_id,
     get_whole_project,
 
     get_asset_by_id,
@@ -25,6 +26,7 @@ from .entities import (
     get_hero_version_by_subset_id,
     get_hero_versions,
     get_last_versions,
+    get_subset_ids_with_new_versions,
     get_last_version_by_subset_id,
     get_last_version_by_subset_name,
     get_output_link_versions,
@@ -43,6 +45,7 @@ from .entities import (
     get_thumbnail_id_from_source,
 
     get_workfile_info,
+    get_workfile_infos,
 )
 
 from .entity_links import (
@@ -61,6 +64,7 @@ __all__ = (
 
     "get_projects",
     "get_project",
+    "get_project_entities_change_id",
     "get_whole_project",
 
     "get_asset_by_id",
@@ -81,6 +85,7 @@ __all__ = (
     "get_hero_version_by_subset_id",
     "get_hero_versions",
     "get_last_versions",
+    "get_subset_ids_with_new_versions",
     "get_last_version_by_subset_id",
     "get_last_version_by_subset_name",
     "get_output_link_versions",
@@ -99,6 +104,7 @@ __all__ = (
     "get_thumbnail_id_from_source",
 
     "get_workfile_info",
+    "get_workfile_infos",
 
     "get_linked_asset_ids",
     "get_linked_assets",
@@ -12,7 +12,11 @@ import collections
 import six
 from bson.objectid import ObjectId
 
-from .mongo import get_project_database, get_project_connection
+from .mongo import (
+    get_project_database,
+    get_project_connection,
+    get_project_changes_collection,
+)
 
 PatternType = type(re.compile(""))
 
@@ -135,6 +139,28 @@ def get_project(project_name, active=True, inactive=True, fields=None):
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+def get_project_entities_change_id(project_name):
+    """Counter of changes of project and asset documents of project.
+
+    Counter is increased by 'mark_project_entities_changed' in
+    'openpype.client.operations'. Value can be compared with value from
+    time when project entities were cached to find out if cache is outdated.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        int: Counter of changes. 0 if changes were never marked.
+    """
+
+    doc = get_project_changes_collection().find_one(
+        {"project_name": project_name}, {"change_id": True}
+    )
+    if doc:
+        return doc.get("change_id") or 0
+    return 0
+
+
 def get_whole_project(project_name):
     """Receive all documents from project.
 
@@ -950,6 +976,35 @@ def get_last_versions(project_name, subset_ids, active=None, fields=None):
     }
 
 
+def get_subset_ids_with_new_versions(project_name, subset_ids, since):
+    """Ids of subsets which have versions created since passed time.
+
+    Creation time is taken from version id so the query does not need to
+    read the version documents.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        subset_ids (Iterable[Union[str, ObjectId]]): List of subset ids.
+        since (datetime.datetime): Time in UTC since when versions were
+            created.
+
+    Returns:
+        set[ObjectId]: Ids of subsets with new versions.
+    """
+
+    subset_ids = convert_ids(subset_ids)
+    if not subset_ids:
+        return set()
+
+    conn = get_project_connection(project_name)
+    query_filter = {
+        "type": "version",
+        "parent": {"$in": subset_ids},
+        "_id": {"$gte": ObjectId.from_datetime(since)}
+    }
+    return set(conn.distinct("parent", query_filter))
+
+
 def get_last_version_by_subset_id(project_name, subset_id, fields=None):
     """Last version for passed subset id.
 
@@ -1526,6 +1581,56 @@ def get_workfile_info(
     return conn.find_one(query_filter, _prepare_fields(fields))
 
 
+def get_workfile_infos(
+    project_name,
+    asset_ids=None,
+    task_names=None,
+    filenames=None,
+    fields=None
+):
+    """Documents with workfile information of multiple files.
+
+    Workfile information of all files of a task (or many tasks) can be
+    queried at once instead of querying them one by one with
+    'get_workfile_info'.
+
+    Args:
+        project_name (str): Name of project where to look for queried entities.
+        asset_ids (Iterable[Union[str, ObjectId]]): Ids of asset entities.
+            Filter ignored if 'None' is passed.
+        task_names (Iterable[str]): Task names on assets.
+            Filter ignored if 'None' is passed.
+        filenames (Iterable[str]): Workfile filenames.
+            Filter ignored if 'None' is passed.
+        fields (Optional[Iterable[str]]): Fields that should be returned. All
+            fields are returned if 'None' is passed.
+
+    Returns:
+        Cursor: Iterable cursor yielding all matching workfile documents.
+    """
+
+    query_filter = {"type": "workfile"}
+    if asset_ids is not None:
+        asset_ids = convert_ids(asset_ids)
+        if not asset_ids:
+            return []
+        query_filter["parent"] = {"$in": asset_ids}
+
+    for key, values in (
+        ("task_name", task_names),
+        ("filename", filenames),
+    ):
+        if values is None:
+            continue
+        values = list(values)
+        if not values:
+            return []
+        query_filter[key] = {"$in": values}
+
+    conn = get_project_connection(project_name)
+    return conn.find(query_filter, _prepare_fields(fields))
+
+
 """
 ## Custom data storage:
 - Settings - OP settings overrides and local settings
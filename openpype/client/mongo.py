@@ -17,6 +17,9 @@ else:
     from urllib.parse import urlparse, parse_qs
 
 
+PROJECT_CHANGES_COLLECTION_NAME = "project_entities_changes"
+
+
 class MongoEnvNotSet(Exception):
     pass
 
@@ -253,6 +256,12 @@ class OpenPypeMongoConnection:
         if not valid:
             raise last_exc
 
+        from openpype.lib.profiling import get_startup_profiler
+
+        profiler = get_startup_profiler()
+        if profiler is not None:
+            profiler.add_phase_time("mongo.connect", t1, time.time() - t1)
+
         cls.log.info("Connected to {}, delay {:.3f}s".format(
             mongo_url, time.time() - t1
         ))
@@ -339,6 +348,23 @@ def restore_collection(filepath, database_name, collection_name):
     replace_collection_documents(docs, database_name, collection_name)
 
 
+def get_project_changes_collection():
+    """Collection with counters of changes of project entities.
+
+    Counter of a project is increased when project or asset documents are
+    changed, so processes caching the documents can find out that their
+    cache is outdated. Collection is in OpenPype database.
+
+    Returns:
+        pymongo.collection.Collection: Collection of change counters.
+    """
+
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    return OpenPypeMongoConnection.get_mongo_client()[database_name][
+        PROJECT_CHANGES_COLLECTION_NAME
+    ]
+
+
 def get_project_database(database_name=None):
     """Database object where project collections are.
 
@@ -8,7 +8,7 @@ import six
 from bson.objectid import ObjectId
 from pymongo import DeleteOne, InsertOne, UpdateOne
 
-from .mongo import get_project_connection
+from .mongo import get_project_connection, get_project_changes_collection
 from .entities import get_project
 
 REMOVED_VALUE = object()
@@ -671,6 +671,12 @@ class OperationsSession(object):
                 collection = get_project_connection(project_name)
                 collection.bulk_write(bulk_writes)
 
+            if any(
+                operation.entity_type in ("project", "asset")
+                for operation in operations
+            ):
+                mark_project_entities_changed(project_name)
+
     def create_entity(self, project_name, entity_type, data):
         """Fast access to 'CreateOperation'.
 
@@ -707,6 +713,24 @@ class OperationsSession(object):
         return operation
 
 
+def mark_project_entities_changed(project_name):
+    """Mark that project or asset documents of project were changed.
+
+    Must be called after project or asset documents were changed in other
+    way than using 'OperationsSession', so processes caching them know that
+    the cache is outdated.
+
+    Args:
+        project_name (str): Name of project.
+    """
+
+    get_project_changes_collection().update_one(
+        {"project_name": project_name},
+        {"$inc": {"change_id": 1}},
+        upsert=True
+    )
+
+
 def create_project(
     project_name,
     project_code,
@@ -13,7 +13,7 @@ import platform
 import six
 
 from openpype.lib import Logger
-from openpype.modules import ModulesManager
+from openpype.modules import get_modules_manager
 from openpype.settings import get_project_settings
 from openpype.settings.lib import get_site_local_overrides
 
@@ -43,7 +43,7 @@ class HostDirmap(object):
     @property
     def sync_module(self):
         if self._sync_module is None:
-            manager = ModulesManager()
+            manager = get_modules_manager()
             self._sync_module = manager["sync_server"]
         return self._sync_module
 
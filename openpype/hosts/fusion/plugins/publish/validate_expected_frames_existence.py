@@ -1,7 +1,10 @@
-import os
 import pyblish.api
 
-from openpype.pipeline.publish import RepairAction
+from openpype.lib import format_file_sequences
+from openpype.pipeline.publish import (
+    RepairAction,
+    get_file_existence_index,
+)
 from openpype.pipeline import PublishValidationError
 
 from openpype.hosts.fusion.api.action import SelectInvalidAction
@@ -27,12 +30,11 @@ class ValidateLocalFramesExistence(pyblish.api.InstancePlugin):
 
         expected_files = instance.data["expectedFiles"]
 
-        for file in expected_files:
-            if not os.path.exists(file):
-                cls.log.error(
-                    f"Missing file: {file}"
-                )
-                non_existing_frames.append(file)
+        existence_index = get_file_existence_index(instance.context)
+        missing_files = existence_index.get_missing(expected_files)
+        for missing in format_file_sequences(missing_files):
+            cls.log.error(f"Missing file: {missing}")
+        non_existing_frames.extend(missing_files)
 
         if len(non_existing_frames) > 0:
             cls.log.error(f"Some of {tool.Name}'s files does not exist")
@@ -47,7 +49,7 @@ class ValidateLocalFramesExistence(pyblish.api.InstancePlugin):
                 "some frames are missing. "
                 "The missing file(s) are:\n\n{}".format(
                     invalid[0].Name,
-                    "\n\n".join(non_existing_frames),
+                    "\n\n".join(format_file_sequences(non_existing_frames)),
                 ),
                 title=self.label,
             )
@@ -35,7 +35,7 @@ from openpype.pipeline import (
     deregister_creator_plugin_path,
     AVALON_CONTAINER_ID,
 )
-from openpype.pipeline.load import any_outdated_containers
+from openpype.pipeline.load import get_outdated_containers_monitor
 from openpype.pipeline.workfile.lock_workfile import (
     create_workfile_lock,
     remove_workfile_lock,
@@ -597,7 +597,11 @@ def on_open():
     lib.validate_fps()
     lib.fix_incompatible_containers()
 
-    if any_outdated_containers():
+    # Shared monitor queries only representations and subsets which
+    #   changed since previous check (e.g. when reopening scene)
+    monitor = get_outdated_containers_monitor()
+    monitor.set_containers(ls())
+    if monitor.check().outdated:
         log.warning("Scene has outdated content.")
 
         # Find maya main window
@@ -6,9 +6,14 @@ import contextlib
 import json
 import logging
 import os
+import sys
+import time
 import platform
 import tempfile
+import threading
+import multiprocessing
 import six
+from six.moves import queue
 import attr
 
 import pyblish.api
@@ -18,6 +23,9 @@ from maya import cmds  # noqa
 from openpype.lib.vendor_bin_utils import find_executable
 from openpype.lib import source_hash, run_subprocess, get_oiio_tools_path
 from openpype.pipeline import legacy_io, publish, KnownPublishError
+from openpype.pipeline.publish.texture_cache import (
+    find_texture_paths_by_hash
+)
 from openpype.hosts.maya.api import lib
 
 # Modes for transfer
@@ -40,7 +48,7 @@ class TextureResult(object):
 
 
 def find_paths_by_hash(texture_hash):
-    """Find the texture hash key in the dictionary.
+    """Find published paths of the texture hash in texture cache.
 
     All paths that originate from it.
 
@@ -48,11 +56,12 @@ def find_paths_by_hash(texture_hash):
         texture_hash (str): Hash of the texture.
 
     Return:
-        str: path to texture if found.
+        list[str]: Paths to texture, last published path is first.
 
     """
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return legacy_io.distinct(key, {"type": "version"})
+    return find_texture_paths_by_hash(
+        legacy_io.active_project(), texture_hash
+    )
 
 
 @contextlib.contextmanager
@@ -137,6 +146,25 @@ class TextureProcessor:
         """
         pass
 
+    def get_result_hash(self, source, colorspace, color_management):
+        """Hash and colorspace of texture result without processing it.
+
+        Hash is used to find already published result of the same source
+        processed with the same arguments.
+
+        Args:
+            source (str): Path to source file.
+            colorspace (str): Colorspace of the source file.
+            color_management (dict): Maya Color management data from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            Union[tuple[str, str], None]: Texture hash and colorspace of
+                result or None if result can't be reused.
+
+        """
+        return None
+
     def __repr__(self):
         # Log instance as class name
         return self.__class__.__name__
@@ -164,8 +192,9 @@ class MakeRSTexBin(TextureProcessor):
             source
         ]
 
-        hash_args = ["rstex"]
-        texture_hash = source_hash(source, *hash_args)
+        texture_hash, _ = self.get_result_hash(
+            source, colorspace, color_management
+        )
 
         # Redshift stores the output texture next to the input but with
         # the extension replaced to `.rstexbin`
@@ -187,6 +216,10 @@ class MakeRSTexBin(TextureProcessor):
             transfer_mode=COPY
         )
 
+    def get_result_hash(self, source, colorspace, color_management):
+        hash_args = ["rstex"]
+        return source_hash(source, *hash_args), colorspace
+
     @staticmethod
     def get_redshift_tool(tool_name):
         """Path to redshift texture processor.
@@ -285,46 +318,32 @@ class MakeTX(TextureProcessor):
                 transfer_mode=COPY
             )
 
-        # Hardcoded default arguments for maketx conversion based on Arnold's
-        # txManager in Maya
-        args = [
-            # unpremultiply before conversion (recommended when alpha present)
-            "--unpremult",
-            # use oiio-optimized settings for tile-size, planarconfig, metadata
-            "--oiio",
-            "--filter", "lanczos3",
-        ]
+        args, render_colorspace = self._get_conversion_args(
+            colorspace, color_management
+        )
         if color_management["enabled"]:
-            config_path = color_management["config"]
-            if not os.path.exists(config_path):
-                raise RuntimeError("OCIO config not found at: "
-                                   "{}".format(config_path))
-
-            render_colorspace = color_management["rendering_space"]
-
             self.log.info("tx: converting colorspace {0} "
                           "-> {1}".format(colorspace,
                                           render_colorspace))
-            args.extend(["--colorconvert", colorspace, render_colorspace])
-            args.extend(["--colorconfig", config_path])
-
         else:
             # Maya Color management is disabled. We cannot rely on an OCIO
             self.log.debug("tx: Maya color management is disabled. No color "
                            "conversion will be applied to .tx conversion for: "
                            "{}".format(source))
-            # Assume linear
-            render_colorspace = "linear"
 
-        # Note: The texture hash is only reliable if we include any potential
-        # conversion arguments provide to e.g. `maketx`
-        hash_args = ["maketx"] + args + self.extra_args
-        texture_hash = source_hash(source, *hash_args)
+        texture_hash, _ = self.get_result_hash(
+            source, colorspace, color_management
+        )
 
         # Ensure folder exists
+        #   - textures may be processed concurrently
         resources_dir = os.path.join(staging_dir, "resources")
         if not os.path.exists(resources_dir):
-            os.makedirs(resources_dir)
+            try:
+                os.makedirs(resources_dir)
+            except OSError:
+                if not os.path.isdir(resources_dir):
+                    raise
 
         self.log.info("Generating .tx file for %s .." % source)
 
@@ -374,6 +393,43 @@ class MakeTX(TextureProcessor):
             transfer_mode=COPY
         )
 
+    def get_result_hash(self, source, colorspace, color_management):
+        if os.path.splitext(source)[1] == ".tx":
+            return source_hash(source), colorspace
+
+        args, render_colorspace = self._get_conversion_args(
+            colorspace, color_management
+        )
+        # Note: The texture hash is only reliable if we include any potential
+        # conversion arguments provide to e.g. `maketx`
+        hash_args = ["maketx"] + args + self.extra_args
+        return source_hash(source, *hash_args), render_colorspace
+
+    def _get_conversion_args(self, colorspace, color_management):
+        """Conversion arguments for `maketx` and resulting colorspace."""
+        # Hardcoded default arguments for maketx conversion based on Arnold's
+        # txManager in Maya
+        args = [
+            # unpremultiply before conversion (recommended when alpha present)
+            "--unpremult",
+            # use oiio-optimized settings for tile-size, planarconfig, metadata
+            "--oiio",
+            "--filter", "lanczos3",
+        ]
+        if not color_management["enabled"]:
+            # Assume linear
+            return args, "linear"
+
+        config_path = color_management["config"]
+        if not os.path.exists(config_path):
+            raise RuntimeError("OCIO config not found at: "
+                               "{}".format(config_path))
+
+        render_colorspace = color_management["rendering_space"]
+        args.extend(["--colorconvert", colorspace, render_colorspace])
+        args.extend(["--colorconfig", config_path])
+        return args, render_colorspace
+
     @staticmethod
     def _has_arnold():
         """Return whether the arnold package is available and importable."""
@@ -399,6 +455,11 @@ class ExtractLook(publish.Extractor):
     order = pyblish.api.ExtractorOrder + 0.2
     scene_type = "ma"
     look_data_type = "json"
+    # Number of textures processed at the same time (number of CPUs if 0)
+    max_texture_workers = 0
+    # Expected memory usage of one texture processing used to limit
+    #   number of workers by available memory (ignored if 0)
+    texture_worker_memory_mb = 2048
 
     def get_maya_scene_type(self, instance):
         """Get Maya scene type from settings.
@@ -604,6 +665,23 @@ class ExtractLook(publish.Extractor):
                 destinations_cache[path] = destination
             return destinations_cache[path]
 
+        # Collect unique files of all resources with colorspace of first
+        #   resource using the file
+        textures = OrderedDict()
+        for resource in resources:
+            for filepath in resource["files"]:
+                filepath = os.path.normpath(filepath)
+                if filepath not in textures:
+                    textures[filepath] = resource["color_space"]
+
+        texture_results = self._process_textures(
+            textures,
+            processors=processors,
+            staging_dir=staging_dir,
+            force_copy=force_copy,
+            color_management=color_management
+        )
+
         # Process all resource's individual files
         processed_files = {}
         transfers = []
@@ -644,14 +722,7 @@ class ExtractLook(publish.Extractor):
                     )
                     continue
 
-                texture_result = self._process_texture(
-                    filepath,
-                    processors=processors,
-                    staging_dir=staging_dir,
-                    force_copy=force_copy,
-                    color_management=color_management,
-                    colorspace=colorspace
-                )
+                texture_result = texture_results[filepath]
 
                 # Set the resulting color space on the resource
                 self._set_resource_result_colorspace(
@@ -712,6 +783,109 @@ class ExtractLook(publish.Extractor):
             "attrRemap": remap,
         }
 
+    def _get_texture_workers_count(self, textures_count):
+        """Number of textures processed at the same time.
+
+        Limited by 'max_texture_workers' (number of CPUs when not set) and
+        by available memory when 'texture_worker_memory_mb' is set and
+        'psutil' is available.
+        """
+        workers_count = self.max_texture_workers
+        if not workers_count or workers_count < 1:
+            workers_count = multiprocessing.cpu_count()
+
+        if self.texture_worker_memory_mb > 0:
+            try:
+                import psutil
+
+                available_memory = psutil.virtual_memory().available
+                worker_memory = self.texture_worker_memory_mb * 1024 * 1024
+                workers_count = min(
+                    workers_count, available_memory // worker_memory
+                )
+            except ImportError:
+                pass
+
+        return int(max(1, min(workers_count, textures_count)))
+
+    def _process_textures(self,
+                          textures,
+                          processors,
+                          staging_dir,
+                          force_copy,
+                          color_management):
+        """Process unique texture files using pool of workers.
+
+        Args:
+            textures (OrderedDict[str, str]): Source colorspace by texture
+                file path.
+            processors (list): List of TextureProcessor processing textures.
+            staging_dir (str): The staging directory to write to.
+            force_copy (bool): Whether to force a copy of textures.
+            color_management (dict): Maya's Color Management settings from
+                `lib.get_color_management_preferences`
+
+        Returns:
+            dict[str, TextureResult]: Texture result by texture file path.
+        """
+        jobs = queue.Queue()
+        for filepath, colorspace in textures.items():
+            jobs.put((filepath, colorspace))
+
+        results = {}
+        timings = {}
+        errors = []
+
+        def _process_jobs():
+            while not errors:
+                try:
+                    filepath, colorspace = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                start = time.time()
+                try:
+                    results[filepath] = self._process_texture(
+                        filepath,
+                        processors=processors,
+                        staging_dir=staging_dir,
+                        force_copy=force_copy,
+                        color_management=color_management,
+                        colorspace=colorspace
+                    )
+                except Exception:
+                    errors.append(sys.exc_info())
+                timings[filepath] = time.time() - start
+
+        workers_count = self._get_texture_workers_count(len(textures))
+        self.log.debug("Processing {} textures with {} workers".format(
+            len(textures), workers_count
+        ))
+        start = time.time()
+        if workers_count < 2:
+            _process_jobs()
+        else:
+            threads = [
+                threading.Thread(target=_process_jobs)
+                for _ in range(workers_count)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            six.reraise(*errors[0])
+
+        for filepath in textures.keys():
+            self.log.debug("Texture processed in {:.3f}s: {}".format(
+                timings[filepath], filepath
+            ))
+        self.log.info("Processed {} textures in {:.3f}s".format(
+            len(textures), time.time() - start
+        ))
+        return results
+
     def get_resource_destination(self, filepath, resources_dir, processors):
         """Get resource destination path.
 
@@ -800,6 +974,29 @@ class ExtractLook(publish.Extractor):
             )
 
         for processor in processors:
+            # If source has been published before with the same processing
+            #   arguments then don't reprocess but hardlink the result
+            result_hash = None
+            if not force_copy:
+                result_hash = processor.get_result_hash(
+                    filepath, colorspace, color_management
+                )
+
+            if result_hash:
+                texture_hash, result_colorspace = result_hash
+                existing = self._get_existing_hashed_texture(texture_hash)
+                if existing:
+                    self.log.info((
+                        "Found processed texture in texture cache,"
+                        " preparing hardlink: {}"
+                    ).format(existing))
+                    return TextureResult(
+                        path=existing,
+                        file_hash=texture_hash,
+                        colorspace=result_colorspace,
+                        transfer_mode=HARDLINK
+                    )
+
             self.log.debug("Processing texture {} with processor {}".format(
                 filepath, processor
             ))
@@ -814,18 +1011,16 @@ class ExtractLook(publish.Extractor):
             self.log.info("Generated processed "
                           "texture: {}".format(processed_result.path))
 
-            # TODO: Currently all processors force copy instead of allowing
-            #       hardlinks using source hashes. This should be refactored
             return processed_result
 
         # No texture processing for this file
         texture_hash = source_hash(filepath)
         if not force_copy:
-            existing = self._get_existing_hashed_texture(filepath)
+            existing = self._get_existing_hashed_texture(texture_hash)
             if existing:
                 self.log.info("Found hash in database, preparing hardlink..")
                 return TextureResult(
-                    path=filepath,
+                    path=existing,
                     file_hash=texture_hash,
                     colorspace=colorspace,
                     transfer_mode=HARDLINK
@@ -61,8 +61,15 @@ from .execute import (
     run_openpype_process,
     clean_envs_for_openpype_process,
     path_to_subprocess_arg,
+    ProcessTimeoutError,
+    ProcessCancelledError,
     CREATE_NO_WINDOW
 )
+from .process_executor import (
+    SubprocessExecutor,
+    SubprocessFuture,
+    wait_for_futures,
+)
 from .log import (
     Logger,
     PypeLogger,
@@ -168,12 +175,23 @@ from .plugin_tools import (
     get_subset_name_with_asset_doc,
     prepare_template_data,
     source_hash,
+    source_content_hash,
+    is_source_content_hash,
+    validate_source_content_hash,
+)
+
+from .file_sequences import (
+    FileSequence,
+    SequenceIndex,
+    FileExistenceIndex,
+    format_file_sequences,
 )
 
 from .path_tools import (
     format_file_size,
     collect_frames,
     create_hard_link,
+    create_file_clone,
     version_up,
     get_version_from_path,
     get_last_version_from_path,
@@ -215,6 +233,11 @@ __all__ = [
     "run_openpype_process",
     "clean_envs_for_openpype_process",
     "path_to_subprocess_arg",
+    "ProcessTimeoutError",
+    "ProcessCancelledError",
+    "SubprocessExecutor",
+    "SubprocessFuture",
+    "wait_for_futures",
     "CREATE_NO_WINDOW",
 
     "env_value_to_bool",
@@ -302,10 +325,19 @@ __all__ = [
     "get_subset_name",
     "get_subset_name_with_asset_doc",
     "source_hash",
+    "source_content_hash",
+    "is_source_content_hash",
+    "validate_source_content_hash",
+
+    "FileSequence",
+    "SequenceIndex",
+    "FileExistenceIndex",
+    "format_file_sequences",
 
     "format_file_size",
     "collect_frames",
     "create_hard_link",
+    "create_file_clone",
     "version_up",
     "get_version_from_path",
     "get_last_version_from_path",
@@ -2,6 +2,8 @@ import os
 import sys
 import copy
 import json
+import time
+import hashlib
 import tempfile
 import platform
 import collections
@@ -45,6 +47,13 @@ CUSTOM_LAUNCH_APP_GROUPS = {
     "djvview"
 }
 
+# Cache of launch hook classes by hooks directory
+# - values are tuple of files modification times and classes by launch type
+_LAUNCH_HOOK_CLASSES_CACHE = {}
+# Cache of merged application and tools environments by digest of
+#   their settings values
+_APP_ENV_VALUES_CACHE = {}
+
 
 def parse_environments(env_data, env_group=None, platform_name=None):
     """Parse environment values from settings byt group and platform.
@@ -855,6 +864,55 @@ class PostLaunchHook(LaunchHook):
     """
 
 
+def _get_launch_hooks_mtimes(path):
+    """Modification times of python files in launch hooks directory."""
+    mtimes = []
+    for filename in sorted(os.listdir(path)):
+        if filename.startswith("_") or not filename.endswith(".py"):
+            continue
+        filepath = os.path.join(path, filename)
+        if os.path.isfile(filepath):
+            mtimes.append((filename, os.path.getmtime(filepath)))
+    return tuple(mtimes)
+
+
+def _get_launch_hook_classes(path, force=False):
+    """Launch hook classes defined in python files of directory.
+
+    Files are imported only once per process unless any of them was
+    added, removed or modified.
+
+    Args:
+        path (str): Directory with launch hooks.
+        force (Optional[bool]): Import files even if are cached.
+
+    Returns:
+        dict[str, list[type]]: Pre and post launch hook classes.
+    """
+    mtimes = _get_launch_hooks_mtimes(path)
+    cached = _LAUNCH_HOOK_CLASSES_CACHE.get(path)
+    if not force and cached is not None and cached[0] == mtimes:
+        return cached[1]
+
+    classes = {
+        "pre": [],
+        "post": []
+    }
+    modules, _crashed = modules_from_path(path)
+    for _filepath, module in modules:
+        classes["pre"].extend(
+            classes_from_module(PreLaunchHook, module)
+        )
+        classes["post"].extend(
+            classes_from_module(PostLaunchHook, module)
+        )
+
+    # Crashed files are imported again on next launch
+    if not _crashed:
+        _LAUNCH_HOOK_CLASSES_CACHE[path] = (mtimes, classes)
+    return classes
+
+
 class ApplicationLaunchContext:
     """Context of launching application.
 
@@ -1079,6 +1137,7 @@ class ApplicationLaunchContext:
             "\n".join("- {}".format(path) for path in paths)
         ))
 
+        start_time = time.time()
         all_classes = {
             "pre": [],
             "post": []
@@ -1090,14 +1149,13 @@ class ApplicationLaunchContext:
                 )
                 continue
 
-            modules, _crashed = modules_from_path(path)
-            for _filepath, module in modules:
-                all_classes["pre"].extend(
-                    classes_from_module(PreLaunchHook, module)
-                )
-                all_classes["post"].extend(
-                    classes_from_module(PostLaunchHook, module)
-                )
+            for launch_type, classes in _get_launch_hook_classes(
+                path, force
+            ).items():
+                all_classes[launch_type].extend(classes)
+        self.log.debug("Launch hook classes collected in {:.3f}s".format(
+            time.time() - start_time
+        ))
 
         for launch_type, classes in all_classes.items():
             hooks_with_order = []
@@ -1227,14 +1285,21 @@ class ApplicationLaunchContext:
             return
 
         # Discover launch hooks
+        start_time = time.time()
         self.discover_launch_hooks()
+        self.log.debug("Launch hooks discovered in {:.3f}s".format(
+            time.time() - start_time
+        ))
 
         # Execute prelaunch hooks
         for prelaunch_hook in self.prelaunch_hooks:
-            self.log.debug("Executing prelaunch hook: {}".format(
-                str(prelaunch_hook.__class__.__name__)
-            ))
+            hook_name = prelaunch_hook.__class__.__name__
+            self.log.debug("Executing prelaunch hook: {}".format(hook_name))
+            hook_start_time = time.time()
             prelaunch_hook.execute()
+            self.log.debug("Prelaunch hook {} finished in {:.3f}s".format(
+                hook_name, time.time() - hook_start_time
+            ))
 
         self.log.debug("All prelaunch hook executed. Starting new process.")
 
@@ -1253,7 +1318,11 @@ class ApplicationLaunchContext:
         self.launch_args = args
 
         # Run process
+        process_start_time = time.time()
         self.process = self._run_process()
+        self.log.debug("Process started in {:.3f}s".format(
+            time.time() - process_start_time
+        ))
 
         # Process post launch hooks
         for postlaunch_hook in self.postlaunch_hooks:
@@ -1272,8 +1341,8 @@ class ApplicationLaunchContext:
                     exc_info=True
                 )
 
-        self.log.debug("Launch of {} finished.".format(
-            self.application.full_name
+        self.log.debug("Launch of {} finished in {:.3f}s.".format(
+            self.application.full_name, time.time() - start_time
         ))
 
         return self.process
@@ -1370,7 +1439,7 @@ def get_app_environments_for_context(
         dict: Environments for passed context and application.
     """
 
-    from openpype.modules import ModulesManager
+    from openpype.modules import get_modules_manager
     from openpype.pipeline import AvalonMongoDB, Anatomy
     from openpype.lib.openpype_version import is_running_staging
 
@@ -1384,7 +1453,7 @@ def get_app_environments_for_context(
     asset_doc = get_asset_by_name(project_name, asset_name)
 
     if modules_manager is None:
-        modules_manager = ModulesManager()
+        modules_manager = get_modules_manager()
 
     # Prepare app object which can be obtained only from ApplciationManager
     app_manager = ApplicationManager()
@@ -1471,6 +1540,60 @@ def _add_python_version_paths(app, env, logger, modules_manager):
     env["PYTHONPATH"] = os.pathsep.join(python_paths)
 
 
+def _get_app_and_tools_env_values(
+    environments, env_group, filtered_local_envs
+):
+    """Parse and merge environments of application and tools.
+
+    Result does not depend on context so is cached per process by digest of
+    environments from settings, environment group, platform and local
+    environments.
+
+    Args:
+        environments (list[dict]): Environments of application and tools
+            from settings in order of merge.
+        env_group (Union[str, None]): Environment group.
+        filtered_local_envs (dict[str, str]): Environments from local
+            settings.
+
+    Returns:
+        dict[str, str]: Merged environments.
+    """
+    cache_key = hashlib.sha256(json.dumps(
+        [
+            environments,
+            env_group,
+            platform.system().lower(),
+            filtered_local_envs
+        ],
+        sort_keys=True
+    ).encode("utf-8")).hexdigest()
+    cached_values = _APP_ENV_VALUES_CACHE.get(cache_key)
+    if cached_values is not None:
+        return dict(cached_values)
+
+    env_values = {}
+    for _env_values in environments:
+        if not _env_values:
+            continue
+
+        # Choose right platform
+        tool_env = parse_environments(_env_values, env_group)
+
+        # Apply local environment variables
+        # - must happen between all values because they may be used during
+        #   merge
+        for key, value in filtered_local_envs.items():
+            if key in tool_env:
+                tool_env[key] = value
+
+        # Merge dictionaries
+        env_values = _merge_env(tool_env, env_values)
+
+    _APP_ENV_VALUES_CACHE[cache_key] = env_values
+    return dict(env_values)
+
+
 def prepare_app_environments(
     data, env_group=None, implementation_envs=True, modules_manager=None
 ):
@@ -1487,9 +1610,9 @@ def prepare_app_environments(
     source_env = data["env"].copy()
 
     if modules_manager is None:
-        from openpype.modules import ModulesManager
+        from openpype.modules import get_modules_manager
 
-        modules_manager = ModulesManager()
+        modules_manager = get_modules_manager()
 
     _add_python_version_paths(app, source_env, log, modules_manager)
 
@@ -1546,27 +1669,16 @@ def prepare_app_environments(
         )
     )
 
-    env_values = {}
-    for _env_values in environments:
-        if not _env_values:
-            continue
-
-        # Choose right platform
-        tool_env = parse_environments(_env_values, env_group)
-
-        # Apply local environment variables
-        # - must happen between all values because they may be used during
-        #   merge
-        for key, value in filtered_local_envs.items():
-            if key in tool_env:
-                tool_env[key] = value
-
-        # Merge dictionaries
-        env_values = _merge_env(tool_env, env_values)
-
+    start_time = time.time()
+    env_values = _get_app_and_tools_env_values(
+        environments, env_group, filtered_local_envs
+    )
     merged_env = _merge_env(env_values, source_env)
 
     loaded_env = acre.compute(merged_env, cleanup=False)
+    log.debug("Application environments computed in {:.3f}s".format(
+        time.time() - start_time
+    ))
 
     final_env = None
     # Add host specific environments
@@ -1747,11 +1859,11 @@ def _prepare_last_workfile(data, workdir, modules_manager):
         workdir (str): Path to folder where workfiles should be stored.
     """
 
-    from openpype.modules import ModulesManager
+    from openpype.modules import get_modules_manager
     from openpype.pipeline import HOST_WORKFILE_EXTENSIONS
 
     if not modules_manager:
-        modules_manager = ModulesManager()
+        modules_manager = get_modules_manager()
 
     log = data["log"]
 
@@ -1,9 +1,15 @@
 import os
 import sys
+import signal
+import time
 import subprocess
 import platform
 import json
 import tempfile
+import threading
+import collections
+
+import six
 
 from .log import Logger
 from .vendor_bin_utils import find_executable
@@ -76,10 +82,84 @@ def execute(args,
     return popen.returncode
 
 
+class ProcessTimeoutError(RuntimeError):
+    """Process did not finish in defined timeout and was killed."""
+
+
+class ProcessCancelledError(RuntimeError):
+    """Process was cancelled and killed."""
+
+
+def _kill_process_tree(proc, own_process_group):
+    """Kill process with all its child processes.
+
+    Killing only the process would keep its children running when process
+    was started with 'shell=True' and their output pipes would stay open.
+
+    Args:
+        proc (subprocess.Popen): Process to kill.
+        own_process_group (bool): Process was started in new session on
+            POSIX and its process group can be killed.
+    """
+
+    if platform.system().lower() == "windows":
+        # 'taskkill' with '/T' kills also child processes
+        returncode = subprocess.call(
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=CREATE_NO_WINDOW
+        )
+        if returncode == 0:
+            return
+
+    elif own_process_group:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+
+    proc.kill()
+
+
+class _ProcessOutputReader(threading.Thread):
+    """Read output of process line by line.
+
+    Args:
+        stream (io.BufferedReader): Output stream of process.
+        callback (Callable[[str], None]): Called for each line.
+        max_lines (Optional[int]): Maximum number of last lines kept in
+            memory. All lines are kept if not set.
+    """
+
+    def __init__(self, stream, callback, max_lines=None):
+        super(_ProcessOutputReader, self).__init__()
+        self.daemon = True
+        self._stream = stream
+        self._callback = callback
+        self._lines = collections.deque(maxlen=max_lines)
+
+    @property
+    def output(self):
+        return "".join(self._lines)
+
+    def run(self):
+        while True:
+            line = self._stream.readline()
+            if not line:
+                break
+            if isinstance(line, six.binary_type):
+                line = line.decode("utf-8", errors="backslashreplace")
+            self._lines.append(line)
+            self._callback(line.rstrip("\r\n"))
+        self._stream.close()
+
+
 def run_subprocess(*args, **kwargs):
     """Convenience method for getting output errors for subprocess.
 
-    Output logged when process finish.
+    Output is logged line by line while process is running.
 
     Entered arguments and keyword arguments are passed to subprocess Popen.
 
@@ -90,7 +170,10 @@ def run_subprocess(*args, **kwargs):
         *args: Variable length argument list passed to Popen.
         **kwargs : Arbitrary keyword arguments passed to Popen. Is possible to
             pass `logging.Logger` object under "logger" to use custom logger
-            for output.
+            for output. Process is killed after "timeout" seconds or when
+            "cancel_event" (threading.Event) is set. Only last
+            "output_limit" lines of each output are kept if is passed.
+            Cancellable process is killed with all its child processes.
 
     Returns:
         str: Full output of subprocess concatenated stdout and stderr.
@@ -98,6 +181,8 @@ def run_subprocess(*args, **kwargs):
     Raises:
         RuntimeError: Exception is raised if process finished with nonzero
             return code.
+        ProcessTimeoutError: Process did not finish in timeout.
+        ProcessCancelledError: Process was cancelled.
     """
 
     # Modify creation flags on windows to hide console window if in UI mode
@@ -126,6 +211,23 @@ def run_subprocess(*args, **kwargs):
     if logger is None:
         logger = Logger.get_logger("run_subprocess")
 
+    timeout = kwargs.pop("timeout", None)
+    cancel_event = kwargs.pop("cancel_event", None)
+    output_limit = kwargs.pop("output_limit", None)
+
+    # Start cancellable process in new session on POSIX so its child
+    #   processes (e.g. of 'shell=True') can be killed as process group
+    own_process_group = False
+    if (
+        (timeout is not None or cancel_event is not None)
+        and six.PY3
+        and platform.system().lower() != "windows"
+        and "start_new_session" not in kwargs
+        and "preexec_fn" not in kwargs
+    ):
+        kwargs["start_new_session"] = True
+        own_process_group = True
+
     # set overrides
     kwargs["stdout"] = kwargs.get("stdout", subprocess.PIPE)
     kwargs["stderr"] = kwargs.get("stderr", subprocess.PIPE)
@@ -133,21 +235,71 @@ def run_subprocess(*args, **kwargs):
     kwargs["env"] = filtered_env
 
     proc = subprocess.Popen(*args, **kwargs)
+    # Nothing is sent to the process
+    if kwargs["stdin"] == subprocess.PIPE:
+        proc.stdin.close()
+
+    readers = []
+    stdout_reader = stderr_reader = None
+    if proc.stdout is not None:
+        stdout_reader = _ProcessOutputReader(
+            proc.stdout, logger.debug, output_limit
+        )
+        readers.append(stdout_reader)
+
+    if proc.stderr is not None:
+        stderr_reader = _ProcessOutputReader(
+            proc.stderr, logger.info, output_limit
+        )
+        readers.append(stderr_reader)
+
+    for reader in readers:
+        reader.start()
 
-    full_output = ""
-    _stdout, _stderr = proc.communicate()
-    if _stdout:
-        _stdout = _stdout.decode("utf-8", errors="backslashreplace")
-        full_output += _stdout
-        logger.debug(_stdout)
+    started = time.time()
+    error_cls = None
+    if timeout is None and cancel_event is None:
+        proc.wait()
 
+    while proc.poll() is None:
+        if cancel_event is not None and cancel_event.is_set():
+            error_cls = ProcessCancelledError
+        elif timeout is not None and (time.time() - started) > timeout:
+            error_cls = ProcessTimeoutError
+
+        if error_cls is None:
+            time.sleep(0.05)
+            continue
+
+        _kill_process_tree(proc, own_process_group)
+        proc.wait()
+        break
+
+    for reader in readers:
+        reader.join()
+
+    _stdout = _stderr = ""
+    if stdout_reader is not None:
+        _stdout = stdout_reader.output
+    if stderr_reader is not None:
+        _stderr = stderr_reader.output
+
+    full_output = _stdout
     if _stderr:
-        _stderr = _stderr.decode("utf-8", errors="backslashreplace")
         # Add additional line break if output already contains stdout
         if full_output:
             full_output += "\n"
         full_output += _stderr
-        logger.info(_stderr)
+
+    if error_cls is ProcessCancelledError:
+        raise ProcessCancelledError(
+            "Executing arguments was cancelled: \"{}\"".format(args)
+        )
+
+    if error_cls is ProcessTimeoutError:
+        raise ProcessTimeoutError((
+            "Executing arguments did not finish in {} seconds: \"{}\""
+        ).format(timeout, args))
 
     if proc.returncode != 0:
         exc_msg = "Executing arguments was not successful: \"{}\"".format(args)
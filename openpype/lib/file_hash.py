@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""Content based hashing of files with persistent cache.
+
+Digest of file content is computed by streaming the file in chunks. Fast
+non-cryptographic 'xxhash' is used when available, otherwise 'blake2b' or
+'md5' from 'hashlib'. Files bigger than sample size (if set) are hashed
+only from sampled chunks and their size.
+
+Computed digests are stored in SQLite database in user data directory
+keyed by path, size and modification time so hashing the same unchanged
+file again is free.
+"""
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+import appdirs
+
+CHUNK_SIZE = 1024 * 1024
+SAMPLES_COUNT = 8
+
+
+# Algorithms in order of preference
+ALGORITHMS = ("xxh64", "blake2b", "md5")
+
+
+def _create_hasher(algorithm):
+    """Hasher of algorithm or None if algorithm is not available."""
+    if algorithm == "xxh64":
+        try:
+            import xxhash
+
+            return xxhash.xxh64()
+        except ImportError:
+            return None
+
+    if algorithm == "blake2b":
+        if hasattr(hashlib, "blake2b"):
+            return hashlib.blake2b(digest_size=16)
+        return None
+
+    if algorithm == "md5":
+        return hashlib.md5()
+    return None
+
+
+def _get_hasher():
+    for algorithm in ALGORITHMS:
+        hasher = _create_hasher(algorithm)
+        if hasher is not None:
+            return algorithm, hasher
+
+
+def get_content_hash_sample_size():
+    """Size of file in bytes from which is content hash sampled.
+
+    Value is defined by 'OPENPYPE_CONTENT_HASH_SAMPLE_SIZE' environment
+    variable. Files are never sampled if value is not set or is 0.
+    """
+    try:
+        sample_size = int(
+            os.environ.get("OPENPYPE_CONTENT_HASH_SAMPLE_SIZE") or 0
+        )
+    except ValueError:
+        sample_size = 0
+    return max(sample_size, 0)
+
+
+def compute_file_content_hash(filepath, sample_size=None):
+    """Compute digest of file content.
+
+    Args:
+        filepath (str): Path to file.
+        sample_size (Optional[int]): Files bigger than the size are hashed
+            only from sampled chunks. Value from environment is used if not
+            passed.
+
+    Returns:
+        str: Digest with algorithm prefix e.g. 'xxh64:<hex>' or
+            'xxh64s:<hex>' if content was sampled.
+    """
+    if sample_size is None:
+        sample_size = get_content_hash_sample_size()
+
+    algorithm, hasher = _get_hasher()
+    file_size = os.path.getsize(filepath)
+    sampled = (
+        bool(sample_size)
+        and file_size > max(sample_size, CHUNK_SIZE * SAMPLES_COUNT)
+    )
+    return _compute_digest(filepath, file_size, algorithm, hasher, sampled)
+
+
+def _compute_digest(filepath, file_size, algorithm, hasher, sampled):
+    with open(filepath, "rb") as stream:
+        if not sampled:
+            while True:
+                chunk = stream.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+        else:
+            algorithm += "s"
+            hasher.update(str(file_size).encode("utf-8"))
+            step = (file_size - CHUNK_SIZE) // (SAMPLES_COUNT - 1)
+            for idx in range(SAMPLES_COUNT):
+                stream.seek(idx * step)
+                hasher.update(stream.read(CHUNK_SIZE))
+
+    return "{}:{}".format(algorithm, hasher.hexdigest())
+
+
+def parse_content_hash(digest):
+    """Algorithm and sampling used to compute digest.
+
+    Args:
+        digest (str): Digest from 'compute_file_content_hash'.
+
+    Returns:
+        tuple[str, bool]: Name of algorithm and if content was sampled.
+    """
+    algorithm = digest.split(":", 1)[0]
+    if algorithm not in ALGORITHMS and algorithm[:-1] in ALGORITHMS:
+        return algorithm[:-1], True
+    return algorithm, False
+
+
+def compute_matching_content_hash(filepath, digest):
+    """Compute digest of file in the same way as passed digest was.
+
+    Digest can be created on other machine with different available
+    algorithm or sample size.
+
+    Args:
+        filepath (str): Path to file.
+        digest (str): Digest from 'compute_file_content_hash'.
+
+    Returns:
+        Union[str, None]: Digest of file or None if algorithm of passed
+            digest is not available.
+    """
+    algorithm, sampled = parse_content_hash(digest)
+    hasher = _create_hasher(algorithm)
+    if hasher is None:
+        return None
+
+    file_size = os.path.getsize(filepath)
+    # Sampled digest can't be created for small files
+    if sampled and file_size <= CHUNK_SIZE * SAMPLES_COUNT:
+        return None
+
+    return _compute_digest(filepath, file_size, algorithm, hasher, sampled)
+
+
+class FileHashCache(object):
+    """Persistent cache of file content digests.
+
+    Digest is reused only when size and modification time of file did not
+    change. Cache can be used from multiple threads.
+
+    Args:
+        db_path (Optional[str]): Path to SQLite database file. Database in
+            user data directory is used if not passed.
+    """
+
+    def __init__(self, db_path=None):
+        if db_path is None:
+            db_path = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "file_hash_cache.db"
+            )
+        self._db_path = db_path
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @property
+    def db_path(self):
+        return self._db_path
+
+    def _get_connection(self):
+        if self._connection is None:
+            db_dir = os.path.dirname(self._db_path)
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir)
+            connection = sqlite3.connect(
+                self._db_path, timeout=30, check_same_thread=False
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS file_hashes ("
+                " path TEXT NOT NULL,"
+                " sample_size INTEGER NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime REAL NOT NULL,"
+                " digest TEXT NOT NULL,"
+                " updated REAL NOT NULL,"
+                " PRIMARY KEY (path, sample_size)"
+                ")"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get_hash(self, filepath, sample_size=None):
+        """Content digest of file.
+
+        Args:
+            filepath (str): Path to file.
+            sample_size (Optional[int]): Files bigger than the size are
+                hashed only from sampled chunks.
+
+        Returns:
+            str: Digest of file content.
+        """
+        if sample_size is None:
+            sample_size = get_content_hash_sample_size()
+
+        filepath = os.path.normpath(os.path.abspath(filepath))
+        stat = os.stat(filepath)
+        with self._lock:
+            row = self._get_connection().execute(
+                "SELECT size, mtime, digest FROM file_hashes"
+                " WHERE path = ? AND sample_size = ?",
+                (filepath, sample_size)
+            ).fetchone()
+
+        if row and row[0] == stat.st_size and row[1] == stat.st_mtime:
+            return row[2]
+
+        digest = compute_file_content_hash(filepath, sample_size)
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO file_hashes"
+                " (path, sample_size, size, mtime, digest, updated)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    filepath,
+                    sample_size,
+                    stat.st_size,
+                    stat.st_mtime,
+                    digest,
+                    time.time()
+                )
+            )
+            connection.commit()
+        return digest
+
+    def remove_missing(self):
+        """Remove records of files which do not exist anymore.
+
+        Returns:
+            int: Number of removed records.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            paths = [
+                row[0]
+                for row in connection.execute(
+                    "SELECT DISTINCT path FROM file_hashes"
+                )
+            ]
+            missing = [
+                (path, )
+                for path in paths
+                if not os.path.exists(path)
+            ]
+            connection.executemany(
+                "DELETE FROM file_hashes WHERE path = ?", missing
+            )
+            connection.commit()
+        return len(missing)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class _FileHashCacheState:
+    lock = threading.Lock()
+    cache = None
+
+
+def get_file_hash_cache():
+    """Shared persistent cache of file content digests.
+
+    Returns:
+        FileHashCache: Cache in user data directory.
+    """
+    if _FileHashCacheState.cache is None:
+        with _FileHashCacheState.lock:
+            if _FileHashCacheState.cache is None:
+                _FileHashCacheState.cache = FileHashCache()
+    return _FileHashCacheState.cache
+
+
+def get_file_content_hash(filepath, sample_size=None, use_cache=True):
+    """Content digest of file using shared persistent cache.
+
+    Digest is computed without cache when cache database can't be used.
+
+    Args:
+        filepath (str): Path to file.
+        sample_size (Optional[int]): Files bigger than the size are hashed
+            only from sampled chunks.
+        use_cache (Optional[bool]): Use persistent cache.
+
+    Returns:
+        str: Digest of file content.
+    """
+    if use_cache:
+        try:
+            return get_file_hash_cache().get_hash(filepath, sample_size)
+        except sqlite3.Error:
+            pass
+    return compute_file_content_hash(filepath, sample_size)
@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+"""Index of file sequences in list of filenames.
+
+Each filename is parsed only once with single precompiled pattern and frames
+of each sequence are stored in compact sorted array. Sequences are
+identified by head, tail and padding the same way as 'clique.assemble'
+does, each group of digits in filename is a possible frame.
+
+Missing frames and frame ranges are calculated from the sorted frames
+without creating sets of all frames or formatting all filenames.
+
+Example:
+    ```
+    index = SequenceIndex.from_directory(staging_dir)
+    for sequence in index.sequences:
+        missing_frames = sequence.get_missing_frames(1001, 1100)
+    ```
+"""
+import os
+import re
+import array
+import bisect
+import collections
+
+import clique
+
+# Same groups of digits as 'clique.DIGITS_PATTERN' matches
+DIGITS_REGEX = re.compile(r"\d+")
+
+
+def parse_frame_filename(filename):
+    """Split filename to head, frame, tail and padding.
+
+    Each group of digits in filename is a possible frame, same as in
+    'clique.assemble'.
+
+    Args:
+        filename (str): Filename or path.
+
+    Returns:
+        list[tuple[str, int, str, int]]: Head, frame, tail and padding
+            for each group of digits in filename.
+    """
+    output = []
+    for match in DIGITS_REGEX.finditer(filename):
+        frame_str = match.group(0)
+        padding = 0
+        if len(frame_str) > 1 and frame_str[0] == "0":
+            padding = len(frame_str)
+        output.append((
+            filename[:match.start()],
+            int(frame_str),
+            filename[match.end():],
+            padding
+        ))
+    return output
+
+
+class FileSequence(object):
+    """Sequence of files with frames.
+
+    Iteration yields filenames of all frames like 'clique.Collection'.
+
+    Args:
+        head (str): Part of filename before frame.
+        tail (str): Part of filename after frame.
+        padding (int): Padding of frame, 0 if frame is not padded.
+        frames (Iterable[int]): Frames of sequence.
+    """
+
+    def __init__(self, head, tail, padding, frames):
+        self.head = head
+        self.tail = tail
+        self.padding = padding
+        self._frames = array.array("l", sorted(set(frames)))
+        padding_format = "%d"
+        if padding:
+            padding_format = "%0{}d".format(padding)
+        self._format = "{}{}{}".format(
+            head.replace("%", "%%"), padding_format, tail.replace("%", "%%")
+        )
+
+    def __repr__(self):
+        return "<{} \"{}\" [{}]>".format(
+            self.__class__.__name__,
+            self.format_template,
+            self.format_ranges()
+        )
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __iter__(self):
+        for frame in self._frames:
+            yield self._format % frame
+
+    def __contains__(self, frame):
+        idx = bisect.bisect_left(self._frames, frame)
+        return idx < len(self._frames) and self._frames[idx] == frame
+
+    @property
+    def frames(self):
+        """Sorted frames of sequence.
+
+        Returns:
+            array.array: Frames.
+        """
+
+        return self._frames
+
+    @property
+    def frame_start(self):
+        return self._frames[0]
+
+    @property
+    def frame_end(self):
+        return self._frames[-1]
+
+    @property
+    def format_template(self):
+        """Template of filename for '%' formatting with frame.
+
+        Same as '{head}{padding}{tail}' format of 'clique.Collection'.
+        """
+
+        return self._format
+
+    def get_filename(self, frame):
+        return self._format % frame
+
+    def get_ranges(self):
+        """Ranges of consecutive frames.
+
+        Returns:
+            list[tuple[int, int]]: First and last frame of each range.
+        """
+
+        ranges = []
+        frames = self._frames
+        if not frames:
+            return ranges
+
+        start = prev = frames[0]
+        for frame in frames[1:]:
+            if frame != prev + 1:
+                ranges.append((start, prev))
+                start = frame
+            prev = frame
+        ranges.append((start, prev))
+        return ranges
+
+    def format_ranges(self):
+        """Frames as compact ranges e.g. '1001-1010, 1015, 1020-1030'."""
+
+        return ", ".join(
+            "{}-{}".format(start, end) if start != end else str(start)
+            for start, end in self.get_ranges()
+        )
+
+    def get_missing_frames(self, frame_start=None, frame_end=None):
+        """Frames missing in range.
+
+        Args:
+            frame_start (Optional[int]): First expected frame. First frame
+                of sequence is used if not passed.
+            frame_end (Optional[int]): Last expected frame. Last frame of
+                sequence is used if not passed.
+
+        Returns:
+            list[int]: Missing frames.
+        """
+
+        if frame_start is None:
+            frame_start = self.frame_start
+        if frame_end is None:
+            frame_end = self.frame_end
+
+        frames = self._frames
+        idx = bisect.bisect_left(frames, frame_start)
+        end_idx = bisect.bisect_right(frames, frame_end)
+        missing = []
+        expected = frame_start
+        # Only gaps between existing frames are iterated
+        while idx < end_idx:
+            frame = frames[idx]
+            if frame != expected:
+                missing.extend(range(expected, frame))
+            expected = frame + 1
+            idx += 1
+        missing.extend(range(expected, frame_end + 1))
+        return missing
+
+    def get_previous_frame(self, frame):
+        """Nearest existing frame lower or equal to the frame.
+
+        First frame of sequence is returned for frames before sequence.
+        """
+
+        idx = bisect.bisect_right(self._frames, frame)
+        if idx == 0:
+            return self._frames[0]
+        return self._frames[idx - 1]
+
+    def to_collection(self):
+        """Convert to clique collection.
+
+        Returns:
+            clique.Collection: Collection with the same frames.
+        """
+
+        return clique.Collection(
+            self.head, self.tail, self.padding, indexes=set(self._frames)
+        )
+
+
+class SequenceIndex(object):
+    """Sequences and remainders of filenames.
+
+    Result is the same as of 'clique.assemble'. Filename with more groups
+    of digits can be part of more sequences. Unpadded frames with the same
+    number of digits as padding of padded sequence with the same head and
+    tail are merged into the padded sequence (e.g. '0999' and '1000' are
+    in one sequence).
+
+    Args:
+        filenames (Iterable[str]): Filenames or paths.
+        minimum_items (Optional[int]): Minimum number of frames of sequence.
+            Filenames of smaller sequences are in remainders.
+    """
+
+    def __init__(self, filenames, minimum_items=2):
+        # Keys are in order of first appearance like in 'clique.assemble'
+        frames_by_key = collections.OrderedDict()
+        remainders = []
+        for filename in filenames:
+            parsed = parse_frame_filename(filename)
+            if not parsed:
+                remainders.append(filename)
+                continue
+            for head, frame, tail, padding in parsed:
+                key = (head, tail, padding)
+                frames = frames_by_key.get(key)
+                if frames is None:
+                    frames = frames_by_key[key] = set()
+                frames.add(frame)
+
+        # Merge unpadded frames to padded sequences. Unpadded sequence is
+        #   kept with all its frames if is not fully merged.
+        fully_merged_keys = set()
+        for key, frames in frames_by_key.items():
+            head, tail, padding = key
+            if padding == 0:
+                continue
+            unpadded_key = (head, tail, 0)
+            unpadded_frames = frames_by_key.get(unpadded_key)
+            if not unpadded_frames:
+                continue
+
+            merged_count = 0
+            for frame in unpadded_frames:
+                if len(str(frame)) == padding:
+                    frames.add(frame)
+                    merged_count += 1
+            if merged_count == len(unpadded_frames):
+                fully_merged_keys.add(unpadded_key)
+
+        sequences_by_key = collections.OrderedDict()
+        remainder_candidates = []
+        for key, frames in frames_by_key.items():
+            if key in fully_merged_keys:
+                continue
+            sequence = FileSequence(*key, frames=frames)
+            if len(sequence) >= minimum_items:
+                sequences_by_key[key] = sequence
+            else:
+                remainder_candidates.extend(sequence)
+
+        # Filenames of too small sequences are remainders only if are not
+        #   part of other sequence
+        remainders_set = set(remainders)
+        for filename in remainder_candidates:
+            if filename in remainders_set:
+                continue
+            if self._find_sequence(sequences_by_key, filename) is None:
+                remainders_set.add(filename)
+                remainders.append(filename)
+
+        self._sequences_by_key = sequences_by_key
+        self._sequences = list(sequences_by_key.values())
+        self._remainders = remainders
+
+    @classmethod
+    def from_directory(cls, dirpath, minimum_items=2, full_paths=False):
+        """Index files in directory with single listing.
+
+        Args:
+            dirpath (str): Path to directory.
+            minimum_items (Optional[int]): Minimum number of frames of
+                sequence.
+            full_paths (Optional[bool]): Index full paths instead of
+                filenames.
+
+        Returns:
+            SequenceIndex: Index of files in directory.
+        """
+
+        filenames = [
+            entry.name
+            for entry in os.scandir(dirpath)
+            if entry.is_file()
+        ]
+        if full_paths:
+            filenames = [
+                os.path.join(dirpath, filename)
+                for filename in filenames
+            ]
+        return cls(filenames, minimum_items)
+
+    @property
+    def sequences(self):
+        """Sequences in order of first appearance of their filenames.
+
+        Returns:
+            list[FileSequence]: Sequences.
+        """
+
+        return list(self._sequences)
+
+    @property
+    def remainders(self):
+        """Filenames which are not part of any sequence.
+
+        Returns:
+            list[str]: Filenames.
+        """
+
+        return list(self._remainders)
+
+    def get_sequence(self, head, tail, padding=0):
+        return self._sequences_by_key.get((head, tail, padding))
+
+    def get_sequence_for_filename(self, filename):
+        """Sequence which contains the filename.
+
+        Args:
+            filename (str): Filename or path in format of indexed files.
+
+        Returns:
+            Union[FileSequence, None]: Sequence or None if filename is not
+                part of any sequence.
+        """
+
+        return self._find_sequence(self._sequences_by_key, filename)
+
+    @staticmethod
+    def _find_sequence(sequences_by_key, filename):
+        for head, frame, tail, padding in parse_frame_filename(filename):
+            paddings = [padding]
+            if padding == 0:
+                # Unpadded frame could be merged to padded sequence
+                paddings.append(len(str(frame)))
+
+            for padding in paddings:
+                sequence = sequences_by_key.get((head, tail, padding))
+                if sequence is not None and frame in sequence:
+                    return sequence
+        return None
+
+
+def format_file_sequences(filenames):
+    """Compact description of filenames for reports.
+
+    Sequences are described by template and frame ranges.
+
+    Example:
+        ```
+        format_file_sequences(["beauty.1001.exr", "beauty.1002.exr"])
+        # ['beauty.%04d.exr [1001-1002]']
+        ```
+
+    Args:
+        filenames (Iterable[str]): Filenames or paths.
+
+    Returns:
+        list[str]: Sequences and remainders.
+    """
+
+    index = SequenceIndex(filenames)
+    output = [
+        "{} [{}]".format(sequence.format_template, sequence.format_ranges())
+        for sequence in index.sequences
+    ]
+    output.extend(sorted(index.remainders))
+    return output
+
+
+class FileExistenceIndex(object):
+    """Existence of files checked by listing of their directories.
+
+    Each directory is listed only once with 'os.scandir' instead of checking
+    each file separately, which is slow for many files on network storage.
+    Listing is cached until 'reset' is called, so index should be used only
+    for directories which are not changed during its lifetime. Paths are
+    compared using 'os.path.normcase', so on case insensitive platforms
+    existence does not depend on case of path.
+    """
+
+    def __init__(self):
+        self._filenames_by_dir = {}
+
+    def reset(self, dirpath=None):
+        """Reset cached listing of directory or of all directories."""
+
+        if dirpath is None:
+            self._filenames_by_dir = {}
+        else:
+            self._filenames_by_dir.pop(self._get_dir_key(dirpath), None)
+
+    @staticmethod
+    def _get_dir_key(dirpath):
+        return os.path.normcase(os.path.normpath(dirpath))
+
+    def list_dir(self, dirpath):
+        """Names of items in directory.
+
+        Args:
+            dirpath (str): Path to directory.
+
+        Returns:
+            set[str]: Names of items normalized with 'os.path.normcase'.
+                Empty if directory does not exist.
+        """
+
+        dir_key = self._get_dir_key(dirpath)
+        filenames = self._filenames_by_dir.get(dir_key)
+        if filenames is None:
+            filenames = set()
+            if os.path.isdir(dirpath):
+                filenames = {
+                    os.path.normcase(entry.name)
+                    for entry in os.scandir(dirpath)
+                }
+            self._filenames_by_dir[dir_key] = filenames
+        return filenames
+
+    def exists(self, path):
+        dirpath, filename = os.path.split(path)
+        return os.path.normcase(filename) in self.list_dir(dirpath)
+
+    def get_missing(self, paths):
+        """Paths which do not exist.
+
+        Args:
+            paths (Iterable[str]): Paths to files.
+
+        Returns:
+            list[str]: Missing paths in the same order.
+        """
+
+        return [
+            path
+            for path in paths
+            if not self.exists(path)
+        ]
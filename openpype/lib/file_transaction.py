@@ -2,7 +2,9 @@ import os
 import logging
 import sys
 import errno
+import threading
 import six
+from six.moves import queue
 
 from openpype.lib import create_hard_link
 
@@ -49,16 +51,26 @@ class FileTransaction(object):
 
     Warning:
         Any folders created during the transfer will not be removed.
+
+    Args:
+        log (Optional[logging.Logger]): Logger.
+        allow_queue_replacements (Optional[bool]): Allow to replace queued
+            transfer to the same destination.
+        max_workers (Optional[int]): Number of files transferred at once
+            during `process()`. Files are transferred one by one by default.
     """
 
     MODE_COPY = 0
     MODE_HARDLINK = 1
 
-    def __init__(self, log=None, allow_queue_replacements=False):
+    def __init__(
+        self, log=None, allow_queue_replacements=False, max_workers=None
+    ):
         if log is None:
             log = logging.getLogger("FileTransaction")
 
         self.log = log
+        self._max_workers = max(max_workers or 1, 1)
 
         # The transfer queue
         # todo: make this an actual FIFO queue?
@@ -109,7 +121,15 @@ class FileTransaction(object):
 
         self._transfers[dst] = (src, opts)
 
-    def process(self):
+    def process(self, progress_callback=None):
+        """Backup existing files and transfer files.
+
+        Args:
+            progress_callback (Optional[Callable[[str, int], None]]): Called
+                with destination path and size of file after each transfer.
+                Callback may be called from multiple threads.
+        """
+
         # Backup any existing files
         for dst, (src, _) in self._transfers.items():
             self.log.debug("Checking file ... {} -> {}".format(src, dst))
@@ -126,25 +146,64 @@ class FileTransaction(object):
             os.rename(dst, backup)
 
         # Copy the files to transfer
-        for dst, (src, opts) in self._transfers.items():
-            path_same = self._same_paths(src, dst)
-            if path_same:
-                self.log.debug(
-                    "Source and destination are same files {} -> {}".format(
-                        src, dst))
-                continue
+        transfers = list(self._transfers.items())
+        if self._max_workers == 1 or len(transfers) < 2:
+            for dst, (src, opts) in transfers:
+                self._transfer_file(src, dst, opts, progress_callback)
+            return
+
+        transfers_queue = queue.Queue()
+        for transfer in transfers:
+            transfers_queue.put(transfer)
+
+        errors = []
+
+        def _worker():
+            while not errors:
+                try:
+                    dst, (src, opts) = transfers_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    self._transfer_file(src, dst, opts, progress_callback)
+                except Exception:
+                    errors.append(sys.exc_info())
+
+        threads = []
+        for _ in range(min(self._max_workers, len(transfers))):
+            thread = threading.Thread(target=_worker)
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
 
-            self._create_folder_for_file(dst)
+        if errors:
+            six.reraise(*errors[0])
 
-            if opts["mode"] == self.MODE_COPY:
-                self.log.debug("Copying file ... {} -> {}".format(src, dst))
-                copyfile(src, dst)
-            elif opts["mode"] == self.MODE_HARDLINK:
-                self.log.debug("Hardlinking file ... {} -> {}".format(
+    def _transfer_file(self, src, dst, opts, progress_callback=None):
+        path_same = self._same_paths(src, dst)
+        if path_same:
+            self.log.debug(
+                "Source and destination are same files {} -> {}".format(
                     src, dst))
-                create_hard_link(src, dst)
-
-            self._transferred.append(dst)
+            return
+
+        self._create_folder_for_file(dst)
+
+        if opts["mode"] == self.MODE_COPY:
+            self.log.debug("Copying file ... {} -> {}".format(src, dst))
+            copyfile(src, dst)
+        elif opts["mode"] == self.MODE_HARDLINK:
+            self.log.debug("Hardlinking file ... {} -> {}".format(
+                src, dst))
+            create_hard_link(src, dst)
+
+        # List append is atomic so transferred files can be rolled back
+        self._transferred.append(dst)
+        if progress_callback is not None:
+            progress_callback(dst, os.path.getsize(dst))
 
     def finalize(self):
         # Delete any backed up files
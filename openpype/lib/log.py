@@ -23,6 +23,9 @@ import time
 import traceback
 import threading
 import copy
+import queue
+import atexit
+import tempfile
 
 from openpype.client.mongo import (
     MongoEnvNotSet,
@@ -181,6 +184,284 @@ class MongoFormatter(logging.Formatter):
         return document
 
 
+def _is_process_running(pid):
+    """Process with the pid is running.
+
+    Returns:
+        Union[bool, None]: None if it can't be checked.
+    """
+    try:
+        import psutil
+        return psutil.pid_exists(pid)
+    except ImportError:
+        pass
+
+    # 'os.kill' would terminate the process on windows
+    if platform.system().lower() == "windows":
+        return None
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+class MongoQueueHandler(logging.Handler):
+    """Handler storing records to mongo in batches on background thread.
+
+    Records are formatted on caller's thread and added to bounded queue.
+    Worker thread stores them using 'insert_many'. When queue is full are
+    new records dropped. When mongo is not reachable are batches spilled to
+    disk (if spill directory is set) and inserted once mongo is available
+    again, otherwise are dropped. Spilled batches of processes which are
+    not running anymore are inserted by any other process using the same
+    spill directory.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection for records.
+        max_queue_size (int): Maximum number of records waiting in queue.
+        batch_size (int): Maximum number of records inserted at once.
+        flush_interval (float): Maximum time in seconds record waits in
+            queue before is inserted.
+        spill_dir (Optional[str]): Directory where batches are stored when
+            mongo is not reachable.
+        max_spill_size (int): Maximum size of spilled data in bytes.
+    """
+
+    # Spilled batches of other process are inserted after this time
+    #   (in seconds) when it can't be checked if the process is running
+    spill_claim_age = 60 * 60
+
+    def __init__(
+        self,
+        collection,
+        max_queue_size=10000,
+        batch_size=500,
+        flush_interval=1.0,
+        spill_dir=None,
+        max_spill_size=100 * 1024 * 1024,
+        level=logging.NOTSET
+    ):
+        super(MongoQueueHandler, self).__init__(level)
+        self.collection = collection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_dir = spill_dir
+        self.max_spill_size = max_spill_size
+        self.dropped_count = 0
+
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._flush_requested = threading.Event()
+        self._flushed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="MongoQueueHandler"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def emit(self, record):
+        try:
+            document = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            self._queue.put_nowait(document)
+        except queue.Full:
+            self.dropped_count += 1
+
+    def flush(self, timeout=5.0):
+        """Wait until records which are in queue are stored."""
+        if not self._thread.is_alive():
+            return
+        self._flushed.clear()
+        self._flush_requested.set()
+        self._flushed.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Store remaining records and stop worker thread."""
+        if self._thread.is_alive():
+            self._stop_event.set()
+            self._thread.join(timeout)
+        super(MongoQueueHandler, self).close()
+
+    def _get_batch(self):
+        documents = []
+        deadline = time.time() + self.flush_interval
+        while len(documents) < self.batch_size:
+            if self._stop_event.is_set() or self._flush_requested.is_set():
+                timeout = 0
+            else:
+                timeout = deadline - time.time()
+
+            try:
+                if timeout <= 0:
+                    documents.append(self._queue.get_nowait())
+                else:
+                    documents.append(self._queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return documents
+
+    def _run(self):
+        while True:
+            documents = self._get_batch()
+            if documents:
+                self._store(documents)
+                continue
+
+            if self._flush_requested.is_set():
+                self._flush_requested.clear()
+                self._flushed.set()
+
+            if self._stop_event.is_set():
+                break
+
+            self._insert_spilled()
+
+        self._flushed.set()
+
+    def _insert(self, documents):
+        """Insert documents to collection.
+
+        Documents get '_id' before insert, so documents of partially
+        successful insert are spilled with ids. Duplicate key errors on
+        their insert mean that the documents are already stored.
+        """
+        from pymongo.errors import BulkWriteError
+
+        try:
+            self.collection.insert_many(documents, ordered=False)
+        except BulkWriteError as exc:
+            details = exc.details or {}
+            if details.get("writeConcernErrors"):
+                return False
+            return all(
+                error.get("code") == 11000
+                for error in details.get("writeErrors") or []
+            )
+        except Exception:
+            return False
+        return True
+
+    def _store(self, documents):
+        if self._insert(documents):
+            return
+        if not self._spill(documents):
+            self.dropped_count += len(documents)
+
+    def _get_spill_size(self):
+        size = 0
+        for filename in os.listdir(self.spill_dir):
+            size += os.path.getsize(os.path.join(self.spill_dir, filename))
+        return size
+
+    def _spill(self, documents):
+        """Store documents which failed to be inserted to disk."""
+        if not self.spill_dir:
+            return False
+
+        from bson import json_util
+
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            if self._get_spill_size() > self.max_spill_size:
+                return False
+
+            filepath = os.path.join(
+                self.spill_dir,
+                "{}_{}.jsonl".format(os.getpid(), time.time())
+            )
+            with open(filepath, "w") as stream:
+                for document in documents:
+                    stream.write(json_util.dumps(document) + "\n")
+        except Exception:
+            return False
+        return True
+
+    def _claim_spill_file(self, filename):
+        """Take over spill file of other process which is not running.
+
+        File is renamed with prefix of current process, so it is inserted
+        only by one process.
+
+        Returns:
+            Union[str, None]: Path to claimed file or None.
+        """
+        pid, _, _ = filename.partition("_")
+        if not pid.isdigit():
+            return None
+
+        filepath = os.path.join(self.spill_dir, filename)
+        is_running = _is_process_running(int(pid))
+        if is_running is None:
+            try:
+                mtime = os.path.getmtime(filepath)
+            except OSError:
+                return None
+            is_running = (time.time() - mtime) < self.spill_claim_age
+
+        if is_running:
+            return None
+
+        claimed_path = os.path.join(
+            self.spill_dir, "{}_{}".format(os.getpid(), filename)
+        )
+        try:
+            os.rename(filepath, claimed_path)
+        except OSError:
+            # Other process claimed the file
+            return None
+        return claimed_path
+
+    def _insert_spilled(self):
+        """Insert spilled documents when mongo is back.
+
+        Documents spilled by this process and by processes which are not
+        running anymore are inserted.
+        """
+        if not self.spill_dir or not os.path.exists(self.spill_dir):
+            return
+
+        from bson import json_util
+
+        prefix = "{}_".format(os.getpid())
+        for filename in sorted(os.listdir(self.spill_dir)):
+            if not filename.endswith(".jsonl"):
+                continue
+
+            if filename.startswith(prefix):
+                filepath = os.path.join(self.spill_dir, filename)
+            else:
+                filepath = self._claim_spill_file(filename)
+                if filepath is None:
+                    continue
+
+            try:
+                with open(filepath, "r") as stream:
+                    documents = [
+                        json_util.loads(line)
+                        for line in stream
+                        if line.strip()
+                    ]
+            except Exception:
+                # Unreadable file would only take space of spilled data
+                documents = []
+
+            if documents and not self._insert(documents):
+                return
+
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+
+
 class Logger:
     DFT = '%(levelname)s >>> { %(name)s }: [ %(message)s ] '
     DBG = "  - { %(name)s }: [ %(message)s ] "
@@ -221,6 +502,8 @@ class Logger:
 
     # Data same for all record documents
     process_data = None
+    # Mongo handler shared by all loggers
+    _mongo_handler = None
     # Cached process name or ability to set different process name
     _process_name = None
 
@@ -237,7 +520,7 @@ class Logger:
         add_console_handler = True
 
         for handler in logger.handlers:
-            if isinstance(handler, MongoHandler):
+            if isinstance(handler, (MongoHandler, MongoQueueHandler)):
                 add_mongo_handler = False
             elif isinstance(handler, LogStreamHandler):
                 add_console_handler = False
@@ -279,27 +562,43 @@ class Logger:
 
     @classmethod
     def _get_mongo_handler(cls):
+        """Mongo handler shared by all loggers of the process.
+
+        Records are stored in batches on background thread. Behavior can be
+        modified with environment variables:
+            OPENPYPE_LOG_MONGO_QUEUE_SIZE - Maximum number of records
+                waiting to be stored (records over the limit are dropped).
+            OPENPYPE_LOG_MONGO_SPILL - Set to "1" to store records to disk
+                when mongo is not reachable and insert them later.
+        """
         cls.bootstrap_mongo_log()
 
         if not cls.use_mongo_logging:
             return
 
-        components = get_default_components()
-        kwargs = {
-            "host": components["host"],
-            "database_name": cls.log_database_name,
-            "collection": cls.log_collection_name,
-            "username": components["username"],
-            "password": components["password"],
-            "capped": True,
-            "formatter": MongoFormatter()
-        }
-        if components["port"] is not None:
-            kwargs["port"] = int(components["port"])
-        if components["auth_db"]:
-            kwargs["authentication_db"] = components["auth_db"]
+        if cls._mongo_handler is not None:
+            return cls._mongo_handler
+
+        client = cls.get_log_mongo_connection()
+        collection = client[cls.log_database_name][cls.log_collection_name]
+
+        spill_dir = None
+        if os.environ.get("OPENPYPE_LOG_MONGO_SPILL") == "1":
+            spill_dir = os.path.join(
+                tempfile.gettempdir(), "openpype_log_spill"
+            )
 
-        return MongoHandler(**kwargs)
+        handler = MongoQueueHandler(
+            collection,
+            max_queue_size=int(
+                os.environ.get("OPENPYPE_LOG_MONGO_QUEUE_SIZE") or 10000
+            ),
+            spill_dir=spill_dir
+        )
+        handler.setFormatter(MongoFormatter())
+        atexit.register(handler.close)
+        cls._mongo_handler = handler
+        return handler
 
     @classmethod
     def _get_console_handler(cls):
@@ -1,5 +1,6 @@
 import os
 import re
+import sys
 import logging
 import platform
 import functools
@@ -112,6 +113,41 @@ def create_hard_link(src_path, dst_path):
     )
 
 
+# Linux ioctl request to create copy-on-write clone of file
+FICLONE = 0x40049409
+
+
+def create_file_clone(src_path, dst_path):
+    """Create copy-on-write clone (reflink) of file if filesystem supports it.
+
+    Clone is created only on Linux filesystems supporting 'FICLONE'
+    (e.g. Btrfs, XFS). Caller should copy the file if clone was not created.
+
+    Args:
+        src_path (str): Full path to a file which is cloned.
+        dst_path (str): Full path where clone of the file is created.
+
+    Returns:
+        bool: File was cloned.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    import fcntl
+
+    try:
+        with open(src_path, "rb") as src_stream:
+            with open(dst_path, "wb") as dst_stream:
+                fcntl.ioctl(
+                    dst_stream.fileno(), FICLONE, src_stream.fileno()
+                )
+    except (IOError, OSError):
+        if os.path.exists(dst_path):
+            os.remove(dst_path)
+        return False
+    return True
+
+
 def collect_frames(files):
     """Returns dict of source path and its frame, if from sequence
 
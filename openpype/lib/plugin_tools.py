@@ -11,6 +11,8 @@ from openpype.client import get_asset_by_id
 
 log = logging.getLogger(__name__)
 
+CONTENT_HASH_PREFIX = "content"
+
 
 class PluginToolsDeprecatedWarning(DeprecationWarning):
     pass
@@ -213,8 +215,85 @@ def source_hash(filepath, *args):
     You can specify additional arguments in the function
     to allow for specific 'processing' values to be included.
     """
+    if is_source_content_hash_enabled():
+        return source_content_hash(filepath, *args)
+
     # We replace dots with comma because . cannot be a key in a pymongo dict.
     file_name = os.path.basename(filepath)
     time = str(os.path.getmtime(filepath))
     size = str(os.path.getsize(filepath))
     return "|".join([file_name, time, size] + list(args)).replace(".", ",")
+
+
+def is_source_content_hash_enabled():
+    """Source hash is based on content of file instead of its modification.
+
+    Enabled by 'OPENPYPE_SOURCE_CONTENT_HASH' environment variable set to
+    '1'. Content based hash identifies also copied or synchronized files
+    with new modification time.
+    """
+    return os.environ.get("OPENPYPE_SOURCE_CONTENT_HASH") == "1"
+
+
+def source_content_hash(filepath, *args):
+    """Generate identifier for a source file based on its content.
+
+    Digest of file content is cached per path, size and modification time
+    so repeated hashing of unchanged file does not read the file again.
+
+    Args:
+        filepath (str): The source file path.
+    You can specify additional arguments in the function
+    to allow for specific 'processing' values to be included.
+    """
+    from .file_hash import get_file_content_hash
+
+    digest = get_file_content_hash(filepath)
+    size = str(os.path.getsize(filepath))
+    return "|".join(
+        [CONTENT_HASH_PREFIX, digest, size] + list(args)
+    ).replace(".", ",")
+
+
+def is_source_content_hash(value):
+    """Source hash was created by 'source_content_hash'."""
+    return value.startswith(CONTENT_HASH_PREFIX + "|")
+
+
+def validate_source_content_hash(filepath, value):
+    """Validate that file content matches content based source hash.
+
+    Source hash created from file modification is not validated.
+
+    Args:
+        filepath (str): Path to file.
+        value (str): Source hash of file.
+
+    Digest is computed with the same algorithm and sampling as digest in
+    source hash, which could be created on machine with different setup.
+    Validation is skipped if the algorithm is not available.
+
+    Returns:
+        bool: False if file does not match content of source hash.
+    """
+    if not value or not is_source_content_hash(value):
+        return True
+
+    from .file_hash import (
+        get_file_content_hash,
+        compute_matching_content_hash,
+    )
+
+    parts = value.split("|")
+    size = str(os.path.getsize(filepath))
+    if parts[2] != size:
+        return False
+
+    source_digest = parts[1]
+    # Cached digest can be used if was computed the same way
+    digest = get_file_content_hash(filepath).replace(".", ",")
+    if digest.split(":", 1)[0] != source_digest.split(":", 1)[0]:
+        digest = compute_matching_content_hash(filepath, source_digest)
+        if digest is None:
+            return True
+    return digest == source_digest
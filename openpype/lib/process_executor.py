@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""Concurrent execution of subprocesses with futures.
+
+Executor runs subprocesses using 'run_subprocess' in pool of worker
+threads, so independent tool invocations (oiiotool, ffmpeg, maketx...) can
+overlap. Number of concurrently running processes is limited by number of
+CPUs and, if 'psutil' is available, by available memory.
+
+Example:
+    ```
+    executor = SubprocessExecutor(logger=self.log)
+    futures = [
+        executor.submit(args)
+        for args in all_args
+    ]
+    outputs = wait_for_futures(futures)
+    executor.shutdown()
+    ```
+"""
+import os
+import sys
+import time
+import threading
+import multiprocessing
+
+import six
+from six.moves import queue
+
+from .log import Logger
+from .execute import run_subprocess, ProcessCancelledError
+
+
+def get_subprocess_max_workers():
+    """Maximum number of concurrently running subprocesses.
+
+    Value is defined by 'OPENPYPE_SUBPROCESS_MAX_WORKERS' environment
+    variable. Number of CPUs is used if is not set.
+    """
+    try:
+        max_workers = int(
+            os.environ.get("OPENPYPE_SUBPROCESS_MAX_WORKERS") or 0
+        )
+    except ValueError:
+        max_workers = 0
+
+    if max_workers < 1:
+        max_workers = multiprocessing.cpu_count()
+    return max_workers
+
+
+def _get_available_memory():
+    try:
+        import psutil
+
+    except ImportError:
+        return None
+    return psutil.virtual_memory().available
+
+
+class SubprocessFuture(object):
+    """Result of subprocess submitted to executor.
+
+    Args:
+        args (tuple): Arguments for 'run_subprocess'.
+        kwargs (dict): Keyword arguments for 'run_subprocess'.
+    """
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        self.cancel_event = threading.Event()
+        self.started = None
+        self.finished = None
+
+        self._done_event = threading.Event()
+        self._lock = threading.Lock()
+        self._running = False
+        self._cancelled = False
+        self._result = None
+        self._exc_info = None
+        self._callbacks = []
+
+    @property
+    def duration(self):
+        """Duration of process execution in seconds."""
+        if self.started is None:
+            return None
+        finished = self.finished
+        if finished is None:
+            finished = time.time()
+        return finished - self.started
+
+    def running(self):
+        return self._running
+
+    def done(self):
+        return self._done_event.is_set()
+
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        """Cancel the process.
+
+        Running process is killed.
+
+        Returns:
+            bool: Process was cancelled or killed.
+        """
+        with self._lock:
+            if self.done():
+                return False
+
+            self._cancelled = True
+            self.cancel_event.set()
+            if self._running:
+                return True
+
+        self._set_exc_info((
+            ProcessCancelledError,
+            ProcessCancelledError("Process was cancelled"),
+            None
+        ))
+        return True
+
+    def add_done_callback(self, callback):
+        """Add callback called with the future when is done."""
+        with self._lock:
+            if not self.done():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def result(self, timeout=None):
+        """Output of the process.
+
+        Args:
+            timeout (Optional[float]): Maximum time to wait in seconds.
+
+        Returns:
+            str: Output of process.
+
+        Raises:
+            RuntimeError: When process failed or did not finish in timeout.
+        """
+        if not self._done_event.wait(timeout):
+            raise RuntimeError("Process did not finish in {} seconds".format(
+                timeout
+            ))
+
+        if self._exc_info is not None:
+            six.reraise(*self._exc_info)
+        return self._result
+
+    def exception(self, timeout=None):
+        if not self._done_event.wait(timeout):
+            raise RuntimeError("Process did not finish in {} seconds".format(
+                timeout
+            ))
+
+        if self._exc_info is not None:
+            return self._exc_info[1]
+        return None
+
+    def _set_running(self):
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._running = True
+            self.started = time.time()
+            return True
+
+    def _set_result(self, result):
+        self._result = result
+        self._finish()
+
+    def _set_exc_info(self, exc_info):
+        self._exc_info = exc_info
+        self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._running = False
+            self.finished = time.time()
+            self._done_event.set()
+            callbacks = list(self._callbacks)
+            self._callbacks = []
+
+        for callback in callbacks:
+            callback(self)
+
+
+class SubprocessExecutor(object):
+    """Run subprocesses concurrently in pool of worker threads.
+
+    Output of each process is logged line by line. Before a process is
+    started when other processes are running, executor waits until there
+    is enough available memory.
+
+    Args:
+        max_workers (Optional[int]): Maximum number of running processes.
+            Value from 'get_subprocess_max_workers' is used if not passed.
+        memory_per_process_mb (Optional[int]): Expected memory usage of
+            one process. Memory is not checked if not passed.
+        logger (Optional[logging.Logger]): Logger used for processes output.
+    """
+
+    # Number of last output lines of each process kept in memory
+    default_output_limit = 1000
+
+    def __init__(
+        self, max_workers=None, memory_per_process_mb=None, logger=None
+    ):
+        if not max_workers or max_workers < 1:
+            max_workers = get_subprocess_max_workers()
+
+        if logger is None:
+            logger = Logger.get_logger(self.__class__.__name__)
+
+        self.log = logger
+        self._max_workers = max_workers
+        self._memory_per_process = None
+        if memory_per_process_mb:
+            self._memory_per_process = memory_per_process_mb * 1024 * 1024
+
+        self._queue = queue.Queue()
+        self._workers = []
+        self._futures = []
+        self._running_count = 0
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    def submit(self, *args, **kwargs):
+        """Submit process to run.
+
+        Arguments are the same as for 'run_subprocess'. Only last
+        'default_output_limit' lines of output are kept if 'output_limit'
+        is not passed.
+
+        Returns:
+            SubprocessFuture: Future of process output.
+        """
+        if self._shutdown:
+            raise RuntimeError("Executor is shut down")
+
+        kwargs.setdefault("logger", self.log)
+        kwargs.setdefault("output_limit", self.default_output_limit)
+        future = SubprocessFuture(args, kwargs)
+        with self._lock:
+            self._futures.append(future)
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(target=self._worker_loop)
+                worker.daemon = True
+                self._workers.append(worker)
+                worker.start()
+        self._queue.put(future)
+        return future
+
+    def cancel_all(self):
+        """Cancel all pending and running processes."""
+        with self._lock:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def shutdown(self, wait=True, cancel=False):
+        """Stop executor workers.
+
+        Args:
+            wait (Optional[bool]): Wait for workers to finish.
+            cancel (Optional[bool]): Cancel pending and running processes.
+        """
+        if cancel:
+            self.cancel_all()
+
+        self._shutdown = True
+        for _ in self._workers:
+            self._queue.put(None)
+
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    def _reserve_process(self, future):
+        """Wait for enough available memory and mark process as running.
+
+        Memory is checked and running count is increased under one lock so
+        multiple workers don't start processes based on the same check.
+
+        Returns:
+            bool: Process was reserved, False if future was cancelled.
+        """
+        while not future.cancel_event.is_set():
+            with self._lock:
+                if self._has_memory_for_process():
+                    self._running_count += 1
+                    return True
+            time.sleep(0.5)
+        return False
+
+    def _has_memory_for_process(self):
+        if self._memory_per_process is None or self._running_count == 0:
+            return True
+        available_memory = _get_available_memory()
+        return (
+            available_memory is None
+            or available_memory >= self._memory_per_process
+        )
+
+    def _worker_loop(self):
+        while True:
+            future = self._queue.get()
+            if future is None:
+                break
+
+            reserved = self._reserve_process(future)
+            if not reserved or not future._set_running():
+                with self._lock:
+                    if reserved:
+                        self._running_count -= 1
+                    self._futures.remove(future)
+                continue
+
+            kwargs = dict(future.kwargs)
+            kwargs["cancel_event"] = future.cancel_event
+            try:
+                future._set_result(run_subprocess(*future.args, **kwargs))
+            except Exception:
+                future._set_exc_info(sys.exc_info())
+            finally:
+                with self._lock:
+                    self._running_count -= 1
+                    self._futures.remove(future)
+
+
+def wait_for_futures(futures, cancel_on_error=True):
+    """Wait for all futures and return their results.
+
+    Args:
+        futures (list[SubprocessFuture]): Futures to wait for.
+        cancel_on_error (Optional[bool]): Cancel other futures when any of
+            them fails.
+
+    Returns:
+        list[str]: Outputs of processes in order of futures.
+
+    Raises:
+        Exception: First error of failed process.
+    """
+    errored = threading.Event()
+
+    def _on_done(future):
+        if future.exception() is not None:
+            errored.set()
+
+    for future in futures:
+        future.add_done_callback(_on_done)
+
+    while not all(future.done() for future in futures):
+        if cancel_on_error and errored.is_set():
+            for future in futures:
+                future.cancel()
+        time.sleep(0.05)
+
+    for future in futures:
+        exc = future.exception()
+        if exc is not None and not isinstance(exc, ProcessCancelledError):
+            # Raise the error
+            future.result()
+
+    return [future.result() for future in futures]
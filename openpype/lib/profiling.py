@@ -1,6 +1,16 @@
 # -*- coding: utf-8 -*-
-"""Provide profiling decorator."""
+"""Provide profiling decorator and startup profiler."""
 import os
+import sys
+import copy
+import json
+import time
+import atexit
+import inspect
+import tempfile
+import threading
+import contextlib
+import collections
 import cProfile
 
 
@@ -27,3 +37,248 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+class _TimedLoader(object):
+    """Proxy of loader which measures execution of module.
+
+    All attributes except 'exec_module' are taken from original loader.
+
+    Args:
+        profiler (StartupProfiler): Profiler which stores the time.
+        fullname (str): Name of loaded module.
+        loader (importlib.abc.Loader): Original loader.
+    """
+
+    def __init__(self, profiler, fullname, loader):
+        self._profiler = profiler
+        self._fullname = fullname
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        if create_module is None:
+            return None
+        return create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._exec_module(self._fullname, self._loader, module)
+
+
+class StartupProfiler(object):
+    """Profiler of process startup.
+
+    Records import time of each python module, time spent in named phases
+    (e.g. settings resolution or mongo connection) and custom data. Report
+    is written as json file when process ends.
+
+    Profiler is installed to 'sys.meta_path' where it is used as import hook
+    to measure imports. It is also the place where it can be found by
+    'get_startup_profiler' even if 'openpype' modules were re-imported during
+    bootstrap.
+
+    Args:
+        output_path (str): Path to json report. Can contain '{pid}' which
+            is replaced with process id.
+    """
+
+    is_startup_profiler = True
+
+    def __init__(self, output_path):
+        self.output_path = output_path.format(pid=os.getpid())
+        self.start_time = time.time()
+
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._imports = {}
+        self._phases = collections.OrderedDict()
+        self._data = {}
+
+    def _get_import_stack(self):
+        stack = getattr(self._local, "import_stack", None)
+        if stack is None:
+            stack = []
+            self._local.import_stack = stack
+        return stack
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find spec using other finders and measure module execution."""
+        if getattr(self._local, "finding", False):
+            return None
+
+        self._local.finding = True
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                find_spec = getattr(finder, "find_spec", None)
+                if (
+                    find_spec is None
+                    or getattr(finder, "is_startup_profiler", False)
+                ):
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            self._local.finding = False
+
+        loader = getattr(spec, "loader", None)
+        exec_module = getattr(loader, "exec_module", None)
+        # Builtin and frozen importers are classes shared by all modules
+        if exec_module is None or inspect.isclass(loader):
+            return spec
+
+        # Loader can be shared by multiple modules (e.g. zipimporter) so it
+        #   must not be modified, spec of the module uses proxy of the loader
+        spec = copy.copy(spec)
+        spec.loader = _TimedLoader(self, fullname, loader)
+        return spec
+
+    def _exec_module(self, fullname, loader, module):
+        stack = self._get_import_stack()
+        stack.append([time.time(), 0.0])
+        try:
+            loader.exec_module(module)
+        finally:
+            start, children_time = stack.pop()
+            duration = time.time() - start
+            if stack:
+                stack[-1][1] += duration
+            with self._lock:
+                self._imports[fullname] = {
+                    "cumulative": duration,
+                    "self": duration - children_time
+                }
+
+    def add_phase_time(self, name, start, duration):
+        """Add time spent in a phase.
+
+        Phase can be processed multiple times, durations are summed.
+
+        Args:
+            name (str): Phase name.
+            start (float): Time when phase started.
+            duration (float): Duration of the phase in seconds.
+        """
+        with self._lock:
+            phase = self._phases.get(name)
+            if phase is None:
+                phase = {
+                    "start": start - self.start_time,
+                    "duration": 0.0,
+                    "count": 0
+                }
+                self._phases[name] = phase
+            phase["duration"] += duration
+            phase["count"] += 1
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Measure time spent in context as phase with passed name."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add_phase_time(name, start, time.time() - start)
+
+    def add_data(self, key, value):
+        """Add json serializable data to report."""
+        with self._lock:
+            self._data[key] = value
+
+    def get_report(self):
+        """Report data.
+
+        Returns:
+            dict[str, Any]: Total time, phases, imports sorted by cumulative
+                time and additional data.
+        """
+        with self._lock:
+            imports = [
+                dict(name=name, **timing)
+                for name, timing in self._imports.items()
+            ]
+            imports.sort(key=lambda item: item["cumulative"], reverse=True)
+            return {
+                "pid": os.getpid(),
+                "argv": list(sys.argv),
+                "total": time.time() - self.start_time,
+                "phases": copy.deepcopy(self._phases),
+                "imports": imports,
+                "data": copy.deepcopy(self._data)
+            }
+
+    def write_report(self):
+        """Write report to output path."""
+        dirpath = os.path.dirname(self.output_path)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        with open(self.output_path, "w") as stream:
+            json.dump(self.get_report(), stream, indent=4)
+        sys.stderr.write(
+            ">>> Startup profile written to \"{}\"\n".format(self.output_path)
+        )
+
+
+def get_startup_profiler():
+    """Installed startup profiler.
+
+    Returns:
+        Union[StartupProfiler, None]: Profiler or None if startup profiling
+            is not enabled.
+    """
+    for finder in sys.meta_path:
+        if getattr(finder, "is_startup_profiler", False):
+            return finder
+    return None
+
+
+def install_startup_profiler(output_path=None):
+    """Install startup profiler if is not installed yet.
+
+    Output path is taken from 'OPENPYPE_STARTUP_PROFILE' environment variable
+    if is not passed. The variable can contain path to json report or "1"
+    to write report into temp directory.
+
+    Args:
+        output_path (Optional[str]): Path to json report.
+
+    Returns:
+        StartupProfiler: Installed profiler.
+    """
+    profiler = get_startup_profiler()
+    if profiler is not None:
+        return profiler
+
+    if not output_path:
+        output_path = os.environ.get("OPENPYPE_STARTUP_PROFILE")
+
+    if not output_path or output_path == "1":
+        output_path = os.path.join(
+            tempfile.gettempdir(), "openpype_startup_{pid}.json"
+        )
+
+    profiler = StartupProfiler(output_path)
+    sys.meta_path.insert(0, profiler)
+    atexit.register(profiler.write_report)
+    return profiler
+
+
+@contextlib.contextmanager
+def startup_phase(name):
+    """Measure phase of startup if startup profiling is enabled.
+
+    Args:
+        name (str): Phase name.
+    """
+    profiler = get_startup_profiler()
+    if profiler is None:
+        yield
+        return
+
+    with profiler.phase(name):
+        yield
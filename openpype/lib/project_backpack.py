@@ -12,26 +12,49 @@ This gives ability to create project where a changes and tests can be done.
 
 Keep in mind that to be able to create a package of project has few
 requirements. Possible requirement should be listed in 'pack_project' function.
+
+Project files can be split into multiple zip volumes which are written in
+parallel. First volume '<project name>.zip' contains metadata and database
+documents, other volumes are named '<project name>.<index>.zip'. Files which
+are already compressed (images, videos, archives) are stored without
+compression.
 """
 
 import os
+import sys
+import re
 import json
 import platform
-import tempfile
 import shutil
 import datetime
+import threading
+import collections
+import multiprocessing
 
+import six
 import zipfile
+from bson.json_util import (
+    loads,
+    dumps,
+    CANONICAL_JSON_OPTIONS
+)
 from openpype.client.mongo import (
-    load_json_file,
     get_project_connection,
     replace_project_documents,
-    store_project_documents,
 )
 
 DOCUMENTS_FILE_NAME = "database"
 METADATA_FILE_NAME = "metadata"
 PROJECT_FILES_DIR = "project_files"
+# Default maximum size of files in one volume
+DEFAULT_VOLUME_SIZE = 2 * 1024 ** 3
+# Extensions of files which are not compressed
+INCOMPRESSIBLE_EXTENSIONS = {
+    ".exr", ".tx", ".jpg", ".jpeg", ".png", ".tif", ".tiff", ".dpx",
+    ".mov", ".mp4", ".avi", ".mkv", ".webm", ".mxf",
+    ".mp3", ".aac", ".m4a",
+    ".zip", ".gz", ".bz2", ".xz", ".7z", ".rar", ".abc", ".usdc", ".vdb"
+}
 
 
 def add_timestamp(filepath):
@@ -61,32 +84,192 @@ def get_project_document(project_name, database_name=None):
     return col.find_one({"type": "project"})
 
 
-def _pack_files_to_zip(zip_stream, source_path, root_path):
-    """Pack files to a zip stream.
+def _get_max_workers(max_workers=None):
+    if not max_workers or max_workers < 1:
+        max_workers = multiprocessing.cpu_count()
+    return max_workers
+
+
+def _run_in_threads(func, items, max_workers):
+    """Call function with each item in pool of threads.
+
+    First error is re-raised after all threads finished.
+    """
+    items = collections.deque(items)
+    lock = threading.Lock()
+    errors = []
+
+    def _worker():
+        while True:
+            with lock:
+                if not items or errors:
+                    return
+                item = items.popleft()
+            try:
+                func(item)
+            except Exception:
+                with lock:
+                    errors.append(sys.exc_info())
+
+    threads = [
+        threading.Thread(target=_worker)
+        for _ in range(min(max_workers, len(items)))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        six.reraise(*errors[0])
+
+
+def _collect_project_files(source_path, root_path):
+    """Collect files of project to pack.
 
     Args:
-        zip_stream (zipfile.ZipFile): Stream to a zipfile.
         source_path (str): Path to a directory where files are.
         root_path (str): Path to a directory which is used for calculation
             of relative path.
+
+    Returns:
+        list[tuple[str, str, int]]: Filepath, name in archive and size of
+            each file.
     """
 
+    files = []
     for root, _, filenames in os.walk(source_path):
         for filename in filenames:
             filepath = os.path.join(root, filename)
-            # TODO add one more folder
-            archive_name = os.path.join(
+            archive_name = "/".join((
                 PROJECT_FILES_DIR,
-                os.path.relpath(filepath, root_path)
+                os.path.relpath(filepath, root_path).replace("\\", "/")
+            ))
+            files.append((filepath, archive_name, os.path.getsize(filepath)))
+    return files
+
+
+def _split_files_to_volumes(files, max_volume_size):
+    """Split files into volumes with maximum size of files.
+
+    File bigger than maximum size is in volume alone.
+
+    Returns:
+        list[list[tuple[str, str, int]]]: Files of each volume. There is
+            always at least one volume.
+    """
+
+    volumes = [[]]
+    volume_size = 0
+    for item in files:
+        size = item[2]
+        if volumes[-1] and volume_size + size > max_volume_size:
+            volumes.append([])
+            volume_size = 0
+        volumes[-1].append(item)
+        volume_size += size
+    return volumes
+
+
+def _get_volume_path(zip_path, index):
+    if index == 0:
+        return zip_path
+    base, ext = os.path.splitext(zip_path)
+    return "{}.{:03d}{}".format(base, index, ext)
+
+
+def _get_existing_volume_paths(zip_path):
+    """Paths to existing volumes of package in order of indexes."""
+
+    volume_paths = []
+    if os.path.exists(zip_path):
+        volume_paths.append((0, zip_path))
+
+    base, ext = os.path.splitext(os.path.basename(zip_path))
+    volume_regex = re.compile(
+        r"^{}\.(\d{{3}}){}$".format(re.escape(base), re.escape(ext))
+    )
+    dirpath = os.path.dirname(zip_path)
+    for filename in os.listdir(dirpath):
+        match = volume_regex.match(filename)
+        if match:
+            volume_paths.append(
+                (int(match.group(1)), os.path.join(dirpath, filename))
+            )
+    volume_paths.sort()
+    return volume_paths
+
+
+def _get_compress_type(filepath):
+    ext = os.path.splitext(filepath)[-1].lower()
+    if ext in INCOMPRESSIBLE_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _write_project_documents(zip_stream, project_name, database_name):
+    """Write project documents to zip one by one.
+
+    Documents are not loaded to memory all at once.
+    """
+
+    collection = get_project_connection(project_name, database_name)
+    with zip_stream.open(DOCUMENTS_FILE_NAME + ".json", "w") as stream:
+        stream.write(b"[")
+        for idx, doc in enumerate(collection.find({})):
+            if idx > 0:
+                stream.write(b", ")
+            stream.write(
+                dumps(doc, json_options=CANONICAL_JSON_OPTIONS).encode("utf-8")
             )
-            zip_stream.write(filepath, archive_name)
+        stream.write(b"]")
+
+
+def _pack_volumes(zip_path, volumes, max_workers, write_first):
+    """Write files to zip volumes in parallel.
+
+    Args:
+        zip_path (str): Path to first volume.
+        volumes (list[list[tuple[str, str, int]]]): Files of each volume
+            from '_split_files_to_volumes'.
+        max_workers (int): Maximum number of volumes written at once.
+        write_first (Callable[[zipfile.ZipFile], None]): Callback writing
+            additional content to first volume.
+
+    Returns:
+        list[str]: Filenames of volumes.
+    """
+
+    volume_paths = [
+        _get_volume_path(zip_path, index)
+        for index in range(len(volumes))
+    ]
+
+    def _write_volume(index):
+        with zipfile.ZipFile(
+            volume_paths[index], "w", zipfile.ZIP_DEFLATED, allowZip64=True
+        ) as zip_stream:
+            if index == 0:
+                write_first(zip_stream)
+
+            for filepath, archive_name, _ in volumes[index]:
+                zip_stream.write(
+                    filepath,
+                    archive_name,
+                    compress_type=_get_compress_type(filepath)
+                )
+
+    _run_in_threads(_write_volume, range(len(volumes)), max_workers)
+    return [os.path.basename(path) for path in volume_paths]
 
 
 def pack_project(
     project_name,
     destination_dir=None,
     only_documents=False,
-    database_name=None
+    database_name=None,
+    max_volume_size=None,
+    max_workers=None
 ):
     """Make a package of a project with mongo documents and files.
 
@@ -103,6 +286,11 @@ def pack_project(
             files.
         database_name (Optional[str]): Custom database name from which is
             project queried.
+        max_volume_size (Optional[int]): Maximum size of project files in
+            one zip volume in bytes. 'DEFAULT_VOLUME_SIZE' is used if not
+            passed.
+        max_workers (Optional[int]): Maximum number of volumes written in
+            parallel. Number of CPUs is used if not passed.
     """
 
     print("Creating package of project \"{}\"".format(project_name))
@@ -160,69 +348,190 @@ def pack_project(
     zip_path = os.path.join(destination_dir, project_name + ".zip")
 
     print("Project will be packaged into \"{}\"".format(zip_path))
-    # Rename already existing zip
-    if os.path.exists(zip_path):
-        dst_filepath = add_timestamp(zip_path)
-        os.rename(zip_path, dst_filepath)
+    # Rename all volumes of already existing package with the same timestamp
+    existing_volume_paths = _get_existing_volume_paths(zip_path)
+    if existing_volume_paths:
+        dst_zip_path = add_timestamp(zip_path)
+        for index, volume_path in existing_volume_paths:
+            os.rename(volume_path, _get_volume_path(dst_zip_path, index))
+
+    files = []
+    if not only_documents:
+        files = _collect_project_files(project_source_path, root_path)
+
+    if not max_volume_size:
+        max_volume_size = DEFAULT_VOLUME_SIZE
 
     # We can add more data
     metadata = {
         "project_name": project_name,
         "root": source_root,
-        "version": 1
+        "version": 2,
+        # Volumes are filled after split of files
+        "volumes": [],
+        # Sizes of files for integrity check on unpack
+        "files": {
+            archive_name: size
+            for _, archive_name, size in files
+        }
     }
-    # Create temp json file where metadata are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_metadata_json = s.name
+    volumes = _split_files_to_volumes(files, max_volume_size)
+    metadata["volumes"] = [
+        os.path.basename(_get_volume_path(zip_path, index))
+        for index in range(len(volumes))
+    ]
+
+    def _write_first(zip_stream):
+        zip_stream.writestr(
+            METADATA_FILE_NAME + ".json", json.dumps(metadata)
+        )
+        _write_project_documents(zip_stream, project_name, database_name)
+
+    print("Packing files into {} zip volume/s".format(len(volumes)))
+    _pack_volumes(
+        zip_path,
+        volumes,
+        _get_max_workers(max_workers),
+        _write_first
+    )
 
-    with open(temp_metadata_json, "w") as stream:
-        json.dump(metadata, stream)
+    print("*** Packing finished ***")
 
-    # Create temp json file where database documents are stored
-    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as s:
-        temp_docs_json = s.name
 
-    # Query all project documents and store them to temp json
-    store_project_documents(project_name, temp_docs_json, database_name)
+def _get_member_dst_path(root_path, name, prefix):
+    """Destination path of archive member under root.
 
-    print("Packing files into zip")
-    # Write all to zip file
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
-        # Add metadata file
-        zip_stream.write(temp_metadata_json, METADATA_FILE_NAME + ".json")
-        # Add database documents
-        zip_stream.write(temp_docs_json, DOCUMENTS_FILE_NAME + ".json")
+    Raises:
+        ValueError: Member name is absolute or leads outside of root.
+    """
 
-        # Add project files to zip
-        if not only_documents:
-            _pack_files_to_zip(zip_stream, project_source_path, root_path)
+    relative_name = name[len(prefix):]
+    drive, _ = os.path.splitdrive(relative_name)
+    if drive or relative_name.startswith("/"):
+        raise ValueError(
+            "Archive member has absolute path \"{}\"".format(name)
+        )
 
-    print("Cleaning up")
-    # Cleanup
-    os.remove(temp_docs_json)
-    os.remove(temp_metadata_json)
+    root_path = os.path.normpath(os.path.abspath(root_path))
+    dst_path = os.path.normpath(os.path.join(root_path, relative_name))
+    if not dst_path.startswith(os.path.join(root_path, "")):
+        raise ValueError(
+            "Archive member \"{}\" leads outside of root \"{}\"".format(
+                name, root_path
+            )
+        )
+    return dst_path
 
-    print("*** Packing finished ***")
 
+def _extract_volumes(volume_paths, root_path, file_sizes, max_workers):
+    """Extract project files from zip volumes directly to root in parallel.
 
-def _unpack_project_files(unzip_dir, root_path, project_name):
-    """Move project files from unarchived temp folder to new root.
+    Content of each file is validated by CRC of zip on read and size is
+    compared to size stored in metadata.
+
+    Args:
+        volume_paths (list[str]): Paths to zip volumes.
+        root_path (str): Path to root where project files are extracted.
+        file_sizes (dict[str, int]): Expected sizes of files by name in
+            archive. Size from zip is used for files which are not there.
+        max_workers (int): Maximum number of files extracted at once.
+
+    Returns:
+        int: Number of extracted files.
+
+    Raises:
+        ValueError: Archive contains member which would be extracted outside
+            of root.
+    """
+
+    members = []
+    prefix = PROJECT_FILES_DIR + "/"
+    for volume_path in volume_paths:
+        with zipfile.ZipFile(volume_path, "r") as zip_stream:
+            for zip_info in zip_stream.infolist():
+                name = zip_info.filename.replace("\\", "/")
+                if name.startswith(prefix) and not name.endswith("/"):
+                    # Validate all members before anything is extracted
+                    dst_path = _get_member_dst_path(root_path, name, prefix)
+                    members.append((volume_path, zip_info, dst_path))
+
+    # Each thread needs own file handle of zip
+    local_data = threading.local()
+    opened_streams = []
+
+    def _get_zip_stream(volume_path):
+        streams = getattr(local_data, "streams", None)
+        if streams is None:
+            streams = local_data.streams = {}
+        if volume_path not in streams:
+            zip_stream = zipfile.ZipFile(volume_path, "r")
+            streams[volume_path] = zip_stream
+            opened_streams.append(zip_stream)
+        return streams[volume_path]
+
+    def _extract(item):
+        volume_path, zip_info, dst_path = item
+        name = zip_info.filename.replace("\\", "/")
+        dst_dir = os.path.dirname(dst_path)
+        if not os.path.exists(dst_dir):
+            try:
+                os.makedirs(dst_dir)
+            except OSError:
+                if not os.path.isdir(dst_dir):
+                    raise
+
+        zip_stream = _get_zip_stream(volume_path)
+        with zip_stream.open(zip_info, "r") as src_stream:
+            with open(dst_path, "wb") as dst_stream:
+                shutil.copyfileobj(src_stream, dst_stream, 1024 * 1024)
+
+        expected_size = file_sizes.get(name, zip_info.file_size)
+        size = os.path.getsize(dst_path)
+        if size != expected_size:
+            raise ValueError(
+                "Size of extracted file {} does not match ({} != {})".format(
+                    dst_path, size, expected_size
+                )
+            )
+
+    try:
+        _run_in_threads(_extract, members, max_workers)
+    finally:
+        for zip_stream in opened_streams:
+            zip_stream.close()
+    return len(members)
+
+
+def _unpack_project_files(
+    volume_paths, root_path, project_name, file_sizes, max_workers
+):
+    """Extract project files from zip volumes to new root.
 
     Unpack is skipped if source files are not available in the zip. That can
     happen if nothing was published yet or only documents were stored to
     package.
 
     Args:
-        unzip_dir (str): Location where zip was unzipped.
+        volume_paths (list[str]): Paths to zip volumes.
         root_path (str): Path to new root.
         project_name (str): Name of project.
+        file_sizes (dict[str, int]): Expected sizes of files.
+        max_workers (int): Maximum number of files extracted at once.
     """
 
-    src_project_files_dir = os.path.join(
-        unzip_dir, PROJECT_FILES_DIR, project_name
-    )
+    project_prefix = "{}/{}/".format(PROJECT_FILES_DIR, project_name)
+    has_files = False
+    for volume_path in volume_paths:
+        with zipfile.ZipFile(volume_path, "r") as zip_stream:
+            for name in zip_stream.namelist():
+                if name.replace("\\", "/").startswith(project_prefix):
+                    has_files = True
+                    break
+        if has_files:
+            break
+
     # Skip if files are not in the zip
-    if not os.path.exists(src_project_files_dir):
+    if not has_files:
         return
 
     # Make sure root path exists
@@ -239,24 +548,28 @@ def _unpack_project_files(unzip_dir, root_path, project_name):
         ))
         os.rename(dst_project_files_dir, new_path)
 
-    print("Moving project files from temp \"{}\" -> \"{}\"".format(
-        src_project_files_dir, dst_project_files_dir
-    ))
-    shutil.move(src_project_files_dir, dst_project_files_dir)
+    print("Extracting project files to \"{}\"".format(dst_project_files_dir))
+    _extract_volumes(volume_paths, root_path, file_sizes, max_workers)
 
 
 def unpack_project(
-    path_to_zip, new_root=None, database_only=None, database_name=None
+    path_to_zip,
+    new_root=None,
+    database_only=None,
+    database_name=None,
+    max_workers=None
 ):
     """Unpack project zip file to recreate project.
 
     Args:
         path_to_zip (str): Path to zip which was created using 'pack_project'
-            function.
+            function. Other volumes are expected next to it.
         new_root (str): Optional way how to set different root path for
             unpacked project.
         database_only (Optional[bool]): Unpack only database from zip.
         database_name (str): Name of database where project will be recreated.
+        max_workers (Optional[int]): Maximum number of files extracted
+            in parallel. Number of CPUs is used if not passed.
     """
 
     if database_only is None:
@@ -267,24 +580,29 @@ def unpack_project(
         print("Zip file does not exists: {}".format(path_to_zip))
         return
 
-    tmp_dir = tempfile.mkdtemp(prefix="unpack_")
-    print("Zip is extracted to temp: {}".format(tmp_dir))
     with zipfile.ZipFile(path_to_zip, "r") as zip_stream:
-        if database_only:
-            for filename in (
-                "{}.json".format(METADATA_FILE_NAME),
-                "{}.json".format(DOCUMENTS_FILE_NAME),
-            ):
-                zip_stream.extract(filename, tmp_dir)
-        else:
-            zip_stream.extractall(tmp_dir)
-
-    metadata_json_path = os.path.join(tmp_dir, METADATA_FILE_NAME + ".json")
-    with open(metadata_json_path, "r") as stream:
-        metadata = json.load(stream)
-
-    docs_json_path = os.path.join(tmp_dir, DOCUMENTS_FILE_NAME + ".json")
-    docs = load_json_file(docs_json_path)
+        metadata = json.loads(
+            zip_stream.read(METADATA_FILE_NAME + ".json").decode("utf-8")
+        )
+        docs = loads(
+            zip_stream.read(DOCUMENTS_FILE_NAME + ".json").decode("utf-8")
+        )
+
+    # Packages of version 1 have everything in one zip
+    # - volume names are based on passed zip as package could be renamed
+    volume_paths = [
+        _get_volume_path(path_to_zip, index)
+        for index in range(len(metadata.get("volumes") or []))
+    ] or [path_to_zip]
+    missing_volumes = [
+        path
+        for path in volume_paths
+        if not os.path.exists(path)
+    ]
+    if missing_volumes and not database_only:
+        raise ValueError("Missing zip volumes: {}".format(
+            ", ".join(missing_volumes)
+        ))
 
     low_platform = platform.system().lower()
     project_name = metadata["project_name"]
@@ -317,9 +635,13 @@ def unpack_project(
             }}
         )
 
-    _unpack_project_files(tmp_dir, root_path, project_name)
+    if not database_only:
+        _unpack_project_files(
+            volume_paths,
+            root_path,
+            project_name,
+            metadata.get("files") or {},
+            _get_max_workers(max_workers)
+        )
 
-    # CLeanup
-    print("Cleaning up")
-    shutil.rmtree(tmp_dir)
     print("*** Unpack finished ***")
@@ -17,6 +17,7 @@ from .base import (
 
     ModulesManager,
     TrayModulesManager,
+    get_modules_manager,
 
     BaseModuleSettingsDef,
     ModuleSettingsDef,
@@ -42,6 +43,7 @@ __all__ = (
 
     "ModulesManager",
     "TrayModulesManager",
+    "get_modules_manager",
 
     "BaseModuleSettingsDef",
     "ModuleSettingsDef",
@@ -8,11 +8,13 @@ import inspect
 import logging
 import platform
 import threading
+import functools
 import collections
 import traceback
 from uuid import uuid4
 from abc import ABCMeta, abstractmethod
 import six
+import appdirs
 
 from openpype.settings import (
     get_system_settings,
@@ -32,6 +34,7 @@ from openpype.lib import (
     import_filepath,
     import_module_from_dirpath
 )
+from openpype.lib.profiling import get_startup_profiler, startup_phase
 
 from .interfaces import (
     OpenPypeInterface,
@@ -53,6 +56,8 @@ IGNORED_DEFAULT_FILENAMES = (
     "example_addons",
     "default_modules",
 )
+# Version of modules manifest data structure
+MODULES_MANIFEST_VERSION = 1
 
 
 # Inherit from `object` for Python 2 hosts
@@ -71,12 +76,19 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Loaders of modules which are imported on first access
+        super(_ModuleClass, self).__setattr__(
+            "__lazy__", collections.OrderedDict()
+        )
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
+        if attr_name in self.__lazy__:
+            self._load_lazy_attribute(attr_name)
+
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__", "__file__"):
+            if attr_name in ("__path__", "__file__", "__spec__"):
                 return None
             raise AttributeError("'{}' has not attribute '{}'".format(
                 self.name, attr_name
@@ -87,8 +99,24 @@ class _ModuleClass(object):
         for module in self.values():
             yield module
 
+    def _load_lazy_attribute(self, attr_name):
+        with _LoadCache.lazy_lock:
+            loader = self.__lazy__.pop(attr_name, None)
+            if loader is None:
+                return
+            module = loader()
+            if module is not None:
+                self.__attributes__[attr_name] = module
+
+    def _load_lazy_attributes(self):
+        for attr_name in tuple(self.__lazy__.keys()):
+            self._load_lazy_attribute(attr_name)
+
     def __setattr__(self, attr_name, value):
-        if attr_name in self.__attributes__:
+        if (
+            attr_name in self.__attributes__
+            and self.__attributes__[attr_name] is not value
+        ):
             self.log.warning(
                 "Duplicated name \"{}\" in {}. Overriding.".format(
                     self.name, attr_name
@@ -111,18 +139,70 @@ class _ModuleClass(object):
         return self._log
 
     def get(self, key, default=None):
+        if key in self.__lazy__:
+            self._load_lazy_attribute(key)
         return self.__attributes__.get(key, default)
 
     def keys(self):
-        return self.__attributes__.keys()
+        return list(self.__attributes__.keys()) + list(self.__lazy__.keys())
 
     def values(self):
+        self._load_lazy_attributes()
         return self.__attributes__.values()
 
     def items(self):
+        self._load_lazy_attributes()
         return self.__attributes__.items()
 
 
+class _LazyModuleLoader(object):
+    """Loader returning module imported by 'openpype_modules' lazy loader.
+
+    Import machinery replaces spec of the returned module, so the original
+    spec is set back after the import.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._spec = None
+
+    def create_module(self, spec):
+        module = sys.modules["openpype_modules"].get(self._name)
+        if module is None:
+            raise ImportError(
+                "Failed to import module '{}'".format(spec.name)
+            )
+        self._spec = getattr(module, "__spec__", None)
+        return module
+
+    def exec_module(self, module):
+        module.__spec__ = self._spec
+
+
+class _LazyModulesFinder(object):
+    """Import hook for 'openpype_modules' packages which were not loaded yet.
+
+    Allows to use 'import openpype_modules.<name>' for modules which are
+    imported on first access.
+    """
+
+    def find_spec(self, fullname, path=None, target=None):
+        parts = fullname.split(".")
+        if len(parts) != 2 or parts[0] != "openpype_modules":
+            return None
+
+        openpype_modules = sys.modules.get("openpype_modules")
+        lazy_loaders = getattr(openpype_modules, "__lazy__", None)
+        if not lazy_loaders or parts[1] not in lazy_loaders:
+            return None
+
+        import importlib.util
+
+        return importlib.util.spec_from_loader(
+            fullname, _LazyModuleLoader(parts[1])
+        )
+
+
 class _InterfacesClass(_ModuleClass):
     """Fake module class for storing OpenPype interfaces.
 
@@ -155,8 +235,21 @@ class _InterfacesClass(_ModuleClass):
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
+    lazy_lock = threading.RLock()
+    manager_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    lazy_finder = None
+    # Module classes information by python module name
+    manifest = collections.OrderedDict()
+    modules_manager = None
+    # Time when settings of shared modules manager were last compared
+    modules_manager_checked = 0
+
+
+# Seconds after which shared modules manager compares its settings with
+#   current system settings and is recreated if they changed
+MODULES_MANAGER_SETTINGS_TTL = 60
 
 
 def get_default_modules_dir():
@@ -299,6 +392,184 @@ def load_modules(force=False):
             time.sleep(0.1)
 
 
+def is_lazy_modules_loading_enabled():
+    """Modules can be imported on first access using modules manifest.
+
+    Lazy loading can be disabled with 'OPENPYPE_MODULES_LAZY_LOAD' environment
+    variable set to "0". Lazy loading is available only in Python 3.
+    """
+    if not six.PY3:
+        return False
+    return os.environ.get("OPENPYPE_MODULES_LAZY_LOAD") != "0"
+
+
+def get_modules_manifest_path():
+    """Path to cached modules manifest."""
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "modules_manifest.json"
+    )
+
+
+def _read_modules_manifest():
+    path = get_modules_manifest_path()
+    if not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, "r") as stream:
+            data = json.load(stream)
+    except Exception:
+        return {}
+
+    if data.get("version") != MODULES_MANIFEST_VERSION:
+        return {}
+    return data.get("modules") or {}
+
+
+def _write_modules_manifest(modules_data):
+    path = get_modules_manifest_path()
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        dirpath = os.path.dirname(path)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        with open(tmp_path, "w") as stream:
+            json.dump(
+                {
+                    "version": MODULES_MANIFEST_VERSION,
+                    "modules": modules_data
+                },
+                stream,
+                indent=4
+            )
+        os.replace(tmp_path, path)
+
+    except Exception:
+        Logger.get_logger("ModulesLoader").debug(
+            "Failed to store modules manifest to \"{}\"".format(path),
+            exc_info=True
+        )
+
+
+def _get_module_mtime(path):
+    """Modification time of module file or python files in module folder."""
+    if not os.path.isdir(path):
+        return os.path.getmtime(path)
+
+    mtimes = [os.path.getmtime(path)]
+    for filename in os.listdir(path):
+        if filename.endswith(".py"):
+            mtimes.append(os.path.getmtime(os.path.join(path, filename)))
+    return max(mtimes)
+
+
+def _get_module_classes_info(module):
+    """Information about OpenPype module classes in python module.
+
+    Args:
+        module (types.ModuleType): Imported python module.
+
+    Returns:
+        list[dict[str, Any]]: Class name, module name, implemented interfaces
+            and abstract state of each found class.
+    """
+    output = []
+    for attr_name in dir(module):
+        modules_item = getattr(module, attr_name, None)
+        # Filter globals that are not classes which inherit from
+        #   OpenPypeModule
+        if (
+            not inspect.isclass(modules_item)
+            or modules_item is OpenPypeModule
+            or modules_item is OpenPypeAddOn
+            or not issubclass(modules_item, OpenPypeModule)
+        ):
+            continue
+
+        # Name is known only when is defined as class attribute
+        module_name = getattr(modules_item, "name", None)
+        if not isinstance(module_name, six.string_types):
+            module_name = None
+
+        interfaces = [
+            cls.__name__
+            for cls in inspect.getmro(modules_item)
+            if (
+                cls is not OpenPypeInterface
+                and issubclass(cls, OpenPypeInterface)
+                and not issubclass(cls, OpenPypeModule)
+            )
+        ]
+        output.append({
+            "class_name": attr_name,
+            "name": module_name,
+            "interfaces": interfaces,
+            "abstract": inspect.isabstract(modules_item)
+        })
+    return output
+
+
+def _import_module(
+    openpype_modules, modules_key, dirpath, filename, is_in_current_dir,
+    is_in_host_dir
+):
+    """Import module from path and store it to 'openpype_modules'.
+
+    Returns:
+        Union[types.ModuleType, None]: Imported module or None if import
+            failed.
+    """
+    log = Logger.get_logger("ModulesLoader")
+    fullpath = os.path.join(dirpath, filename)
+    basename, ext = os.path.splitext(filename)
+
+    module = None
+    try:
+        # Don't import dynamically current directory modules
+        if is_in_current_dir:
+            import_str = "openpype.modules.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            module = __import__(import_str, fromlist=("", ))
+            sys.modules[new_import_str] = module
+            setattr(openpype_modules, basename, module)
+
+        elif is_in_host_dir:
+            import_str = "openpype.hosts.{}".format(basename)
+            new_import_str = "{}.{}".format(modules_key, basename)
+            # Until all hosts are converted to be able use them as
+            #   modules is this error check needed
+            try:
+                module = __import__(import_str, fromlist=("", ))
+                sys.modules[new_import_str] = module
+                setattr(openpype_modules, basename, module)
+
+            except Exception:
+                log.warning(
+                    "Failed to import host folder {}".format(basename),
+                    exc_info=True
+                )
+
+        elif os.path.isdir(fullpath):
+            module = import_module_from_dirpath(
+                dirpath, filename, modules_key
+            )
+
+        else:
+            module = import_filepath(fullpath)
+            setattr(openpype_modules, basename, module)
+
+    except Exception:
+        if is_in_current_dir:
+            msg = "Failed to import default module '{}'.".format(basename)
+        else:
+            msg = "Failed to import module '{}'.".format(fullpath)
+        log.error(msg, exc_info=True)
+
+    return module
+
+
 def _load_modules():
     # Key under which will be modules imported in `sys.modules`
     modules_key = "openpype_modules"
@@ -308,6 +579,19 @@ def _load_modules():
 
     log = Logger.get_logger("ModulesLoader")
 
+    # Modules with unchanged files since last load are imported on first
+    #   access to them
+    lazy_loading = is_lazy_modules_loading_enabled()
+    cached_manifest = {}
+    if lazy_loading:
+        cached_manifest = _read_modules_manifest()
+        if _LoadCache.lazy_finder is None:
+            _LoadCache.lazy_finder = _LazyModulesFinder()
+            sys.meta_path.insert(0, _LoadCache.lazy_finder)
+
+    manifest = collections.OrderedDict()
+    manifest_data = {}
+
     # Look for OpenPype modules in paths defined with `get_module_dirs`
     #   - dynamically imported OpenPype modules and addons
     module_dirs = get_module_dirs()
@@ -367,48 +651,37 @@ def _load_modules():
 
             # TODO add more logic how to define if folder is module or not
             # - check manifest and content of manifest
-            try:
-                # Don't import dynamically current directory modules
-                if is_in_current_dir:
-                    import_str = "openpype.modules.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    default_module = __import__(import_str, fromlist=("", ))
-                    sys.modules[new_import_str] = default_module
-                    setattr(openpype_modules, basename, default_module)
-
-                elif is_in_host_dir:
-                    import_str = "openpype.hosts.{}".format(basename)
-                    new_import_str = "{}.{}".format(modules_key, basename)
-                    # Until all hosts are converted to be able use them as
-                    #   modules is this error check needed
-                    try:
-                        default_module = __import__(
-                            import_str, fromlist=("", )
-                        )
-                        sys.modules[new_import_str] = default_module
-                        setattr(openpype_modules, basename, default_module)
-
-                    except Exception:
-                        log.warning(
-                            "Failed to import host folder {}".format(basename),
-                            exc_info=True
-                        )
-
-                elif os.path.isdir(fullpath):
-                    import_module_from_dirpath(dirpath, filename, modules_key)
+            import_args = (
+                openpype_modules,
+                modules_key,
+                dirpath,
+                filename,
+                is_in_current_dir,
+                is_in_host_dir
+            )
+            mtime = _get_module_mtime(fullpath) if lazy_loading else None
+            module_data = cached_manifest.get(fullpath)
+            if module_data and module_data.get("mtime") == mtime:
+                openpype_modules.__lazy__[basename] = functools.partial(
+                    _import_module, *import_args
+                )
 
-                else:
-                    module = import_filepath(fullpath)
-                    setattr(openpype_modules, basename, module)
+            else:
+                module = _import_module(*import_args)
+                if module is None:
+                    continue
+                module_data = {
+                    "name": basename,
+                    "mtime": mtime,
+                    "classes": _get_module_classes_info(module)
+                }
 
-            except Exception:
-                if is_in_current_dir:
-                    msg = "Failed to import default module '{}'.".format(
-                        basename
-                    )
-                else:
-                    msg = "Failed to import module '{}'.".format(fullpath)
-                log.error(msg, exc_info=True)
+            manifest_data[fullpath] = module_data
+            manifest[basename] = module_data["classes"]
+
+    _LoadCache.manifest = manifest
+    if lazy_loading and manifest_data != cached_manifest:
+        _write_modules_manifest(manifest_data)
 
 
 @six.add_metaclass(ABCMeta)
@@ -533,9 +806,44 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+class _ModulesByName(dict):
+    """Modules by name initializing skipped disabled modules on access.
+
+    Disabled modules are not initialized by 'ModulesManager' if their
+    settings say so. They're initialized on first access by name, so
+    'modules_by_name["sync_server"].enabled' works as before.
+    """
+
+    def __init__(self, manager):
+        super(_ModulesByName, self).__init__()
+        self._manager = manager
+
+    def __missing__(self, key):
+        module = self._manager._initialize_skipped_module(key)
+        if module is None:
+            raise KeyError(key)
+        return module
+
+    def __contains__(self, key):
+        return (
+            super(_ModulesByName, self).__contains__(key)
+            or key in self._manager._skipped_module_classes
+        )
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
+    Modules which are disabled in settings are not imported nor initialized
+    until they're accessed by name or all modules are requested using
+    'modules' attribute.
+
     Args:
         modules_settings(dict): To be able create module manager with specified
             data. For settings changes callbacks and testing purposes.
@@ -548,14 +856,37 @@ class ModulesManager:
 
         self._system_settings = _system_settings
 
-        self.modules = []
-        self.modules_by_id = {}
-        self.modules_by_name = {}
+        self._reset_modules()
         # For report of time consumption
         self._report = {}
 
-        self.initialize_modules()
-        self.connect_modules()
+        with startup_phase("modules.initialize"):
+            self.initialize_modules()
+        with startup_phase("modules.connect"):
+            self.connect_modules()
+
+        profiler = get_startup_profiler()
+        if profiler is not None:
+            profiler.add_data("modules_manager", self._report)
+
+    def _reset_modules(self):
+        self._modules = []
+        self.modules_by_id = {}
+        self.modules_by_name = _ModulesByName(self)
+        self._modules_settings = None
+        self._skipped_module_classes = {}
+        self._skipped_modules_lock = threading.Lock()
+
+    @property
+    def modules(self):
+        """All modules including disabled modules.
+
+        Returns:
+            list[OpenPypeModule]: Initialized modules.
+        """
+        for module_name in tuple(self._skipped_module_classes.keys()):
+            self._initialize_skipped_module(module_name)
+        return self._modules
 
     def __getitem__(self, module_name):
         return self.modules_by_name[module_name]
@@ -591,82 +922,137 @@ class ModulesManager:
             return module
         return default
 
+    @staticmethod
+    def _get_module_class(package_name, class_name):
+        import openpype_modules
+
+        package = openpype_modules.get(package_name)
+        return getattr(package, class_name, None)
+
+    @staticmethod
+    def _is_disabled_in_settings(module_name, modules_settings):
+        if not module_name:
+            return False
+        module_settings = modules_settings.get(module_name)
+        return (
+            isinstance(module_settings, dict)
+            and module_settings.get("enabled") is False
+        )
+
+    def _log_abstract_class(self, modules_item):
+        # Find abstract attributes by convention on `abc` module
+        not_implemented = []
+        for attr_name in dir(modules_item):
+            attr = getattr(modules_item, attr_name, None)
+            abs_method = getattr(
+                attr, "__isabstractmethod__", None
+            )
+            if attr and abs_method:
+                not_implemented.append(attr_name)
+
+        # Log missing implementations
+        self.log.warning((
+            "Skipping abstract Class: {}."
+            " Missing implementations: {}"
+        ).format(modules_item.__name__, ", ".join(not_implemented)))
+
+    def _initialize_module(self, modules_item):
+        name = modules_item.__name__
+        try:
+            # Try initialize module
+            module = modules_item(self, self._modules_settings)
+
+        except Exception:
+            self.log.warning(
+                "Initialization of module {} failed.".format(name),
+                exc_info=True
+            )
+            return None
+
+        # Store initialized object
+        self._modules.append(module)
+        self.modules_by_id[module.id] = module
+        self.modules_by_name[module.name] = module
+        enabled_str = "X"
+        if not module.enabled:
+            enabled_str = " "
+        self.log.debug("[{}] {}".format(enabled_str, name))
+        return module
+
+    def _initialize_skipped_module(self, module_name):
+        """Initialize module which was skipped because was disabled.
+
+        Returns:
+            Union[OpenPypeModule, None]: Initialized module or None if
+                module is not available.
+        """
+        with self._skipped_modules_lock:
+            if dict.__contains__(self.modules_by_name, module_name):
+                return dict.__getitem__(self.modules_by_name, module_name)
+
+            class_info = self._skipped_module_classes.pop(module_name, None)
+            if class_info is None:
+                return None
+
+            modules_item = self._get_module_class(*class_info)
+            if modules_item is None:
+                return None
+            return self._initialize_module(modules_item)
+
     def initialize_modules(self):
         """Import and initialize modules."""
         # Make sure modules are loaded
         load_modules()
 
-        import openpype_modules
-
         self.log.debug("*** Pype modules initialization.")
         # Prepare settings for modules
         system_settings = getattr(self, "_system_settings", None)
         if system_settings is None:
             system_settings = get_system_settings()
         modules_settings = system_settings["modules"]
+        self._modules_settings = modules_settings
 
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
         module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   OpenPypeModule
+        for package_name, classes_info in _LoadCache.manifest.items():
+            for class_info in classes_info:
+                class_name = class_info["class_name"]
+                module_name = class_info["name"]
+                # Skip import of disabled modules
                 if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is OpenPypeModule
-                    or modules_item is OpenPypeAddOn
-                    or not issubclass(modules_item, OpenPypeModule)
+                    not class_info["abstract"]
+                    and self._is_disabled_in_settings(
+                        module_name, modules_settings
+                    )
                 ):
+                    self._skipped_module_classes[module_name] = (
+                        package_name, class_name
+                    )
+                    continue
+
+                modules_item = self._get_module_class(
+                    package_name, class_name
+                )
+                if modules_item is None:
                     continue
 
                 # Check if class is abstract (Developing purpose)
                 if inspect.isabstract(modules_item):
-                    # Find abstract attributes by convention on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
+                    self._log_abstract_class(modules_item)
                     continue
                 module_classes.append(modules_item)
 
         for modules_item in module_classes:
-            try:
-                name = modules_item.__name__
-                # Try initialize module
-                module = modules_item(self, modules_settings)
-                # Store initialized object
-                self.modules.append(module)
-                self.modules_by_id[module.id] = module
-                self.modules_by_name[module.name] = module
-                enabled_str = "X"
-                if not module.enabled:
-                    enabled_str = " "
-                self.log.debug("[{}] {}".format(enabled_str, name))
-
-                now = time.time()
-                report[module.__class__.__name__] = now - prev_start_time
-                prev_start_time = now
+            module = self._initialize_module(modules_item)
+            if module is None:
+                continue
 
-            except Exception:
-                self.log.warning(
-                    "Initialization of module {} failed.".format(name),
-                    exc_info=True
-                )
+            now = time.time()
+            report[module.__class__.__name__] = now - prev_start_time
+            prev_start_time = now
 
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
@@ -707,7 +1093,7 @@ class ModulesManager:
         """
         return [
             module
-            for module in self.modules
+            for module in self._modules
             if module.enabled
         ]
 
@@ -942,7 +1328,7 @@ class ModulesManager:
         # Add module names to first columnt
         cols["Module name"] = list(sorted(
             module.__class__.__name__
-            for module in self.modules
+            for module in self._modules
             if module.__class__.__name__ in available_col_names
         ))
         # Add total key (as last module)
@@ -1021,6 +1407,38 @@ class ModulesManager:
         print(output)
 
 
+def get_modules_manager():
+    """Modules manager shared in the process.
+
+    Use it instead of creating new 'ModulesManager' when modules are only
+    queried. Modules settings of the manager are compared with current
+    system settings once in 'MODULES_MANAGER_SETTINGS_TTL' seconds and
+    the manager is recreated if they changed.
+
+    Returns:
+        ModulesManager: Shared modules manager.
+    """
+    with _LoadCache.manager_lock:
+        now = time.time()
+        manager = _LoadCache.modules_manager
+        if manager is None:
+            manager = ModulesManager()
+
+        elif (
+            now - _LoadCache.modules_manager_checked
+            > MODULES_MANAGER_SETTINGS_TTL
+        ):
+            system_settings = get_system_settings()
+            if system_settings["modules"] != manager._modules_settings:
+                manager = ModulesManager(system_settings)
+        else:
+            return manager
+
+        _LoadCache.modules_manager = manager
+        _LoadCache.modules_manager_checked = now
+    return manager
+
+
 class TrayModulesManager(ModulesManager):
     # Define order of modules in menu
     modules_menu_order = (
@@ -1041,9 +1459,8 @@ class TrayModulesManager(ModulesManager):
     def __init__(self):
         self.log = Logger.get_logger(self.__class__.__name__)
 
-        self.modules = []
-        self.modules_by_id = {}
-        self.modules_by_name = {}
+        self._system_settings = None
+        self._reset_modules()
         self._report = {}
 
         self.tray_manager = None
@@ -1079,7 +1496,7 @@ class TrayModulesManager(ModulesManager):
 
     def get_enabled_tray_modules(self):
         output = []
-        for module in self.modules:
+        for module in self._modules:
             if module.enabled and isinstance(module, ITrayModule):
                 output.append(module)
         return output
@@ -19,7 +19,7 @@ from openpype.pipeline import (
     legacy_io,
 )
 from openpype.pipeline.publish import OpenPypePyblishPluginMixin
-from openpype.lib import EnumDef
+from openpype.lib import EnumDef, SequenceIndex
 from openpype.tests.lib import is_in_tests
 from openpype.pipeline.farm.patterning import match_aov_pattern
 from openpype.lib import is_running_from_build
@@ -474,7 +474,9 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
         instances = []
         # go through aovs in expected files
         for aov, files in exp_files[0].items():
-            cols, rem = clique.assemble(files)
+            sequence_index = SequenceIndex(files)
+            cols = sequence_index.sequences
+            rem = sequence_index.remainders
             # we shouldn't have any reminders. And if we do, it should
             # be just one item for single frame renders.
             if not cols and rem:
@@ -625,7 +627,9 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin,
         """
         representations = []
         host_name = os.environ.get("AVALON_APP", "")
-        collections, remainders = clique.assemble(exp_files)
+        sequence_index = SequenceIndex(exp_files)
+        collections = sequence_index.sequences
+        remainders = sequence_index.remainders
 
         # create representation for every collected sequence
         for collection in collections:
@@ -3,7 +3,8 @@ import requests
 
 import pyblish.api
 
-from openpype.lib import collect_frames
+from openpype.lib import collect_frames, format_file_sequences
+from openpype.pipeline.publish import get_file_existence_index
 from openpype_modules.deadline.abstract_submit_deadline import requests_get
 
 
@@ -66,15 +67,15 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
 
             # We don't use set.difference because we do allow other existing
             # files to be in the folder that we might not want to use.
-            missing = expected_files - existing_files
+            missing = self._get_missing_files(staging_dir, expected_files)
             if missing:
                 raise RuntimeError(
                     "Missing expected files: {}\n"
                     "Expected files: {}\n"
                     "Existing files: {}".format(
-                        sorted(missing),
-                        sorted(expected_files),
-                        sorted(existing_files)
+                        format_file_sequences(missing),
+                        format_file_sequences(expected_files),
+                        format_file_sequences(existing_files)
                     )
                 )
 
@@ -186,11 +187,24 @@ class ValidateExpectedFiles(pyblish.api.InstancePlugin):
         return {}
 
     def _get_existing_files(self, staging_dir):
-        """Returns set of existing file names from 'staging_dir'"""
-        existing_files = set()
-        for file_name in os.listdir(staging_dir):
-            existing_files.add(file_name)
-        return existing_files
+        """Returns set of existing file names from 'staging_dir'
+
+        Listing of directory is shared with other plugins during publishing.
+        File names are normalized with 'os.path.normcase'.
+        """
+        existence_index = get_file_existence_index(self.instance.context)
+        return existence_index.list_dir(staging_dir)
+
+    def _get_missing_files(self, staging_dir, expected_files):
+        """Returns set of expected file names missing in 'staging_dir'"""
+        existence_index = get_file_existence_index(self.instance.context)
+        return {
+            filename
+            for filename in expected_files
+            if not existence_index.exists(
+                os.path.join(staging_dir, filename)
+            )
+        }
 
     def _get_expected_files(self, repre):
         """Returns set of file names in representation['files']
@@ -1,10 +1,12 @@
 # /usr/bin/env python3
 # -*- coding: utf-8 -*-
 import os
+import time
 import tempfile
 from datetime import datetime
 import subprocess
 import json
+import hashlib
 import platform
 import uuid
 import re
@@ -286,6 +288,135 @@ def get_requested_openpype_executable(
     return FileUtils.SearchFileList(";".join(exe_list))
 
 
+def get_environment_cache_config():
+    """Return directory and time to live of cached job environments.
+
+    Environments are cached in temp directory of the worker if directory is
+    not set in plugin configuration. Cache is disabled when time to live
+    is 0.
+
+    Returns:
+        tuple[str, int]: Cache directory and time to live in seconds.
+    """
+    config = RepositoryUtils.GetPluginConfig("OpenPype")
+    cache_dir = config.GetConfigEntryWithDefault(
+        "EnvironmentCacheDir", "").strip()
+    if not cache_dir:
+        cache_dir = os.path.join(
+            tempfile.gettempdir(), "openpype_farm_env_cache")
+
+    try:
+        ttl = int(config.GetConfigEntryWithDefault(
+            "EnvironmentCacheTTL", "86400"))
+    except ValueError:
+        ttl = 86400
+    return cache_dir, ttl
+
+
+def get_environment_cache_key(job, worker_name, exe, args):
+    """Key of job environment in cache.
+
+    Environment is resolved once per job, worker, context, application,
+    OpenPype executable and platform. Extracted environment contains also
+    environment of the worker so it can't be shared with other workers.
+    """
+    key_data = {
+        "job_id": job.JobId,
+        "worker": worker_name,
+        "executable": exe,
+        "openpype_version": job.GetJobEnvironmentKeyValue("OPENPYPE_VERSION"),
+        "platform": platform.system().lower(),
+        "args": args
+    }
+    return hashlib.sha256(
+        json.dumps(key_data, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def _get_environment_checksum(environment):
+    return hashlib.sha256(
+        json.dumps(environment, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+def load_cached_environment(cache_dir, cache_key, ttl):
+    """Load environment from cache.
+
+    Returns:
+        Union[dict[str, str], None]: Environment or None if is not cached,
+            is expired or checksum does not match.
+    """
+    cache_path = os.path.join(cache_dir, "{}.json".format(cache_key))
+    if ttl <= 0 or not os.path.exists(cache_path):
+        return None
+
+    try:
+        with open(cache_path, "r") as stream:
+            data = json.load(stream)
+    except (IOError, ValueError):
+        print(">>> Failed to read cached environment {}".format(cache_path))
+        return None
+
+    if (time.time() - data.get("created", 0)) > ttl:
+        print(">>> Cached environment is expired")
+        return None
+
+    environment = data.get("environment")
+    if (
+        not isinstance(environment, dict)
+        or _get_environment_checksum(environment) != data.get("checksum")
+    ):
+        print(">>> Checksum of cached environment does not match")
+        return None
+    return environment
+
+
+def prune_cached_environments(cache_dir, ttl):
+    """Remove expired environments from cache."""
+    min_mtime = time.time() - ttl
+    for filename in os.listdir(cache_dir):
+        if not filename.endswith((".json", ".tmp")):
+            continue
+        path = os.path.join(cache_dir, filename)
+        try:
+            if os.path.getmtime(path) < min_mtime:
+                os.remove(path)
+        except OSError:
+            # File was removed by other worker
+            pass
+
+
+def store_cached_environment(cache_dir, cache_key, ttl, environment):
+    """Store environment to cache.
+
+    Expired environments are removed from cache. Failure of storing is not
+    critical for the job.
+    """
+    if ttl <= 0:
+        return
+
+    cache_path = os.path.join(cache_dir, "{}.json".format(cache_key))
+    tmp_path = "{}.{}.tmp".format(cache_path, uuid.uuid4().hex)
+    try:
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, "w") as stream:
+            json.dump({
+                "created": time.time(),
+                "checksum": _get_environment_checksum(environment),
+                "environment": environment
+            }, stream)
+        os.replace(tmp_path, cache_path)
+        print(">>> Environment stored to cache {}".format(cache_path))
+        prune_cached_environments(cache_dir, ttl)
+
+    except Exception as exc:
+        print(">>> Failed to store environment to cache {}: {}".format(
+            cache_path, exc))
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def inject_openpype_environment(deadlinePlugin):
     """ Pull env vars from OpenPype and push them to rendering process.
 
@@ -355,25 +486,23 @@ def inject_openpype_environment(deadlinePlugin):
                 " AVALON_TASK, AVALON_APP_NAME"
             ))
 
-        if not os.environ.get("OPENPYPE_MONGO"):
-            print(">>> Missing OPENPYPE_MONGO env var, process won't work")
-
-        os.environ["AVALON_TIMEOUT"] = "5000"
-
-        args_str = subprocess.list2cmdline(args)
-        print(">>> Executing: {} {}".format(exe, args_str))
-        process_exitcode = deadlinePlugin.RunProcess(
-            exe, args_str, os.path.dirname(exe), -1
+        # Use environment resolved by previous task of the job
+        cache_dir, cache_ttl = get_environment_cache_config()
+        # Temporary export path is not part of the key
+        cache_args = [arg for arg in args if arg != export_url]
+        cache_key = get_environment_cache_key(
+            job, deadlinePlugin.GetSlaveName(), exe, cache_args
         )
-
-        if process_exitcode != 0:
-            raise RuntimeError(
-                "Failed to run OpenPype process to extract environments."
+        contents = load_cached_environment(cache_dir, cache_key, cache_ttl)
+        if contents is not None:
+            print(">>> Using cached environment {}".format(cache_key))
+        else:
+            contents = extract_environment(
+                deadlinePlugin, exe, args, export_url
+            )
+            store_cached_environment(
+                cache_dir, cache_key, cache_ttl, contents
             )
-
-        print(">>> Loading file ...")
-        with open(export_url) as fp:
-            contents = json.load(fp)
 
         for key, value in contents.items():
             deadlinePlugin.SetProcessEnvironmentVariable(key, value)
@@ -384,9 +513,6 @@ def inject_openpype_environment(deadlinePlugin):
             print(">>> Setting script path {}".format(script_url))
             job.SetJobPluginInfoKeyValue("ScriptFilename", script_url)
 
-        print(">>> Removing temporary file")
-        os.remove(export_url)
-
         print(">> Injection end.")
     except Exception as e:
         if hasattr(e, "output"):
@@ -398,6 +524,37 @@ def inject_openpype_environment(deadlinePlugin):
         raise
 
 
+def extract_environment(deadlinePlugin, exe, args, export_url):
+    """Run OpenPype process to extract environments of job context.
+
+    Returns:
+        dict[str, str]: Extracted environment.
+    """
+    if not os.environ.get("OPENPYPE_MONGO"):
+        print(">>> Missing OPENPYPE_MONGO env var, process won't work")
+
+    os.environ["AVALON_TIMEOUT"] = "5000"
+
+    args_str = subprocess.list2cmdline(args)
+    print(">>> Executing: {} {}".format(exe, args_str))
+    process_exitcode = deadlinePlugin.RunProcess(
+        exe, args_str, os.path.dirname(exe), -1
+    )
+
+    if process_exitcode != 0:
+        raise RuntimeError(
+            "Failed to run OpenPype process to extract environments."
+        )
+
+    print(">>> Loading file ...")
+    with open(export_url) as fp:
+        contents = json.load(fp)
+
+    print(">>> Removing temporary file")
+    os.remove(export_url)
+    return contents
+
+
 def inject_render_job_id(deadlinePlugin):
     """Inject dependency ids to publish process as env var for validation."""
     print(">>> Injecting render job id ...")
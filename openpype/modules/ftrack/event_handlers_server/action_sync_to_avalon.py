@@ -127,8 +127,21 @@ class SyncToAvalonServer(ServerAction):
 
         self.show_message(event, "Synchronization - Preparing data", True)
 
+        project_settings = self.get_project_settings_from_event(
+            event, project_name
+        )
+        delta_sync = (
+            project_settings
+            ["ftrack"]
+            ["events"]
+            ["sync_to_avalon"]
+            .get("delta_sync", False)
+        )
+
         try:
-            output = self.entities_factory.launch_setup(project_name)
+            output = self.entities_factory.launch_setup(
+                project_name, delta_sync
+            )
             if output is not None:
                 return output
 
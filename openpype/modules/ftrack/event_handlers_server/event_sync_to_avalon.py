@@ -12,12 +12,7 @@ from pymongo import UpdateOne
 import arrow
 import ftrack_api
 
-from openpype.client import (
-    get_project,
-    get_assets,
-    get_archived_assets,
-    get_asset_ids_with_subsets
-)
+from openpype.client import get_asset_ids_with_subsets
 from openpype.client.operations import CURRENT_ASSET_DOC_SCHEMA
 from openpype.pipeline import AvalonMongoDB, schema
 
@@ -153,67 +148,59 @@ class SyncToAvalonEvent(BaseEvent):
         return self._cust_attr_types_by_id
 
     @property
-    def avalon_entities(self):
-        if self._avalon_ents is None:
+    def avalon_entity_index(self):
+        """Index of avalon entities kept between events.
+
+        Index is loaded from database only when is outdated. Documents
+        changed by this handler are reloaded after event processing.
+        """
+        if self._avalon_entity_index is None:
             project_name = self.cur_project["full_name"]
             self.dbcon.install()
             self.dbcon.Session["AVALON_PROJECT"] = project_name
-            avalon_project = get_project(project_name)
-            avalon_entities = list(get_assets(project_name))
-            self._avalon_ents = (avalon_project, avalon_entities)
-        return self._avalon_ents
+            self._avalon_entity_index = (
+                avalon_sync.get_avalon_entity_index(project_name)
+            )
+        return self._avalon_entity_index
+
+    @property
+    def avalon_project(self):
+        return self.avalon_entity_index.project_doc
+
+    @property
+    def avalon_entities(self):
+        """Project document and list of asset documents.
+
+        List is created on each call, mappings of documents should be used
+        where possible.
+        """
+        index = self.avalon_entity_index
+        asset_docs = [
+            doc
+            for doc in index.docs_by_id.values()
+            if doc["type"] == "asset"
+        ]
+        return index.project_doc, asset_docs
 
     @property
     def avalon_ents_by_name(self):
-        if self._avalon_ents_by_name is None:
-            self._avalon_ents_by_name = {}
-            proj, ents = self.avalon_entities
-            for ent in ents:
-                self._avalon_ents_by_name[ent["name"]] = ent
-        return self._avalon_ents_by_name
+        return self.avalon_entity_index.asset_docs_by_name
 
     @property
     def avalon_ents_by_id(self):
-        if self._avalon_ents_by_id is None:
-            self._avalon_ents_by_id = {}
-            proj, ents = self.avalon_entities
-            if proj:
-                self._avalon_ents_by_id[proj["_id"]] = proj
-                for ent in ents:
-                    self._avalon_ents_by_id[ent["_id"]] = ent
-        return self._avalon_ents_by_id
+        return self.avalon_entity_index.docs_by_id
 
     @property
     def avalon_ents_by_parent_id(self):
-        if self._avalon_ents_by_parent_id is None:
-            self._avalon_ents_by_parent_id = collections.defaultdict(list)
-            proj, ents = self.avalon_entities
-            for ent in ents:
-                vis_par = ent["data"]["visualParent"]
-                if vis_par is None:
-                    vis_par = proj["_id"]
-                self._avalon_ents_by_parent_id[vis_par].append(ent)
-        return self._avalon_ents_by_parent_id
+        return self.avalon_entity_index.asset_docs_by_parent_id
 
     @property
     def avalon_ents_by_ftrack_id(self):
-        if self._avalon_ents_by_ftrack_id is None:
-            self._avalon_ents_by_ftrack_id = {}
-            proj, ents = self.avalon_entities
-            if proj:
-                ftrack_id = proj["data"].get("ftrackId")
-                if ftrack_id is None:
-                    self.handle_missing_ftrack_id(proj)
-                    ftrack_id = proj["data"]["ftrackId"]
-                self._avalon_ents_by_ftrack_id[ftrack_id] = proj
-
-                self._avalon_ents_by_ftrack_id[ftrack_id] = proj
-                for ent in ents:
-                    ftrack_id = ent["data"].get("ftrackId")
-                    if ftrack_id is None:
-                        continue
-                    self._avalon_ents_by_ftrack_id[ftrack_id] = ent
-        return self._avalon_ents_by_ftrack_id
+        index = self.avalon_entity_index
+        proj = index.project_doc
+        if proj and proj["data"].get("ftrackId") is None:
+            self.handle_missing_ftrack_id(proj)
+        return index.docs_by_ftrack_id
 
     def handle_missing_ftrack_id(self, doc):
         # TODO handling of missing ftrack id is primarily issue of editorial
@@ -233,9 +220,11 @@ class SyncToAvalonEvent(BaseEvent):
                     "data.entityType": self.cur_project.entity_type
                 }}
             )
+            self._changed_mongo_ids.add(doc["_id"])
 
             doc["data"]["ftrackId"] = ftrack_id
             doc["data"]["entityType"] = self.cur_project.entity_type
+            self.avalon_entity_index.add_doc(doc)
             self.log.info("Updated ftrack id of project \"{}\"".format(
                 self.cur_project["full_name"]
             ))
@@ -277,6 +266,7 @@ class SyncToAvalonEvent(BaseEvent):
                 "data.entityType": matching_entity.entity_type
             }}
         )
+        self._changed_mongo_ids.add(doc["_id"])
         doc["data"]["ftrackId"] = ftrack_id
         doc["data"]["entityType"] = matching_entity.entity_type
 
@@ -286,7 +276,7 @@ class SyncToAvalonEvent(BaseEvent):
         self.log.info("Updated ftrack id of entity \"{}\"".format(
             "/".join(entity_path_items)
         ))
-        self._avalon_ents_by_ftrack_id[ftrack_id] = doc
+        self.avalon_entity_index.add_doc(doc)
 
     @property
     def avalon_asset_ids_with_subsets(self):
@@ -300,12 +290,7 @@ class SyncToAvalonEvent(BaseEvent):
 
     @property
     def avalon_archived_by_id(self):
-        if self._avalon_archived_by_id is None:
-            self._avalon_archived_by_id = {}
-            project_name = self.cur_project["full_name"]
-            for asset in get_archived_assets(project_name):
-                self._avalon_archived_by_id[asset["_id"]] = asset
-        return self._avalon_archived_by_id
+        return self.avalon_entity_index.archived_docs_by_id
 
     @property
     def avalon_archived_by_name(self):
@@ -322,7 +307,7 @@ class SyncToAvalonEvent(BaseEvent):
             self._changeability_by_mongo_id = collections.defaultdict(
                 lambda: True
             )
-            avalon_project, avalon_entities = self.avalon_entities
+            avalon_project = self.avalon_project
             self._changeability_by_mongo_id[avalon_project["_id"]] = False
             self._bubble_changeability(
                 list(self.avalon_asset_ids_with_subsets)
@@ -331,47 +316,29 @@ class SyncToAvalonEvent(BaseEvent):
         return self._changeability_by_mongo_id
 
     def remove_cached_by_key(self, key, values):
-        if self._avalon_ents is None:
-            return
-
+        """Move asset documents to archived documents of index."""
         if not isinstance(values, (list, tuple)):
             values = [values]
 
-        def get_found_data(entity):
-            if not entity:
-                return None
-            return {
-                "ftrack_id": entity["data"]["ftrackId"],
-                "parent_id": entity["data"]["visualParent"],
-                "_id": entity["_id"],
-                "name": entity["name"],
-                "entity": entity
-            }
-
         if key == "id":
             key = "_id"
         elif key == "ftrack_id":
             key = "data.ftrackId"
 
-        found_data = {}
-        project, entities = self._avalon_ents
         key_items = key.split(".")
         for value in values:
             ent = None
             if key == "_id":
-                if self._avalon_ents_by_id is not None:
-                    ent = self._avalon_ents_by_id.get(value)
+                ent = self.avalon_ents_by_id.get(value)
 
             elif key == "name":
-                if self._avalon_ents_by_name is not None:
-                    ent = self._avalon_ents_by_name.get(value)
+                ent = self.avalon_ents_by_name.get(value)
 
             elif key == "data.ftrackId":
-                if self._avalon_ents_by_ftrack_id is not None:
-                    ent = self._avalon_ents_by_ftrack_id.get(value)
+                ent = self.avalon_ents_by_ftrack_id.get(value)
 
-            if ent is None:
-                for _ent in entities:
+            else:
+                for _ent in self.avalon_entities[1]:
                     _temp = _ent
                     for item in key_items:
                         _temp = _temp[item]
@@ -380,11 +347,7 @@ class SyncToAvalonEvent(BaseEvent):
                         ent = _ent
                         break
 
-            found_data[value] = get_found_data(ent)
-
-        for value in values:
-            data = found_data[value]
-            if not data:
+            if not ent:
                 # TODO logging
                 self.log.warning(
                     "Didn't found entity by key/value \"{}\" / \"{}\"".format(
@@ -393,30 +356,7 @@ class SyncToAvalonEvent(BaseEvent):
                 )
                 continue
 
-            ftrack_id = data["ftrack_id"]
-            parent_id = data["parent_id"]
-            mongo_id = data["_id"]
-            name = data["name"]
-            entity = data["entity"]
-
-            project, ents = self._avalon_ents
-            ents.remove(entity)
-            self._avalon_ents = project, ents
-
-            if self._avalon_ents_by_ftrack_id is not None:
-                self._avalon_ents_by_ftrack_id.pop(ftrack_id, None)
-
-            if self._avalon_ents_by_parent_id is not None:
-                self._avalon_ents_by_parent_id[parent_id].remove(entity)
-
-            if self._avalon_ents_by_id is not None:
-                self._avalon_ents_by_id.pop(mongo_id, None)
-
-            if self._avalon_ents_by_name is not None:
-                self._avalon_ents_by_name.pop(name, None)
-
-            if self._avalon_archived_by_id is not None:
-                self._avalon_archived_by_id[mongo_id] = entity
+            self.avalon_entity_index.archive_doc(ent["_id"])
 
     def _bubble_changeability(self, unchangeable_ids):
         unchangeable_queue = collections.deque()
@@ -468,17 +408,14 @@ class SyncToAvalonEvent(BaseEvent):
         """Reset variables so each event callback has clear env."""
         self._cur_project = None
 
+        self._avalon_entity_index = None
+        self._changed_mongo_ids = set()
+
         self._avalon_cust_attrs = None
         self._cust_attr_types_by_id = None
 
-        self._avalon_ents = None
-        self._avalon_ents_by_id = None
-        self._avalon_ents_by_parent_id = None
-        self._avalon_ents_by_ftrack_id = None
-        self._avalon_ents_by_name = None
         self._avalon_asset_ids_with_subsets = None
         self._changeability_by_mongo_id = None
-        self._avalon_archived_by_id = None
         self._avalon_archived_by_name = None
 
         self._ent_types_by_name = None
@@ -856,10 +793,24 @@ class SyncToAvalonEvent(BaseEvent):
             self.report_items["error"][msg].append((
                 str(traceback.format_exc()).replace("\n", "<br>")
             ).replace(" ", "&nbsp;"))
+            # Cached documents may not match database
+            avalon_sync.invalidate_avalon_entity_index(
+                ft_project["full_name"]
+            )
+
+        else:
+            self._update_entity_index()
 
         self.report()
         return True
 
+    def _update_entity_index(self):
+        """Reload documents changed during event processing in index."""
+        if self._avalon_entity_index is None or not self._changed_mongo_ids:
+            return
+
+        self._avalon_entity_index.update(self._changed_mongo_ids)
+
     def _get_username(self, session, event):
         username = "Unknown"
         event_source = event.get("source")
@@ -919,6 +870,7 @@ class SyncToAvalonEvent(BaseEvent):
                 {"_id": {"$in": removable_ids}, "type": "asset"},
                 {"$set": {"type": "archived_asset"}}
             )
+            self._changed_mongo_ids |= set(removable_ids)
             self.remove_cached_by_key("id", removable_ids)
 
         if recreate_ents:
@@ -936,7 +888,7 @@ class SyncToAvalonEvent(BaseEvent):
                 "Deleted entity was recreated||Entity was recreated because"
                 " it or its children contain published data"
             )
-            proj, ents = self.avalon_entities
+            proj = self.avalon_project
             for avalon_entity in recreate_ents:
                 old_ftrack_id = avalon_entity["data"]["ftrackId"]
                 vis_par = avalon_entity["data"]["visualParent"]
@@ -997,6 +949,7 @@ class SyncToAvalonEvent(BaseEvent):
 
                 new_entity_id = new_entity["id"]
                 avalon_entity["data"]["ftrackId"] = new_entity_id
+                self._changed_mongo_ids.add(avalon_entity["_id"])
 
                 for key, val in avalon_entity["data"].items():
                     if not val:
@@ -1039,14 +992,7 @@ class SyncToAvalonEvent(BaseEvent):
                 self.ftrack_recreated_mapping[old_ftrack_id] = new_entity_id
                 self.process_session.commit()
 
-                found_idx = None
-                proj_doc, asset_docs = self._avalon_ents
-                for idx, asset_doc in enumerate(asset_docs):
-                    if asset_doc["_id"] == avalon_entity["_id"]:
-                        found_idx = idx
-                        break
-
-                if found_idx is None:
+                if avalon_entity["_id"] not in self.avalon_ents_by_id:
                     continue
 
                 # Prepare updates dict for mongo update
@@ -1057,33 +1003,7 @@ class SyncToAvalonEvent(BaseEvent):
                     new_entity_id
                 )
                 # Update cached entities
-                asset_docs[found_idx] = avalon_entity
-                self._avalon_ents = proj_doc, asset_docs
-
-                if self._avalon_ents_by_id is not None:
-                    mongo_id = avalon_entity["_id"]
-                    self._avalon_ents_by_id[mongo_id] = avalon_entity
-
-                if self._avalon_ents_by_parent_id is not None:
-                    vis_par = avalon_entity["data"]["visualParent"]
-                    children = self._avalon_ents_by_parent_id[vis_par]
-                    found_idx = None
-                    for idx, _entity in enumerate(children):
-                        if _entity["_id"] == avalon_entity["_id"]:
-                            found_idx = idx
-                            break
-                    children[found_idx] = avalon_entity
-                    self._avalon_ents_by_parent_id[vis_par] = children
-
-                if self._avalon_ents_by_ftrack_id is not None:
-                    self._avalon_ents_by_ftrack_id.pop(old_ftrack_id)
-                    self._avalon_ents_by_ftrack_id[new_entity_id] = (
-                        avalon_entity
-                    )
-
-                if self._avalon_ents_by_name is not None:
-                    name = avalon_entity["name"]
-                    self._avalon_ents_by_name[name] = avalon_entity
+                self.avalon_entity_index.add_doc(avalon_entity)
 
         # Check if entities with same name can be synchronized
         if not removed_names:
@@ -1209,7 +1129,7 @@ class SyncToAvalonEvent(BaseEvent):
                 children_queue.append(child)
 
     def create_entity_in_avalon(self, ftrack_ent, parent_avalon):
-        proj, ents = self.avalon_entities
+        proj = self.avalon_project
 
         # Parents, Hierarchy
         ent_path_items = [ent["name"] for ent in ftrack_ent["link"]]
@@ -1332,6 +1252,8 @@ class SyncToAvalonEvent(BaseEvent):
             # TODO logging
             self.log.debug("Entity was synchronized <{}>".format(ent_path))
 
+        self._changed_mongo_ids.add(mongo_id)
+
         mongo_id_str = str(mongo_id)
         if mongo_id_str != ftrack_ent["custom_attributes"][CUST_ATTR_ID_KEY]:
             ftrack_ent["custom_attributes"][CUST_ATTR_ID_KEY] = mongo_id_str
@@ -1355,26 +1277,7 @@ class SyncToAvalonEvent(BaseEvent):
                 )
 
         # modify cached data
-        # Skip if self._avalon_ents is not set(maybe never happen)
-        if self._avalon_ents is None:
-            return final_entity
-
-        if self._avalon_ents is not None:
-            proj, ents = self._avalon_ents
-            ents.append(final_entity)
-            self._avalon_ents = (proj, ents)
-
-        if self._avalon_ents_by_id is not None:
-            self._avalon_ents_by_id[mongo_id] = final_entity
-
-        if self._avalon_ents_by_parent_id is not None:
-            self._avalon_ents_by_parent_id[vis_par].append(final_entity)
-
-        if self._avalon_ents_by_ftrack_id is not None:
-            self._avalon_ents_by_ftrack_id[ftrack_ent["id"]] = final_entity
-
-        if self._avalon_ents_by_name is not None:
-            self._avalon_ents_by_name[ftrack_ent["name"]] = final_entity
+        self.avalon_entity_index.add_doc(final_entity)
 
         return final_entity
 
@@ -1500,9 +1403,9 @@ class SyncToAvalonEvent(BaseEvent):
             # if avalon does not have same name then can be changed
             same_name_avalon_ent = self.avalon_ents_by_name.get(new_name)
             if not same_name_avalon_ent:
-                old_val = self._avalon_ents_by_name.pop(old_name)
+                old_val = self.avalon_ents_by_name[old_name]
                 old_val["name"] = new_name
-                self._avalon_ents_by_name[new_name] = old_val
+                self.avalon_entity_index.add_doc(old_val)
                 self.updates[mongo_id] = {"name": new_name}
                 self.renamed_in_avalon.append(mongo_id)
 
@@ -1605,51 +1508,12 @@ class SyncToAvalonEvent(BaseEvent):
                             "data.entityType": entity_type
                         }
                     })
+                    self._changed_mongo_ids.add(avalon_ent_by_name["_id"])
 
                     avalon_ent_by_name["data"]["ftrackId"] = ftrack_id
                     avalon_ent_by_name["data"]["entityType"] = entity_type
 
-                    self._avalon_ents_by_ftrack_id[ftrack_id] = (
-                        avalon_ent_by_name
-                    )
-                    if self._avalon_ents_by_parent_id:
-                        found = None
-                        for _parent_id_, _entities_ in (
-                            self._avalon_ents_by_parent_id.items()
-                        ):
-                            for _idx_, entity in enumerate(_entities_):
-                                if entity["_id"] == avalon_ent_by_name["_id"]:
-                                    found = (_parent_id_, _idx_)
-                                    break
-
-                            if found:
-                                break
-
-                        if found:
-                            _parent_id_, _idx_ = found
-                            self._avalon_ents_by_parent_id[_parent_id_][
-                                _idx_] = avalon_ent_by_name
-
-                    if self._avalon_ents_by_id:
-                        self._avalon_ents_by_id[avalon_ent_by_name["_id"]] = (
-                            avalon_ent_by_name
-                        )
-
-                    if self._avalon_ents_by_name:
-                        self._avalon_ents_by_name[name] = avalon_ent_by_name
-
-                    if self._avalon_ents:
-                        found = None
-                        project, entities = self._avalon_ents
-                        for _idx_, _ent_ in enumerate(entities):
-                            if _ent_["_id"] != avalon_ent_by_name["_id"]:
-                                continue
-                            found = _idx_
-                            break
-
-                        if found is not None:
-                            entities[found] = avalon_ent_by_name
-                            self._avalon_ents = project, entities
+                    self.avalon_entity_index.add_doc(avalon_ent_by_name)
 
                     pop_out_ents.append(ftrack_id)
                     continue
@@ -2477,6 +2341,7 @@ class SyncToAvalonEvent(BaseEvent):
             return
 
         self.dbcon.bulk_write(mongo_changes_bulk)
+        self._changed_mongo_ids |= set(self.updates.keys())
         self.updates = collections.defaultdict(dict)
 
     @property
@@ -2677,6 +2542,9 @@ class SyncToAvalonEvent(BaseEvent):
 
         if mongo_changes_bulk:
             self.dbcon.bulk_write(mongo_changes_bulk)
+            self._changed_mongo_ids |= set(
+                ftrack_mongo_mapping_found.values()
+            )
 
     def _mongo_id_configuration(
         self,
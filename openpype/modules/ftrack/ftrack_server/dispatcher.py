@@ -0,0 +1,203 @@
+import os
+import time
+import zlib
+import queue
+import threading
+
+from openpype.lib import Logger
+
+from .ftrack_server import FtrackServer
+from .lib import WorkerSession
+
+
+def get_event_workers_count():
+    """Number of workers processing events in event server processor.
+
+    Value is defined by 'OPENPYPE_FTRACK_EVENT_WORKERS' environment
+    variable. With 1 worker (default) are events processed in main session.
+    """
+    try:
+        workers_count = int(
+            os.environ.get("OPENPYPE_FTRACK_EVENT_WORKERS") or 1
+        )
+    except ValueError:
+        workers_count = 1
+    return max(workers_count, 1)
+
+
+def get_event_queue_size():
+    """Maximum number of events waiting in queue of each worker.
+
+    Value is defined by 'OPENPYPE_FTRACK_EVENT_QUEUE_SIZE' environment
+    variable.
+    """
+    try:
+        queue_size = int(
+            os.environ.get("OPENPYPE_FTRACK_EVENT_QUEUE_SIZE") or 100
+        )
+    except ValueError:
+        queue_size = 100
+    return max(queue_size, 1)
+
+
+def get_event_ordering_key(event):
+    """Key of event defining which events must be processed in order.
+
+    Events related to the same project are processed in order of their
+    arrival. Events without project information use first selected
+    entity and topic as fallback.
+
+    Args:
+        event (ftrack_api.event.base.Event): Processed event.
+
+    Returns:
+        str: Ordering key.
+    """
+    data = event.get("data") or {}
+    for entity_info in data.get("entities") or []:
+        for parent_info in entity_info.get("parents") or []:
+            project_id = parent_info.get("entityId")
+            if parent_info.get("entityType") == "show" and project_id:
+                return project_id
+
+    for selection_item in data.get("selection") or []:
+        entity_id = selection_item.get("entityId")
+        if entity_id:
+            return entity_id
+
+    return event.get("topic") or ""
+
+
+class EventWorker(threading.Thread):
+    """Thread processing events with own ftrack session and handlers."""
+
+    def __init__(self, index, handler_paths, queue_size):
+        super(EventWorker, self).__init__()
+        self.name = "EventWorker{}".format(index)
+        self.daemon = True
+
+        self.log = Logger.get_logger(self.name)
+        self.queue = queue.Queue(maxsize=queue_size)
+        self._handler_paths = handler_paths
+        self._session = None
+
+    @property
+    def handler_statistics(self):
+        if self._session is None:
+            return None
+        return self._session.event_hub.handler_statistics
+
+    def prepare(self):
+        """Create session and register event handlers."""
+        session = WorkerSession(auto_connect_event_hub=True)
+        timeout = getattr(session, "request_timeout", 60)
+        started = time.time()
+        while not session.event_hub.connected:
+            if (time.time() - started) > timeout:
+                raise RuntimeError((
+                    "Connection to Ftrack was not created in {} seconds"
+                ).format(timeout))
+            time.sleep(0.1)
+
+        server = FtrackServer(self._handler_paths)
+        server.session = session
+        server.set_files(self._handler_paths)
+        self._session = session
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                break
+
+            event, callback = item
+            try:
+                self._session.event_hub._handle(event)
+            except Exception:
+                self.log.warning(
+                    "Failed to process event \"{}\"".format(event["topic"]),
+                    exc_info=True
+                )
+
+            mongo_id = event["data"].get("_event_mongo_id")
+            if callback is not None and mongo_id is not None:
+                callback(mongo_id)
+
+        self._session.close()
+
+
+class EventDispatcher(object):
+    """Dispatch events to pool of workers.
+
+    Events with the same ordering key (project) are always processed by
+    the same worker, so their order is preserved while events of other
+    projects are processed concurrently. Each worker has bounded queue and
+    dispatch blocks when the queue is full.
+
+    Args:
+        handler_paths (list[str]): Paths to event handlers.
+        workers_count (int): Number of workers.
+        queue_size (int): Maximum number of queued events per worker.
+    """
+
+    def __init__(self, handler_paths, workers_count, queue_size=100):
+        self.log = Logger.get_logger(self.__class__.__name__)
+        self._workers = [
+            EventWorker(idx, handler_paths, queue_size)
+            for idx in range(workers_count)
+        ]
+        self._queue_size = queue_size
+
+    def start(self):
+        for worker in self._workers:
+            worker.prepare()
+            worker.start()
+        self.log.info(
+            "Started {} event workers".format(len(self._workers))
+        )
+
+    def stop(self):
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.queue.put(None)
+
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.join()
+
+    def get_statistics(self):
+        """Handler statistics of all workers.
+
+        Returns:
+            list[HandlerStatistics]: Statistics of each worker.
+        """
+        return [
+            worker.handler_statistics
+            for worker in self._workers
+            if worker.handler_statistics is not None
+        ]
+
+    def dispatch(self, event, callback=None):
+        """Add event to queue of worker.
+
+        Blocks until there is space in the queue of the worker.
+
+        Args:
+            event (ftrack_api.event.base.Event): Event to process.
+            callback (Optional[Callable[[ObjectId], None]]): Called with
+                event mongo id when event was processed.
+        """
+        key = get_event_ordering_key(event)
+        index = zlib.crc32(key.encode("utf-8")) % len(self._workers)
+        worker = self._workers[index]
+        item = (event, callback)
+        try:
+            worker.queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        self.log.warning((
+            "Queue of {} is full ({} events). Waiting for processing."
+        ).format(worker.name, self._queue_size))
+        worker.queue.put(item)
@@ -10,6 +10,7 @@ import queue
 import collections
 import appdirs
 import socket
+import functools
 
 import pymongo
 import requests
@@ -43,6 +44,92 @@ def get_host_ip():
     return None
 
 
+class HandlerStatistics(object):
+    """Thread safe timing statistics of event handlers callbacks."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def add(self, name, duration):
+        with self._lock:
+            item = self._data.get(name)
+            if item is None:
+                item = {"count": 0, "total": 0.0, "max": 0.0}
+                self._data[name] = item
+            item["count"] += 1
+            item["total"] += duration
+            item["max"] = max(item["max"], duration)
+
+    def add_data(self, name, data):
+        """Merge statistics data of a handler."""
+        with self._lock:
+            item = self._data.get(name)
+            if item is None:
+                self._data[name] = dict(data)
+                return
+            item["count"] += data["count"]
+            item["total"] += data["total"]
+            item["max"] = max(item["max"], data["max"])
+
+    def get_data(self):
+        with self._lock:
+            return {
+                name: dict(item)
+                for name, item in self._data.items()
+            }
+
+    def report(self):
+        """Statistics as text sorted by total time spent in handler."""
+        data = self.get_data()
+        lines = []
+        for name, item in sorted(
+            data.items(), key=lambda pair: pair[1]["total"], reverse=True
+        ):
+            lines.append((
+                "{}: count {} | total {:.3f}s | avg {:.3f}s | max {:.3f}s"
+            ).format(
+                name,
+                item["count"],
+                item["total"],
+                item["total"] / item["count"],
+                item["max"]
+            ))
+        return "\n".join(lines)
+
+
+def _get_callback_name(callback):
+    handler = getattr(callback, "__self__", None)
+    if handler is not None:
+        return handler.__class__.__name__
+    return getattr(callback, "__name__", str(callback))
+
+
+class HandlerTimingMixin(object):
+    """Event hub mixin measuring time spent in subscribed callbacks."""
+
+    handler_statistics = None
+
+    def subscribe(self, subscription, callback, *args, **kwargs):
+        if self.handler_statistics is None:
+            self.handler_statistics = HandlerStatistics()
+
+        statistics = self.handler_statistics
+        name = _get_callback_name(callback)
+
+        @functools.wraps(callback)
+        def timed_callback(event):
+            start = time.perf_counter()
+            try:
+                return callback(event)
+            finally:
+                statistics.add(name, time.perf_counter() - start)
+
+        return super(HandlerTimingMixin, self).subscribe(
+            subscription, timed_callback, *args, **kwargs
+        )
+
+
 class SocketBaseEventHub(ftrack_api.event.hub.EventHub):
 
     hearbeat_msg = b"hearbeat"
@@ -111,24 +198,75 @@ class StorerEventHub(SocketBaseEventHub):
         )
 
 
-class ProcessEventHub(SocketBaseEventHub):
+class ProcessEventHub(HandlerTimingMixin, SocketBaseEventHub):
+    """Event hub processing events stored in Mongo by event storer.
+
+    Stored events are consumed using mongo change stream when the server
+    supports it (replica set). Otherwise are not processed events loaded
+    with indexed query which starts from last loaded stored date
+    (watermark). Events that were handled are marked as processed in
+    batches and cleanup of old processed events is done periodically.
+    """
+
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger.get_logger("Session Processor")
 
+    # Maximum number of events loaded from database at once
+    load_limit = 100
+    # How long (in seconds) can wait for new events in change stream
+    change_stream_wait = 0.5
+    # Sleep between polls (in seconds) when change stream is not available
+    poll_interval = 0.5
+    # Processed events are acknowledged when there is more of them or
+    #   after interval (in seconds)
+    ack_batch_size = 50
+    ack_interval = 1.0
+    # Interval (in seconds) of cleanup of old processed events
+    cleanup_interval = 60 * 60
+    # Processed events older than this are removed from database
+    cleanup_age = datetime.timedelta(days=3)
+    # Interval (in seconds) of logging of handlers statistics
+    statistics_interval = 60 * 10
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        self._dispatcher = None
+        self._change_stream = None
+        self._watermark = None
+        self._catch_up_ids = set()
+        self._ack_lock = threading.Lock()
+        self._pending_ids = set()
+        self._processed_ids = []
+        self._last_ack = time.time()
+        self._last_cleanup = None
+        self._last_statistics = time.time()
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
+    def set_dispatcher(self, dispatcher):
+        """Set dispatcher which will handle events loaded from database.
+
+        Subscribers of this hub are still called for each event, but event
+        handlers are processed by dispatcher workers.
+
+        Args:
+            dispatcher (EventDispatcher): Dispatcher of events.
+        """
+        self._dispatcher = dispatcher
+
     def prepare_dbcon(self):
         try:
             database_name, collection_name = get_ftrack_event_mongo_info()
             mongo_client = OpenPypeMongoConnection.get_mongo_client()
             self.dbcon = mongo_client[database_name][collection_name]
             self.mongo_client = mongo_client
+            self._ensure_indexes()
+            self.cleanup_events()
+            self._last_cleanup = time.time()
 
         except pymongo.errors.AutoReconnect:
             self.pypelog.error((
@@ -145,6 +283,65 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+        self._open_change_stream()
+
+    def _ensure_indexes(self):
+        """Index used for loading of not processed events and cleanup."""
+        self.dbcon.create_index(
+            [
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING)
+            ],
+            background=True
+        )
+
+    def _open_change_stream(self):
+        """Try to open change stream on events collection.
+
+        Change stream is available only on replica sets, in that case are
+        events loaded using watermark query.
+        """
+        pipeline = [{
+            "$match": {
+                "operationType": {"$in": ["insert", "replace"]},
+                "fullDocument.pype_data.is_processed": False
+            }
+        }]
+        try:
+            self._change_stream = self.dbcon.watch(
+                pipeline,
+                full_document="updateLookup",
+                max_await_time_ms=int(self.change_stream_wait * 1000)
+            )
+
+        except pymongo.errors.PyMongoError:
+            self._change_stream = None
+            self.pypelog.info((
+                "Change streams are not available."
+                " Using polling of stored events."
+            ))
+            return
+
+        self.pypelog.debug("Using change stream to load stored events.")
+        # Events stored before change stream was opened are loaded with
+        #   query. Remember their ids so they're not processed twice if are
+        #   also in change stream.
+        self._catch_up_ids = set()
+        while True:
+            loaded_ids = self._load_with_query(self._catch_up_ids)
+            if not loaded_ids:
+                break
+            self._catch_up_ids |= set(loaded_ids)
+
+    def _close_change_stream(self):
+        if self._change_stream is None:
+            return
+        try:
+            self._change_stream.close()
+        except pymongo.errors.PyMongoError:
+            pass
+        self._change_stream = None
+
     def wait(self, duration=None):
         """Overridden wait
         Event are loaded from Mongo DB when queue is empty. Handled event is
@@ -154,70 +351,235 @@ class ProcessEventHub(SocketBaseEventHub):
         self.prepare_dbcon()
         while True:
             try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+                self._process_periodic_tasks()
                 try:
-                    self._handle(event)
-
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
-
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
-
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["OPENPYPE_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    # Acknowledge handled events before new are loaded
+                    self._flush_processed()
+                    if (
+                        not self.load_events()
+                        and self._change_stream is None
+                    ):
+                        time.sleep(self.poll_interval)
+                else:
+                    self._process_event(event)
+
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        self._flush_processed()
+                        break
+
+            except pymongo.errors.AutoReconnect:
+                self.pypelog.error((
+                    "Mongo server \"{}\" is not responding, exiting."
+                ).format(os.environ["OPENPYPE_MONGO"]))
+                sys.exit(0)
 
             if duration is not None:
                 if (time.time() - started) > duration:
+                    self._flush_processed()
                     break
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+    def _process_event(self, event):
+        self._handle(event)
+
+        mongo_id = event["data"].get("_event_mongo_id")
+        if mongo_id is None:
+            return
+
+        if self._dispatcher is None:
+            self.mark_processed(mongo_id)
+            return
+
+        with self._ack_lock:
+            self._pending_ids.add(mongo_id)
+        # Blocks when workers are busy, so new events are not loaded
+        self._dispatcher.dispatch(event, self.mark_processed)
+
+    def mark_processed(self, mongo_id):
+        """Mark event as handled so it can be acknowledged in database.
+
+        Can be called from dispatcher worker threads.
+
+        Args:
+            mongo_id (ObjectId): Id of event document in database.
+        """
+        with self._ack_lock:
+            self._pending_ids.discard(mongo_id)
+            self._processed_ids.append(mongo_id)
+
+    def _get_not_acked_ids(self):
+        """Ids of events which are handled or were not yet acknowledged.
+
+        Query using '$gte' watermark loads again events stored at the same
+        time as the last loaded event, so these have to be skipped.
+        """
+        with self._ack_lock:
+            return self._pending_ids | set(self._processed_ids)
+
+    def _log_statistics(self):
+        self._last_statistics = time.time()
+        statistics = [self.handler_statistics]
+        if self._dispatcher is not None:
+            statistics.extend(self._dispatcher.get_statistics())
+
+        combined = HandlerStatistics()
+        for item in statistics:
+            if item is None:
+                continue
+            for name, data in item.get_data().items():
+                combined.add_data(name, data)
+
+        report = combined.report()
+        if report:
+            self.pypelog.info("Event handlers statistics:\n{}".format(report))
+
+    def _process_periodic_tasks(self):
+        """Acknowledge processed events and cleanup database."""
+        if (time.time() - self._last_statistics) > self.statistics_interval:
+            self._log_statistics()
+
+        if (
+            len(self._processed_ids) >= self.ack_batch_size
+            or (time.time() - self._last_ack) > self.ack_interval
+        ):
+            self._flush_processed()
+
+        if (
+            self._last_cleanup is not None
+            and (time.time() - self._last_cleanup) < self.cleanup_interval
+        ):
+            return
+
+        self._last_cleanup = time.time()
+        self._flush_processed()
+        self.cleanup_events()
+        if self._change_stream is None:
+            # Reset watermark to make sure no event was missed
+            self._watermark = None
+        else:
+            # Change stream receives all stored events and watermark is
+            #   not used. Events loaded before it was opened which were not
+            #   received from it anymore are just forgotten.
+            self._catch_up_ids = set()
+
+    def _flush_processed(self):
+        """Mark handled events as processed with single query."""
+        self._last_ack = time.time()
+        if not self._processed_ids:
+            return
+
+        with self._ack_lock:
+            processed_ids = self._processed_ids
+            self._processed_ids = []
+        self.dbcon.update_many(
+            {"_id": {"$in": processed_ids}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+
+    def cleanup_events(self):
+        """Remove old processed events from database."""
+        ago_date = datetime.datetime.now() - self.cleanup_age
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
-            [("pype_data.stored", pymongo.ASCENDING)]
-        ).limit(100)
+    def load_events(self):
+        """Load not processed events sorted by stored date.
 
-        found = False
-        for event_data in not_processed_events:
-            new_event_data = {
-                k: v for k, v in event_data.items()
-                if k not in ["_id", "pype_data"]
-            }
+        Returns:
+            bool: New events were added to queue.
+        """
+        if self._change_stream is not None:
             try:
-                event = ftrack_api.event.base.Event(**new_event_data)
-                event["data"]["_event_mongo_id"] = event_data["_id"]
-            except Exception:
-                self.logger.exception(L(
-                    'Failed to convert payload into event: {0}',
-                    event_data
-                ))
+                return self._load_from_change_stream()
+
+            except pymongo.errors.AutoReconnect:
+                raise
+
+            except pymongo.errors.PyMongoError:
+                self.pypelog.warning(
+                    "Change stream failed. Using polling of stored events.",
+                    exc_info=True
+                )
+                self._close_change_stream()
+                # Make sure events stored meanwhile are loaded
+                self._watermark = None
+
+        return bool(self._load_with_query(self._get_not_acked_ids()))
+
+    def _load_from_change_stream(self):
+        found = False
+        for _ in range(self.load_limit):
+            change = self._change_stream.try_next()
+            if change is None:
+                break
+
+            event_data = change.get("fullDocument")
+            if not event_data:
+                continue
+
+            mongo_id = event_data["_id"]
+            if mongo_id in self._catch_up_ids:
+                self._catch_up_ids.discard(mongo_id)
                 continue
-            found = True
-            self._event_queue.put(event)
 
+            if self._put_stored_event(event_data):
+                found = True
         return found
 
+    def _load_with_query(self, skip_ids=None):
+        """Load not processed events stored after watermark.
+
+        Args:
+            skip_ids (Optional[set]): Mongo ids of events that should not
+                be added to queue.
+
+        Returns:
+            list: Mongo ids of events added to queue.
+        """
+        query = {"pype_data.is_processed": False}
+        if self._watermark is not None:
+            query["pype_data.stored"] = {"$gte": self._watermark}
+
+        not_processed_events = self.dbcon.find(query).sort(
+            [("pype_data.stored", pymongo.ASCENDING)]
+        ).limit(self.load_limit)
+
+        loaded_ids = []
+        for event_data in not_processed_events:
+            stored = event_data["pype_data"].get("stored")
+            if stored is not None:
+                self._watermark = stored
+
+            if skip_ids and event_data["_id"] in skip_ids:
+                continue
+
+            if self._put_stored_event(event_data):
+                loaded_ids.append(event_data["_id"])
+        return loaded_ids
+
+    def _put_stored_event(self, event_data):
+        new_event_data = {
+            k: v for k, v in event_data.items()
+            if k not in ["_id", "pype_data"]
+        }
+        try:
+            event = ftrack_api.event.base.Event(**new_event_data)
+            event["data"]["_event_mongo_id"] = event_data["_id"]
+        except Exception:
+            self.logger.exception(L(
+                'Failed to convert payload into event: {0}',
+                event_data
+            ))
+            # Mark the event as processed so it's not loaded again
+            self._processed_ids.append(event_data["_id"])
+            return False
+        self._event_queue.put(event)
+        return True
+
     def _handle_packet(self, code, packet_identifier, path, data):
         """Override `_handle_packet` which skip events and extend heartbeat"""
         code_name = self._code_name_mapping[code]
@@ -406,3 +768,30 @@ class SocketSession(CustomEventHubSession):
             self._api_key,
             sock=self.sock
         )
+
+
+class WorkerEventHub(HandlerTimingMixin, ftrack_api.event.hub.EventHub):
+    """Event hub of dispatcher worker session.
+
+    Events are not received from server but are passed by dispatcher. Hub
+    is connected to be able to publish events.
+    """
+
+    def _handle_packet(self, code, packet_identifier, path, data):
+        """Override `_handle_packet` which skip events"""
+        code_name = self._code_name_mapping[code]
+        if code_name == "event":
+            return
+
+        return super(WorkerEventHub, self)._handle_packet(
+            code, packet_identifier, path, data
+        )
+
+
+class WorkerSession(CustomEventHubSession):
+    def _create_event_hub(self):
+        return WorkerEventHub(
+            self._server_url,
+            self._api_user,
+            self._api_key
+        )
@@ -1,5 +1,9 @@
 import re
 import json
+import time
+import datetime
+import threading
+import functools
 import collections
 import copy
 import numbers
@@ -7,7 +11,9 @@ import numbers
 import six
 
 from openpype.client import (
+    OpenPypeMongoConnection,
     get_project,
+    get_project_entities_change_id,
     get_assets,
     get_archived_assets,
     get_subsets,
@@ -18,12 +24,14 @@ from openpype.client.operations import (
     CURRENT_ASSET_DOC_SCHEMA,
     CURRENT_PROJECT_SCHEMA,
     CURRENT_PROJECT_CONFIG_SCHEMA,
+    mark_project_entities_changed,
 )
 from openpype.settings import get_anatomy_settings
 from openpype.lib import ApplicationManager, Logger
 from openpype.pipeline import AvalonMongoDB, schema
 
 from .constants import CUST_ATTR_ID_KEY, FPS_KEYS
+from .settings import get_ftrack_event_mongo_info
 from .custom_attributes import get_openpype_attr, query_custom_attributes
 
 from bson.objectid import ObjectId
@@ -381,6 +389,329 @@ def get_hierarchical_attributes_values(
     return hier_values
 
 
+class AvalonEntityIndex(object):
+    """Long-lived index of project and asset documents of a project.
+
+    Index is loaded once and then updated only with documents that were
+    changed. It is considered outdated when is older than 'max_age' or
+    when counter of project entities changes stored in database changed
+    after it was loaded. Counter is increased by any process which changes
+    project entities (e.g. with 'invalidate_avalon_entity_index').
+
+    Args:
+        project_name (str): Name of project.
+    """
+
+    max_age = 10 * 60
+
+    def __init__(self, project_name):
+        self.project_name = project_name
+        self.loaded_at = None
+        self.change_id = None
+
+        self.project_doc = None
+        # Project and asset documents
+        self.docs_by_id = {}
+        self.docs_by_ftrack_id = {}
+        # Asset documents
+        self.asset_docs_by_name = {}
+        self.asset_docs_by_parent_id = collections.defaultdict(list)
+        self.archived_docs_by_id = {}
+        # Documents may be modified in place so their keys are stored
+        self._keys_by_id = {}
+
+    def is_valid(self, change_id):
+        if self.loaded_at is None or change_id != self.change_id:
+            return False
+        return (time.time() - self.loaded_at) < self.max_age
+
+    def load(self, change_id):
+        """Load all project and asset documents from database.
+
+        Args:
+            change_id (int): Counter of project entities changes before
+                documents are loaded.
+        """
+        self.loaded_at = time.time()
+        self.change_id = change_id
+        self.project_doc = None
+        self.docs_by_id = {}
+        self.docs_by_ftrack_id = {}
+        self.asset_docs_by_name = {}
+        self.asset_docs_by_parent_id = collections.defaultdict(list)
+        self.archived_docs_by_id = {}
+        self._keys_by_id = {}
+
+        project_doc = get_project(self.project_name)
+        if project_doc:
+            self._add_doc(project_doc)
+        for asset_doc in get_assets(self.project_name, archived=True):
+            self._add_doc(asset_doc)
+
+    def update(self, mongo_ids):
+        """Reload changed documents from database.
+
+        Args:
+            mongo_ids (Iterable[ObjectId]): Ids of changed project or asset
+                documents.
+        """
+        mongo_ids = set(mongo_ids)
+        if not mongo_ids:
+            return
+
+        project_doc = self.project_doc
+        update_project = project_doc is None or project_doc["_id"] in mongo_ids
+        for mongo_id in mongo_ids:
+            self.remove_doc(mongo_id)
+
+        if update_project:
+            project_doc = get_project(self.project_name)
+            if project_doc:
+                self._add_doc(project_doc)
+
+        for asset_doc in get_assets(
+            self.project_name, asset_ids=mongo_ids, archived=True
+        ):
+            self._add_doc(asset_doc)
+
+    def add_doc(self, doc):
+        """Add or replace project or asset document in mappings.
+
+        Should be called when document was changed in place.
+
+        Args:
+            doc (dict[str, Any]): Project or asset document.
+        """
+        self.remove_doc(doc["_id"])
+        self._add_doc(doc)
+
+    def remove_doc(self, mongo_id):
+        """Remove document from mappings.
+
+        Args:
+            mongo_id (ObjectId): Id of project or asset document.
+
+        Returns:
+            Union[dict[str, Any], None]: Removed document which was not
+                archived.
+        """
+        self.archived_docs_by_id.pop(mongo_id, None)
+        doc = self.docs_by_id.pop(mongo_id, None)
+        if doc is None:
+            return None
+
+        name, ftrack_id, parent_id = self._keys_by_id.pop(mongo_id)
+        if doc is self.project_doc:
+            self.project_doc = None
+
+        if self.asset_docs_by_name.get(name) is doc:
+            self.asset_docs_by_name.pop(name)
+
+        if self.docs_by_ftrack_id.get(ftrack_id) is doc:
+            self.docs_by_ftrack_id.pop(ftrack_id)
+
+        children = self.asset_docs_by_parent_id.get(parent_id) or []
+        for idx, child in enumerate(children):
+            if child is doc:
+                children.pop(idx)
+                break
+        return doc
+
+    def archive_doc(self, mongo_id):
+        """Move asset document to archived documents.
+
+        Args:
+            mongo_id (ObjectId): Id of asset document.
+        """
+        doc = self.remove_doc(mongo_id)
+        if doc is not None:
+            self.archived_docs_by_id[mongo_id] = doc
+
+    def _get_parent_id(self, asset_doc):
+        parent_id = asset_doc["data"].get("visualParent")
+        if parent_id is None and self.project_doc:
+            parent_id = self.project_doc["_id"]
+        return parent_id
+
+    def _add_doc(self, doc):
+        mongo_id = doc["_id"]
+        doc_type = doc["type"]
+        if doc_type not in ("project", "asset"):
+            self.archived_docs_by_id[mongo_id] = doc
+            return
+
+        name = parent_id = None
+        ftrack_id = doc["data"].get("ftrackId")
+        if doc_type == "project":
+            self.project_doc = doc
+        else:
+            name = doc["name"]
+            parent_id = self._get_parent_id(doc)
+            self.asset_docs_by_name[name] = doc
+            self.asset_docs_by_parent_id[parent_id].append(doc)
+
+        self.docs_by_id[mongo_id] = doc
+        if ftrack_id is not None:
+            self.docs_by_ftrack_id[ftrack_id] = doc
+        self._keys_by_id[mongo_id] = (name, ftrack_id, parent_id)
+
+
+_avalon_entity_indexes = {}
+_avalon_entity_index_lock = threading.Lock()
+
+
+def get_avalon_entity_index(project_name):
+    """Valid index of avalon entities for a project.
+
+    Index is loaded from database only if it does not exist yet or is
+    outdated. Counter of project entities changes is compared on each call.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        AvalonEntityIndex: Index of project entities.
+    """
+    # Counter is queried before documents are loaded so changes made during
+    #   loading cause reload on next call
+    change_id = get_project_entities_change_id(project_name)
+    with _avalon_entity_index_lock:
+        index = _avalon_entity_indexes.get(project_name)
+        if index is None:
+            index = AvalonEntityIndex(project_name)
+            _avalon_entity_indexes[project_name] = index
+
+    if not index.is_valid(change_id):
+        index.load(change_id)
+    return index
+
+
+def invalidate_avalon_entity_index(project_name):
+    """Mark index of avalon entities of a project as outdated.
+
+    Should be called when project entities were changed in other way than
+    through the index. Change is stored to database so indexes in all
+    processes are reloaded.
+
+    Args:
+        project_name (str): Name of project.
+    """
+    mark_project_entities_changed(project_name)
+
+
+SYNC_STATE_COLLECTION_NAME = "ftrack_sync_state"
+
+
+def _get_openpype_collection(collection_name):
+    database_name, _ = get_ftrack_event_mongo_info()
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    return mongo_client[database_name][collection_name]
+
+
+def get_last_sync_time(project_name):
+    """Start time of last successful synchronization of a project.
+
+    Args:
+        project_name (str): Name of project.
+
+    Returns:
+        Union[datetime.datetime, None]: UTC time or None if project was not
+            synchronized yet.
+    """
+    collection = _get_openpype_collection(SYNC_STATE_COLLECTION_NAME)
+    doc = collection.find_one({"project_name": project_name})
+    if doc:
+        return doc.get("last_sync")
+    return None
+
+
+def set_last_sync_time(project_name, sync_time):
+    collection = _get_openpype_collection(SYNC_STATE_COLLECTION_NAME)
+    collection.update_one(
+        {"project_name": project_name},
+        {"$set": {"last_sync": sync_time}},
+        upsert=True
+    )
+
+
+def get_changed_ftrack_ids(project_id, since):
+    """Ids of ftrack entities changed in a project since passed time.
+
+    Changes are collected from ftrack events stored by event server. Result
+    is not available when stored events don't cover whole time range, which
+    happens when events were already cleaned up or when event storer was
+    restarted meanwhile.
+
+    Args:
+        project_id (str): Ftrack project id.
+        since (datetime.datetime): UTC time from which changes are collected.
+
+    Returns:
+        Union[set[str], None]: Ftrack ids of changed entities or None when
+            changes can't be resolved.
+    """
+    _, collection_name = get_ftrack_event_mongo_info()
+    collection = _get_openpype_collection(collection_name)
+    older_event = collection.find_one(
+        {"pype_data.stored": {"$lte": since}},
+        {"_id": True}
+    )
+    if older_event is None:
+        return None
+
+    storer_restart = collection.find_one(
+        {
+            "topic": "openpype.storer.started",
+            "pype_data.stored": {"$gt": since}
+        },
+        {"_id": True}
+    )
+    if storer_restart is not None:
+        return None
+
+    changed_ids = set()
+    events = collection.find(
+        {
+            "topic": "ftrack.update",
+            "pype_data.stored": {"$gt": since}
+        },
+        {"data.entities": True}
+    )
+    for event in events:
+        for entity_info in event["data"].get("entities") or []:
+            parent_ids = set()
+            for parent_info in entity_info.get("parents") or []:
+                parent_ids.add(parent_info.get("entityId"))
+
+            if project_id not in parent_ids:
+                continue
+
+            entity_id = entity_info.get("entityId")
+            if isinstance(entity_id, list):
+                changed_ids |= set(entity_id)
+            elif entity_id:
+                changed_ids.add(entity_id)
+
+            # Task changes are stored on parent entity
+            if entity_info.get("entityType") == "task":
+                parent_id = entity_info.get("parentId")
+                if parent_id:
+                    changed_ids.add(parent_id)
+    return changed_ids
+
+
+def sync_phase(func):
+    """Decorator storing duration of synchronization phase."""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        start = time.time()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            self.phase_times[func.__name__] = time.time() - start
+    return wrapper
+
+
 class SyncEntitiesFactory:
     dbcon = AvalonMongoDB()
 
@@ -413,8 +744,23 @@ class SyncEntitiesFactory:
         self._server_url = session.server_url
         self._api_key = session.api_key
         self._api_user = session.api_user
+        self.phase_times = collections.OrderedDict()
+        self.delta_ftrack_ids = None
+
+    @sync_phase
+    def launch_setup(self, project_full_name, delta=False):
+        """Prepare synchronization of a project.
+
+        Args:
+            project_full_name (str): Name of synchronized project.
+            delta (bool): Query custom attribute values and update only
+                entities changed since last successful synchronization. Full
+                synchronization is used if changes can't be resolved.
+        """
+        self.phase_times = collections.OrderedDict()
+        self.sync_started = datetime.datetime.utcnow()
+        self.delta_ftrack_ids = None
 
-    def launch_setup(self, project_full_name):
         try:
             self.session.close()
         except Exception:
@@ -579,6 +925,111 @@ class SyncEntitiesFactory:
         self.ft_project_id = ft_project_id
         self.entities_dict = entities_dict
 
+        if delta:
+            self.delta_ftrack_ids = self._prepare_delta_ftrack_ids(
+                project_full_name
+            )
+
+    def _prepare_delta_ftrack_ids(self, project_name):
+        """Ftrack ids of entities which should be synchronized in delta mode.
+
+        Returns:
+            Union[set[str], None]: Ftrack ids of changed entities with their
+                children or None if full synchronization should happen.
+        """
+        last_sync = get_last_sync_time(project_name)
+        changed_ids = None
+        if last_sync is not None:
+            changed_ids = get_changed_ftrack_ids(self.ft_project_id, last_sync)
+
+        if changed_ids is None:
+            self.log.info((
+                "Changes since last synchronization can't be resolved."
+                " Using full synchronization."
+            ))
+            return None
+
+        # Entities which are not in avalon yet
+        synced_ftrack_ids = {
+            asset_doc["data"].get("ftrackId")
+            for asset_doc in get_assets(
+                project_name, fields=["data.ftrackId"]
+            )
+        }
+        for ftrack_id, entity_dict in self.entities_dict.items():
+            if entity_dict["entity"] is None:
+                continue
+            if ftrack_id not in synced_ftrack_ids:
+                changed_ids.add(ftrack_id)
+
+        # Children may inherit hierarchical values of changed entities
+        delta_ids = {self.ft_project_id}
+        children_queue = collections.deque(
+            ftrack_id
+            for ftrack_id in changed_ids
+            if ftrack_id in self.entities_dict
+        )
+        while children_queue:
+            ftrack_id = children_queue.popleft()
+            if ftrack_id in delta_ids:
+                continue
+            delta_ids.add(ftrack_id)
+            children_queue.extend(self.entities_dict[ftrack_id]["children"])
+
+        self.log.debug("Delta synchronization of {} entities".format(
+            len(delta_ids)
+        ))
+        return delta_ids
+
+    def _get_delta_ancestor_ids(self):
+        """Delta ftrack ids with ids of all their parents."""
+        output = set()
+        for ftrack_id in self.delta_ftrack_ids:
+            while ftrack_id and ftrack_id not in output:
+                output.add(ftrack_id)
+                ftrack_id = self.entities_dict[ftrack_id]["parent_id"]
+        return output
+
+    def _query_attribute_values(self, attribute_key_by_id, entity_ids, hier):
+        """Query custom attribute values.
+
+        In delta mode are values of attributes with 'avalon_' prefix queried
+        for all entities (they're used to match avalon entities) and other
+        values only for changed entities.
+        """
+        only_set_values = hier
+        if self.delta_ftrack_ids is None:
+            return query_custom_attributes(
+                self.session,
+                list(attribute_key_by_id.keys()),
+                entity_ids,
+                only_set_values
+            )
+
+        avalon_attr_ids = []
+        attr_ids = []
+        for attr_id, key in attribute_key_by_id.items():
+            if key.startswith("avalon_"):
+                avalon_attr_ids.append(attr_id)
+            else:
+                attr_ids.append(attr_id)
+
+        if hier:
+            delta_ids = self._get_delta_ancestor_ids()
+        else:
+            delta_ids = self.delta_ftrack_ids
+
+        output = query_custom_attributes(
+            self.session, avalon_attr_ids, entity_ids, only_set_values
+        )
+        output.extend(query_custom_attributes(
+            self.session,
+            attr_ids,
+            [entity_id for entity_id in entity_ids if entity_id in delta_ids],
+            only_set_values
+        ))
+        return output
+
     @property
     def project_name(self):
         return self.entities_dict[self.ft_project_id]["name"]
@@ -779,6 +1230,7 @@ class SyncEntitiesFactory:
             )
         ]
 
+    @sync_phase
     def duplicity_regex_check(self):
         self.log.debug("* Checking duplicities and invalid symbols")
         # Duplicity and regex check
@@ -872,6 +1324,7 @@ class SyncEntitiesFactory:
                     "/".join([ent_path, name])
                 ))
 
+    @sync_phase
     def filter_by_ignore_sync(self):
         # skip filtering if `ignore_sync` attribute do not exist
         if self.entities_dict[self.ft_project_id]["avalon_attrs"].get(
@@ -962,6 +1415,7 @@ class SyncEntitiesFactory:
 
             self.entities_dict[parent_id]["children"].remove(ftrack_id)
 
+    @sync_phase
     def set_cutom_attributes(self):
         self.log.debug("* Preparing custom attributes")
         # Get custom attributes and values
@@ -1068,10 +1522,8 @@ class SyncEntitiesFactory:
                     copy.deepcopy(prepared_avalon_attr_ca_id)
                 )
 
-        items = query_custom_attributes(
-            self.session,
-            list(attribute_key_by_id.keys()),
-            sync_ids
+        items = self._query_attribute_values(
+            attribute_key_by_id, sync_ids, False
         )
 
         invalid_fps_items = []
@@ -1180,11 +1632,8 @@ class SyncEntitiesFactory:
             for key, val in prepare_dict_avalon.items():
                 entity_dict["avalon_attrs"][key] = val
 
-        items = query_custom_attributes(
-            self.session,
-            list(attribute_key_by_id.keys()),
-            sync_ids,
-            True
+        items = self._query_attribute_values(
+            attribute_key_by_id, sync_ids, True
         )
 
         invalid_fps_items = []
@@ -1323,6 +1772,7 @@ class SyncEntitiesFactory:
             mapping_by_to_id[to_id].add(from_id)
         return mapping_by_to_id
 
+    @sync_phase
     def prepare_ftrack_ent_data(self):
         not_set_ids = []
         for ftrack_id, entity_dict in self.entities_dict.items():
@@ -1420,6 +1870,7 @@ class SyncEntitiesFactory:
 
         return ent_path
 
+    @sync_phase
     def prepare_avalon_entities(self, ft_project_name):
         self.log.debug((
             "* Preparing avalon entities "
@@ -1560,6 +2011,14 @@ class SyncEntitiesFactory:
             av_ent_path_items.append(av_ent["name"])
             self.log.debug("Deleted <{}>".format("/".join(av_ent_path_items)))
 
+        if self.delta_ftrack_ids is not None:
+            # Values of other entities were not queried
+            update_ftrack_ids = [
+                ftrack_id
+                for ftrack_id in update_ftrack_ids
+                if ftrack_id in self.delta_ftrack_ids
+            ]
+
         self.ftrack_avalon_mapper = ftrack_avalon_mapper
         self.avalon_ftrack_mapper = avalon_ftrack_mapper
         self.create_ftrack_ids = create_ftrack_ids
@@ -1964,6 +2423,7 @@ class SyncEntitiesFactory:
                     self.updates[avalon_id]["data"] = {}
                 self.updates[avalon_id]["data"]["tasks"] = final_doc_tasks
 
+    @sync_phase
     def synchronize(self):
         self.log.debug("* Synchronization begins")
         avalon_project_id = self.ftrack_avalon_mapper.get(self.ft_project_id)
@@ -2017,6 +2477,8 @@ class SyncEntitiesFactory:
         self.prepare_changes()
         self.update_entities()
         self.session.commit()
+        invalidate_avalon_entity_index(self.project_name)
+        set_last_sync_time(self.project_name, self.sync_started)
 
     def create_avalon_entity(self, ftrack_id):
         if ftrack_id == self.ft_project_id:
@@ -2801,6 +3263,28 @@ class SyncEntitiesFactory:
 
             items.extend(subitems)
 
+        if self.phase_times:
+            mode = "delta"
+            if self.delta_ftrack_ids is None:
+                mode = "full"
+            phase_lines = [
+                "{}: {:.2f}s".format(phase_name, duration)
+                for phase_name, duration in self.phase_times.items()
+            ]
+            phase_lines.append(
+                "total: {:.2f}s".format(sum(self.phase_times.values()))
+            )
+            if items:
+                items.append(self.report_splitter)
+            items.append({
+                "type": "label",
+                "value": "# Synchronization phases ({} mode)".format(mode)
+            })
+            items.append({
+                "type": "label",
+                "value": "<p>{}</p>".format("<br>".join(phase_lines))
+            })
+
         return {
             "items": items,
             "title": title,
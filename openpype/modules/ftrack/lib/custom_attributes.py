@@ -3,6 +3,11 @@ import json
 
 from .constants import CUST_ATTR_GROUP
 
+# Maximum number of ids in one 'in (...)' condition of value queries
+CUST_ATTR_QUERY_CHUNK_SIZE = 500
+# Maximum number of values queried at once
+CUST_ATTR_QUERY_MAX_VALUES = 5000
+
 
 def default_custom_attributes_definition():
     json_file_path = os.path.join(
@@ -120,28 +125,36 @@ def query_custom_attributes(
     else:
         table_name = "ContextCustomAttributeValue"
 
-    # Prepare values to query
-    attributes_joined = join_query_keys(conf_ids)
-    attributes_len = len(conf_ids)
-
-    # Query values in chunks
-    chunk_size = int(5000 / attributes_len)
-    # Make sure entity_ids is `list` for chunk selection
+    # Query values in chunks with bounded number of items in 'in (...)'
+    #   conditions and bounded number of queried values
+    conf_ids = list(conf_ids)
     entity_ids = list(entity_ids)
-    for idx in range(0, len(entity_ids), chunk_size):
-        entity_ids_joined = join_query_keys(
-            entity_ids[idx:idx + chunk_size]
+    conf_chunk_size = min(len(conf_ids), CUST_ATTR_QUERY_CHUNK_SIZE)
+    entity_chunk_size = max(
+        1,
+        min(
+            CUST_ATTR_QUERY_CHUNK_SIZE,
+            int(CUST_ATTR_QUERY_MAX_VALUES / conf_chunk_size)
         )
-        output.extend(
-            session.query(
-                (
-                    "select value, entity_id, configuration_id from {}"
-                    " where entity_id in ({}) and configuration_id in ({})"
-                ).format(
-                    table_name,
-                    entity_ids_joined,
-                    attributes_joined
-                )
-            ).all()
+    )
+    for conf_idx in range(0, len(conf_ids), conf_chunk_size):
+        attributes_joined = join_query_keys(
+            conf_ids[conf_idx:conf_idx + conf_chunk_size]
         )
+        for idx in range(0, len(entity_ids), entity_chunk_size):
+            entity_ids_joined = join_query_keys(
+                entity_ids[idx:idx + entity_chunk_size]
+            )
+            output.extend(
+                session.query(
+                    (
+                        "select value, entity_id, configuration_id from {}"
+                        " where entity_id in ({}) and configuration_id in ({})"
+                    ).format(
+                        table_name,
+                        entity_ids_joined,
+                        attributes_joined
+                    )
+                ).all()
+            )
     return output
@@ -12,6 +12,11 @@ from openpype_modules.ftrack.ftrack_server.lib import (
     ProcessEventHub,
     TOPIC_STATUS_SERVER
 )
+from openpype_modules.ftrack.ftrack_server.dispatcher import (
+    EventDispatcher,
+    get_event_workers_count,
+    get_event_queue_size,
+)
 from openpype.modules import ModulesManager
 
 from openpype.lib import (
@@ -79,6 +84,7 @@ def main(args):
     sock.sendall(b"CreatedProcess")
 
     returncode = 0
+    dispatcher = None
     try:
         session = SocketSession(
             auto_connect_event_hub=True, sock=sock, Eventhub=ProcessEventHub
@@ -88,17 +94,33 @@ def main(args):
 
         manager = ModulesManager()
         ftrack_module = manager.modules_by_name["ftrack"]
-        server = FtrackServer(
-            ftrack_module.server_event_handlers_paths
-        )
-        log.debug("Launched Ftrack Event processor")
-        server.run_server(session)
+        handler_paths = ftrack_module.server_event_handlers_paths
+        workers_count = get_event_workers_count()
+        if workers_count > 1:
+            # Event handlers are registered only in worker sessions
+            dispatcher = EventDispatcher(
+                handler_paths, workers_count, get_event_queue_size()
+            )
+            dispatcher.start()
+            session.event_hub.set_dispatcher(dispatcher)
+            server = FtrackServer()
+            log.debug((
+                "Launched Ftrack Event processor with {} workers"
+            ).format(workers_count))
+            server.run_server(session, load_files=False)
+
+        else:
+            server = FtrackServer(handler_paths)
+            log.debug("Launched Ftrack Event processor")
+            server.run_server(session)
 
     except Exception:
         returncode = 1
         log.error("Event server crashed. See traceback below", exc_info=True)
 
     finally:
+        if dispatcher is not None:
+            dispatcher.stop()
         log.debug("First closing socket")
         sock.close()
         return returncode
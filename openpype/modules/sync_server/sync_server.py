@@ -7,7 +7,11 @@ from time import sleep
 
 from .providers import lib
 from openpype.client.entity_links import get_linked_representation_id
-from openpype.lib import Logger
+from openpype.lib import (
+    Logger,
+    is_source_content_hash,
+    validate_source_content_hash,
+)
 from openpype.lib.local_settings import get_local_site_id
 from openpype.modules.base import ModulesManager
 from openpype.pipeline import Anatomy
@@ -137,6 +141,23 @@ async def download(module, project_name, file, representation, provider_name,
                                          True
                                          )
 
+    # Verify content of downloaded file if file has content based hash
+    file_hash = file.get("hash")
+    if (
+        file_hash
+        and is_source_content_hash(file_hash)
+        and os.path.isfile(local_file_path)
+    ):
+        is_valid = await loop.run_in_executor(None,
+                                              validate_source_content_hash,
+                                              local_file_path,
+                                              file_hash)
+        if not is_valid:
+            raise ValueError(
+                "Content of downloaded file does not match hash: {}".format(
+                    local_file_path)
+            )
+
     module.handle_alternate_site(project_name, representation, local_site,
                                  file["_id"], file_id)
 
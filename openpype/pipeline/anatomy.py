@@ -24,7 +24,7 @@ from openpype.lib.path_templates import (
     FormatObject,
 )
 from openpype.lib.log import Logger
-from openpype.modules import ModulesManager
+from openpype.modules import get_modules_manager
 
 log = Logger.get_logger(__name__)
 
@@ -450,7 +450,7 @@ class Anatomy(BaseAnatomy):
     @classmethod
     def get_sync_server_addon(cls):
         if cls._sync_server_addon_cache.is_outdated:
-            manager = ModulesManager()
+            manager = get_modules_manager()
             cls._sync_server_addon_cache.update_data(
                 manager.get_enabled_module("sync_server")
             )
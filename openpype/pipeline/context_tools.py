@@ -19,7 +19,7 @@ from openpype.client import (
     version_is_latest,
 )
 from openpype.lib.events import emit_event
-from openpype.modules import load_modules, ModulesManager
+from openpype.modules import load_modules, get_modules_manager
 from openpype.settings import get_project_settings
 
 from .publish.lib import filter_pyblish_plugins
@@ -71,7 +71,7 @@ def _get_modules_manager():
 
     global _modules_manager
     if _modules_manager is None:
-        _modules_manager = ModulesManager()
+        _modules_manager = get_modules_manager()
     return _modules_manager
 
 
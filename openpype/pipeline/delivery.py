@@ -1,17 +1,32 @@
 """Functions useful for delivery of published representations."""
 import os
+import sys
 import copy
+import json
+import time
+import uuid
+import errno
 import shutil
-import glob
+import fnmatch
+import hashlib
+import logging
+import threading
 import clique
 import collections
 
-from openpype.lib import create_hard_link
+import six
+import appdirs
+from six.moves import queue
 
+from openpype.lib import create_hard_link, create_file_clone
 
 def _copy_file(src_path, dst_path):
     """Hardlink file if possible(to save space), copy if not.
 
+    Reflink is used instead of copy on filesystems supporting it. Copied
+    file is written to temporary path first so existing destination file
+    is always complete.
+
     Because of using hardlinks should not be function used in other parts
     of pipeline.
     """
@@ -23,8 +38,252 @@ def _copy_file(src_path, dst_path):
             src_path,
             dst_path
         )
+        return
     except OSError:
-        shutil.copyfile(src_path, dst_path)
+        pass
+
+    tmp_path = "{}.{}.tmp".format(dst_path, uuid.uuid4().hex)
+    try:
+        if not create_file_clone(src_path, tmp_path):
+            shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _make_dirs(dir_path):
+    try:
+        os.makedirs(dir_path)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            six.reraise(*sys.exc_info())
+
+
+def get_delivery_max_workers():
+    """Maximum number of concurrent file transfers of delivery.
+
+    Value is defined by 'OPENPYPE_DELIVERY_MAX_WORKERS' environment
+    variable. Default is 8 as transfers are limited by I/O.
+    """
+    try:
+        max_workers = int(
+            os.environ.get("OPENPYPE_DELIVERY_MAX_WORKERS") or 0
+        )
+    except ValueError:
+        max_workers = 0
+
+    if max_workers < 1:
+        max_workers = 8
+    return max_workers
+
+
+class DeliveryTransfers(object):
+    """Planned file transfers of delivery.
+
+    Delivery functions add source and destination pairs instead of copying
+    files when object is passed to them. All transfers are then processed
+    concurrently by 'process'.
+
+    Finished transfers are written to manifest file. When delivery is
+    interrupted, transfers stored in manifest are skipped on next delivery
+    of the same files. Manifest is removed when all transfers finished.
+
+    Args:
+        max_workers (Optional[int]): Maximum number of concurrent
+            transfers. Value from 'get_delivery_max_workers' is used if
+            not passed.
+        manifest_path (Optional[str]): Path to manifest file. Path in user
+            data directory based on transfers is used if not passed.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    def __init__(self, max_workers=None, manifest_path=None, log=None):
+        if not max_workers or max_workers < 1:
+            max_workers = get_delivery_max_workers()
+
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+
+        self.log = log
+        self._max_workers = max_workers
+        self._manifest_path = manifest_path
+        self._transfers = collections.OrderedDict()
+        self._dir_listings = {}
+
+    def __len__(self):
+        return len(self._transfers)
+
+    @property
+    def transfers(self):
+        """List of source and destination paths pairs."""
+        return [
+            (src_path, dst_path)
+            for dst_path, src_path in self._transfers.items()
+        ]
+
+    def add(self, src_path, dst_path):
+        """Add file transfer.
+
+        Args:
+            src_path (str): Source file path.
+            dst_path (str): Destination file path.
+        """
+        self._transfers[dst_path] = src_path
+
+    def list_dir(self, dir_path):
+        """Filenames in directory.
+
+        Each directory is listed only once.
+
+        Returns:
+            Union[list[str], None]: Filenames or None if directory does not
+                exist.
+        """
+        dir_path = os.path.normpath(dir_path)
+        if dir_path not in self._dir_listings:
+            try:
+                listing = os.listdir(dir_path)
+            except OSError:
+                listing = None
+            self._dir_listings[dir_path] = listing
+        return self._dir_listings[dir_path]
+
+    def get_manifest_path(self):
+        if self._manifest_path:
+            return self._manifest_path
+
+        transfers_hash = hashlib.sha256(
+            json.dumps(self.transfers).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(
+            appdirs.user_data_dir("openpype", "pypeclub"),
+            "delivery_manifests",
+            "{}.jsonl".format(transfers_hash)
+        )
+
+    def _load_manifest(self, manifest_path):
+        """Destination paths of finished transfers from manifest."""
+        finished = set()
+        if not os.path.exists(manifest_path):
+            return finished
+
+        with open(manifest_path, "r") as stream:
+            for line in stream:
+                try:
+                    item = json.loads(line)
+                except ValueError:
+                    # Last line may be incomplete
+                    continue
+                dst_path = item["dst"]
+                if (
+                    os.path.exists(dst_path)
+                    and os.path.getsize(dst_path) == item["size"]
+                ):
+                    finished.add(dst_path)
+        return finished
+
+    def process(self, progress_callback=None):
+        """Process all transfers.
+
+        Args:
+            progress_callback (Optional[Callable[[int, int, int], None]]):
+                Called with number of processed transfers, number of all
+                transfers and transferred size in bytes after each
+                transfer. Callback is called in thread of this method.
+
+        Returns:
+            dict[str, Any]: Statistics of delivery with keys "count",
+                "skipped", "size", "duration" and "errors". Errors are
+                tuples of source, destination and error message.
+        """
+        start_time = time.time()
+        manifest_path = self.get_manifest_path()
+        _make_dirs(os.path.dirname(manifest_path))
+        finished = self._load_manifest(manifest_path)
+        if finished:
+            self.log.info((
+                "Skipping {} transfers finished by previous delivery"
+            ).format(len(finished)))
+
+        transfers = [
+            (src_path, dst_path)
+            for src_path, dst_path in self.transfers
+            if dst_path not in finished
+        ]
+        all_count = len(self._transfers)
+        output = {
+            "count": 0,
+            "skipped": len(self._transfers) - len(transfers),
+            "size": 0,
+            "duration": 0.0,
+            "errors": []
+        }
+        processed_count = output["skipped"]
+        if progress_callback is not None:
+            progress_callback(processed_count, all_count, 0)
+
+        transfers_queue = queue.Queue()
+        results_queue = queue.Queue()
+        for transfer in transfers:
+            transfers_queue.put(transfer)
+
+        manifest_lock = threading.Lock()
+
+        def _worker():
+            while True:
+                try:
+                    src_path, dst_path = transfers_queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    _make_dirs(os.path.dirname(dst_path))
+                    self.log.debug("Copying single: {} -> {}".format(
+                        src_path, dst_path
+                    ))
+                    _copy_file(src_path, dst_path)
+                    size = os.path.getsize(dst_path)
+                    with manifest_lock:
+                        with open(manifest_path, "a") as stream:
+                            stream.write(json.dumps(
+                                {"dst": dst_path, "size": size}
+                            ) + "\n")
+                    results_queue.put((src_path, dst_path, size, None))
+
+                except Exception as exc:
+                    results_queue.put((src_path, dst_path, 0, str(exc)))
+
+        workers = []
+        for _ in range(min(self._max_workers, len(transfers))):
+            worker = threading.Thread(target=_worker)
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        for _ in range(len(transfers)):
+            src_path, dst_path, size, error = results_queue.get()
+            processed_count += 1
+            if error is None:
+                output["count"] += 1
+                output["size"] += size
+            else:
+                self.log.warning("Failed to copy {} -> {}: {}".format(
+                    src_path, dst_path, error
+                ))
+                output["errors"].append((src_path, dst_path, error))
+
+            if progress_callback is not None:
+                progress_callback(processed_count, all_count, output["size"])
+
+        for worker in workers:
+            worker.join()
+
+        if not output["errors"] and os.path.exists(manifest_path):
+            os.remove(manifest_path)
+
+        output["duration"] = time.time() - start_time
+        return output
 
 
 def get_format_dict(anatomy, location_path):
@@ -120,7 +379,8 @@ def deliver_single_file(
     anatomy_data,
     format_dict,
     report_items,
-    log
+    log,
+    transfers=None
 ):
     """Copy single file to calculated path based on template
 
@@ -134,6 +394,8 @@ def deliver_single_file(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        transfers (Optional[DeliveryTransfers]): file is added to transfers
+            instead of copying when passed
 
     Returns:
         (collections.defaultdict, int)
@@ -160,6 +422,10 @@ def deliver_single_file(
     # Remove newlines from the end of the string to avoid OSError during copy
     delivery_path = delivery_path.rstrip()
 
+    if transfers is not None:
+        transfers.add(src_path, delivery_path)
+        return report_items, 1
+
     delivery_folder = os.path.dirname(delivery_path)
     if not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
@@ -178,7 +444,8 @@ def deliver_sequence(
     anatomy_data,
     format_dict,
     report_items,
-    log
+    log,
+    transfers=None
 ):
     """ For Pype2(mainly - works in 3 too) where representation might not
         contain files.
@@ -198,19 +465,30 @@ def deliver_sequence(
         format_dict (dict): root dictionary with names and values
         report_items (collections.defaultdict): to return error messages
         log (logging.Logger): for log printing
+        transfers (Optional[DeliveryTransfers]): files are added to transfers
+            instead of copying when passed
 
     Returns:
         (collections.defaultdict, int)
     """
 
     src_path = os.path.normpath(src_path.replace("\\", "/"))
+    dir_path, file_name = os.path.split(str(src_path))
+
+    # Source directory is listed only once
+    if transfers is not None:
+        dir_filenames = transfers.list_dir(dir_path)
+    else:
+        try:
+            dir_filenames = os.listdir(dir_path)
+        except OSError:
+            dir_filenames = None
 
     def hash_path_exist(myPath):
-        res = myPath.replace('#', '*')
-        glob_search_results = glob.glob(res)
-        if len(glob_search_results) > 0:
-            return True
-        return False
+        if not dir_filenames:
+            return False
+        pattern = os.path.basename(myPath).replace('#', '*')
+        return bool(fnmatch.filter(dir_filenames, pattern))
 
     if not hash_path_exist(src_path):
         msg = "{} doesn't exist for {}".format(
@@ -239,8 +517,6 @@ def deliver_sequence(
         report_items[""].append(msg)
         return report_items, 0
 
-    dir_path, file_name = os.path.split(str(src_path))
-
     context = repre["context"]
     ext = context.get("ext", context.get("representation"))
 
@@ -254,7 +530,7 @@ def deliver_sequence(
     # context.representation could be .psd
     ext = ext.replace("..", ".")
 
-    src_collections, remainder = clique.assemble(os.listdir(dir_path))
+    src_collections, remainder = clique.assemble(dir_filenames)
     src_collection = None
     for col in src_collections:
         if col.tail != ext:
@@ -288,7 +564,7 @@ def deliver_sequence(
         padding=dst_padding
     )
 
-    if not os.path.exists(delivery_folder):
+    if transfers is None and not os.path.exists(delivery_folder):
         os.makedirs(delivery_folder)
 
     src_head = src_collection.head
@@ -303,8 +579,11 @@ def deliver_sequence(
 
         dst_padding = dst_collection.format("{padding}") % index
         dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
+        uploaded += 1
+        if transfers is not None:
+            transfers.add(src, dst)
+            continue
         log.debug("Copying single: {} -> {}".format(src, dst))
         _copy_file(src, dst)
-        uploaded += 1
 
     return report_items, uploaded
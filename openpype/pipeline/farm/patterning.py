@@ -1,6 +1,26 @@
 # -*- coding: utf-8 -*-
 import re
 
+# Compiled patterns by tuple of pattern strings
+_COMPILED_PATTERNS_CACHE = {}
+
+
+def compile_aov_patterns(patterns):
+    """Compile AOV patterns only once.
+
+    Args:
+        patterns (Iterable[str]): Regex patterns.
+
+    Returns:
+        tuple[re.Pattern]: Compiled patterns.
+    """
+    key = tuple(patterns)
+    compiled = _COMPILED_PATTERNS_CACHE.get(key)
+    if compiled is None:
+        compiled = tuple(re.compile(pattern) for pattern in key)
+        _COMPILED_PATTERNS_CACHE[key] = compiled
+    return compiled
+
 
 def match_aov_pattern(host_name, aov_patterns, render_file_name):
     """Matching against a `AOV` pattern in the render files.
@@ -21,4 +41,7 @@ def match_aov_pattern(host_name, aov_patterns, render_file_name):
     aov_pattern = aov_patterns.get(host_name, [])
     if not aov_pattern:
         return False
-    return any(re.match(p, render_file_name) for p in aov_pattern)
+    return any(
+        pattern.match(render_file_name)
+        for pattern in compile_aov_patterns(aov_pattern)
+    )
@@ -38,6 +38,11 @@ from .utils import (
     filter_containers,
 )
 
+from .outdated_monitor import (
+    OutdatedContainersMonitor,
+    get_outdated_containers_monitor,
+)
+
 from .plugins import (
     LoaderPlugin,
     SubsetLoaderPlugin,
@@ -90,6 +95,10 @@ __all__ = (
     "get_outdated_containers",
     "filter_containers",
 
+    # outdated_monitor.py
+    "OutdatedContainersMonitor",
+    "get_outdated_containers_monitor",
+
     # plugins.py
     "LoaderPlugin",
     "SubsetLoaderPlugin",
@@ -0,0 +1,334 @@
+"""Incremental check of outdated containers in background.
+
+Monitor caches representation -> version mapping of containers and last
+versions of their subsets. Only representations which were not checked
+before are queried and last versions are queried again only for subsets
+which have new versions since previous check.
+
+Containers are passed to the monitor by host (host's 'ls' usually can't
+be called outside of main thread) and database is checked in background
+thread. Event with topic 'containers.outdated.changed' is emitted when
+outdated containers changed.
+
+Example:
+    ```
+    monitor = get_outdated_containers_monitor()
+    monitor.set_containers(host.get_containers())
+    monitor.start()
+    ```
+
+Warning:
+    Event callbacks are called from the background thread. Hosts must move
+    UI changes to main thread.
+"""
+import time
+import datetime
+import logging
+import threading
+import collections
+
+from openpype.client import (
+    get_representations,
+    get_versions,
+    get_last_versions,
+    get_subset_ids_with_new_versions,
+)
+from openpype.lib.events import emit_event
+from openpype.pipeline import legacy_io
+
+from .utils import ContainersFilterResult
+
+# Versions created in this time before last check are checked again
+#   because ids are created on clients with possibly different time.
+CLOCK_SKEW_TOLERANCE = datetime.timedelta(seconds=60)
+
+_RepreInfo = collections.namedtuple(
+    "_RepreInfo", ["version_id", "subset_id", "is_hero"]
+)
+
+
+class OutdatedContainersMonitor(object):
+    """Incremental check of outdated containers.
+
+    Args:
+        project_name (Optional[str]): Project of containers. Active project
+            is used if not passed.
+        interval (Optional[float]): Seconds between checks in background.
+        full_refresh_interval (Optional[float]): Seconds after which all
+            cached data are queried again (e.g. to find removed versions).
+    """
+
+    event_topic = "containers.outdated.changed"
+
+    def __init__(
+        self, project_name=None, interval=60, full_refresh_interval=900
+    ):
+        if project_name is None:
+            project_name = legacy_io.active_project()
+
+        self.log = logging.getLogger(self.__class__.__name__)
+        self._project_name = project_name
+        self._interval = interval
+        self._full_refresh_interval = full_refresh_interval
+
+        # Containers are set from main thread of host which must not wait
+        #   for database queries of running check
+        self._containers_lock = threading.Lock()
+        self._check_lock = threading.Lock()
+        self._containers = []
+
+        # Cached database data
+        self._repre_info_by_id = {}
+        self._last_version_id_by_subset_id = {}
+        self._last_check = None
+        self._last_full_refresh = 0
+
+        self._result = None
+        self._outdated_names = None
+
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._check_event = threading.Event()
+
+    @property
+    def project_name(self):
+        return self._project_name
+
+    @property
+    def result(self):
+        """Result of last check.
+
+        Returns:
+            Union[ContainersFilterResult, None]: Containers by categories or
+                None if check did not happen yet.
+        """
+
+        return self._result
+
+    def set_containers(self, containers):
+        """Set containers in scene.
+
+        Background check is triggered.
+
+        Args:
+            containers (Iterable[dict]): Containers from host.
+        """
+
+        containers = list(containers)
+        with self._containers_lock:
+            self._containers = containers
+        self._check_event.set()
+
+    def start(self):
+        """Start checks in background thread."""
+
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        thread = threading.Thread(target=self._run)
+        thread.daemon = True
+        self._thread = thread
+        thread.start()
+
+    def stop(self, wait=True):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._check_event.set()
+        if wait:
+            self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.check()
+            except Exception:
+                self.log.warning(
+                    "Check of outdated containers failed", exc_info=True
+                )
+            self._check_event.wait(self._interval)
+            self._check_event.clear()
+
+    def check(self, force=False):
+        """Check which containers are outdated.
+
+        Args:
+            force (Optional[bool]): Query all data from database again.
+
+        Returns:
+            ContainersFilterResult: Containers by categories.
+        """
+
+        with self._containers_lock:
+            containers = list(self._containers)
+
+        with self._check_lock:
+            now = time.time()
+            if (
+                force
+                or now - self._last_full_refresh > self._full_refresh_interval
+            ):
+                self._repre_info_by_id = {}
+                self._last_version_id_by_subset_id = {}
+                self._last_check = None
+                self._last_full_refresh = now
+
+            self._update_repre_infos(containers)
+            self._update_last_versions()
+            result = self._filter_containers(containers)
+            self._result = result
+
+        outdated_names = {
+            container["objectName"]
+            for container in result.outdated
+        }
+        if outdated_names != self._outdated_names:
+            self._outdated_names = outdated_names
+            emit_event(
+                self.event_topic,
+                {
+                    "project_name": self._project_name,
+                    "outdated": list(result.outdated),
+                    "outdated_count": len(result.outdated)
+                },
+                "load.outdated_monitor"
+            )
+        return result
+
+    def _update_repre_infos(self, containers):
+        """Query version and subset ids of representations not known yet."""
+
+        repre_ids = {
+            container["representation"]
+            for container in containers
+            if container["representation"]
+        } - set(self._repre_info_by_id.keys())
+        if not repre_ids:
+            return
+
+        repre_docs = get_representations(
+            self._project_name,
+            representation_ids=repre_ids,
+            fields=["_id", "parent"]
+        )
+        version_id_by_repre_id = {
+            str(repre_doc["_id"]): repre_doc["parent"]
+            for repre_doc in repre_docs
+        }
+        version_docs = get_versions(
+            self._project_name,
+            version_ids=set(version_id_by_repre_id.values()),
+            hero=True,
+            fields=["_id", "parent", "type"]
+        )
+        version_docs_by_id = {
+            version_doc["_id"]: version_doc
+            for version_doc in version_docs
+        }
+        for repre_id in repre_ids:
+            version_doc = version_docs_by_id.get(
+                version_id_by_repre_id.get(repre_id)
+            )
+            # Missing representation or version is cached as None
+            repre_info = None
+            if version_doc:
+                repre_info = _RepreInfo(
+                    version_doc["_id"],
+                    version_doc["parent"],
+                    version_doc["type"] == "hero_version"
+                )
+            self._repre_info_by_id[repre_id] = repre_info
+
+    def _update_last_versions(self):
+        """Query last versions of subsets with new versions."""
+
+        subset_ids = {
+            repre_info.subset_id
+            for repre_info in self._repre_info_by_id.values()
+            if repre_info is not None and not repre_info.is_hero
+        }
+        # Subsets which were never checked
+        subset_ids_to_query = (
+            subset_ids - set(self._last_version_id_by_subset_id.keys())
+        )
+        check_time = datetime.datetime.utcnow()
+        checked_subset_ids = subset_ids - subset_ids_to_query
+        if self._last_check is not None and checked_subset_ids:
+            subset_ids_to_query |= get_subset_ids_with_new_versions(
+                self._project_name,
+                checked_subset_ids,
+                self._last_check - CLOCK_SKEW_TOLERANCE
+            )
+        self._last_check = check_time
+
+        if not subset_ids_to_query:
+            return
+
+        self.log.debug("Querying last versions of {} subsets".format(
+            len(subset_ids_to_query)
+        ))
+        last_versions = get_last_versions(
+            self._project_name,
+            subset_ids=subset_ids_to_query,
+            fields=["_id"]
+        )
+        for subset_id in subset_ids_to_query:
+            last_version_doc = last_versions.get(subset_id)
+            last_version_id = None
+            if last_version_doc:
+                last_version_id = last_version_doc["_id"]
+            self._last_version_id_by_subset_id[subset_id] = last_version_id
+
+    def _filter_containers(self, containers):
+        output = ContainersFilterResult([], [], [], [])
+        for container in containers:
+            repre_id = container["representation"]
+            if not repre_id:
+                output.invalid.append(container)
+                continue
+
+            repre_info = self._repre_info_by_id.get(repre_id)
+            if repre_info is None:
+                output.not_found.append(container)
+                continue
+
+            if repre_info.is_hero:
+                output.latest.append(container)
+                continue
+
+            last_version_id = self._last_version_id_by_subset_id.get(
+                repre_info.subset_id
+            )
+            if (
+                last_version_id is not None
+                and last_version_id != repre_info.version_id
+            ):
+                output.outdated.append(container)
+            else:
+                output.latest.append(container)
+        return output
+
+
+_monitors_by_project = {}
+
+
+def get_outdated_containers_monitor(project_name=None):
+    """Shared monitor of outdated containers for project.
+
+    Args:
+        project_name (Optional[str]): Project name. Active project is used
+            if not passed.
+
+    Returns:
+        OutdatedContainersMonitor: Monitor of the project.
+    """
+
+    if project_name is None:
+        project_name = legacy_io.active_project()
+
+    monitor = _monitors_by_project.get(project_name)
+    if monitor is None:
+        monitor = OutdatedContainersMonitor(project_name)
+        _monitors_by_project[project_name] = monitor
+    return monitor
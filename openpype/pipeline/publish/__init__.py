@@ -36,6 +36,8 @@ from .lib import (
     context_plugin_should_run,
     get_instance_staging_dir,
     get_publish_repre_path,
+    get_cached_ffprobe_data,
+    get_file_existence_index,
 
     apply_plugin_settings_automatically,
     get_plugin_settings,
@@ -83,6 +85,8 @@ __all__ = (
     "context_plugin_should_run",
     "get_instance_staging_dir",
     "get_publish_repre_path",
+    "get_cached_ffprobe_data",
+    "get_file_existence_index",
 
     "apply_plugin_settings_automatically",
     "get_plugin_settings",
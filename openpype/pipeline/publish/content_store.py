@@ -0,0 +1,225 @@
+"""Content addressed storage of published files.
+
+Published files can be stored only once by digest of their content in
+content store and versioned publish paths are hardlinks to the stored
+object. Files with identical content published in multiple versions (e.g.
+unchanged textures) then use disk space only once and are not copied again.
+
+Objects are created as copy-on-write clones (reflinks) of source files on
+filesystems supporting it, otherwise the source file is copied.
+
+Number of links of stored object is used as reference count. Object which
+has only one link (the object itself) is not used by any publish and can
+be removed by 'ContentStore.cleanup'.
+
+Warning:
+    Published files must not be modified in place as the change would
+    affect all versions linked to the same object.
+"""
+import os
+import sys
+import time
+import uuid
+import errno
+import logging
+
+import six
+
+from openpype.lib import StringTemplate, create_file_clone
+from openpype.lib.file_hash import compute_file_content_hash
+
+# this is needed until speedcopy for linux is fixed
+if sys.platform == "win32":
+    from speedcopy import copyfile
+else:
+    from shutil import copyfile
+
+
+def _get_device(path):
+    """Device of path or its first existing parent."""
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    return os.stat(path).st_dev
+
+
+class ContentStore(object):
+    """Store of files by digest of their content.
+
+    Args:
+        root (str): Directory where objects are stored.
+        log (Optional[logging.Logger]): Logger.
+    """
+
+    objects_dirname = "objects"
+
+    def __init__(self, root, log=None):
+        if log is None:
+            log = logging.getLogger(self.__class__.__name__)
+        self.log = log
+        self._root = os.path.normpath(root)
+        self._device = None
+
+    @property
+    def root(self):
+        return self._root
+
+    @property
+    def objects_root(self):
+        return os.path.join(self._root, self.objects_dirname)
+
+    def get_object_path(self, digest):
+        """Path to stored object of digest.
+
+        Args:
+            digest (str): Digest from 'compute_file_content_hash'.
+
+        Returns:
+            str: Path to object.
+        """
+        algorithm, hexdigest = digest.split(":", 1)
+        return os.path.join(
+            self.objects_root,
+            algorithm,
+            hexdigest[:2],
+            hexdigest[2:4],
+            hexdigest
+        )
+
+    def can_link(self, dst_path):
+        """Object can be hardlinked to the destination.
+
+        Hardlinks are possible only on the same device.
+        """
+        if self._device is None:
+            self._device = _get_device(self._root)
+        return self._device is not None and (
+            _get_device(dst_path) == self._device
+        )
+
+    def add_file(self, src_path):
+        """Store file into content store.
+
+        File is copied only if object with the same content is not stored
+        yet.
+
+        Args:
+            src_path (str): Path to file.
+
+        Returns:
+            str: Path to stored object.
+        """
+        # Sampled digest can't be used to identify content
+        digest = compute_file_content_hash(src_path, sample_size=0)
+        object_path = self.get_object_path(digest)
+        if os.path.exists(object_path):
+            # Object is not linked yet so it must not look old to 'cleanup'
+            #   which would remove it before it's linked
+            try:
+                os.utime(object_path, None)
+                self.log.debug(
+                    "Content of file is already stored {} -> {}".format(
+                        src_path, object_path
+                    )
+                )
+                return object_path
+            except OSError:
+                # Object could be removed by cleanup in the meantime
+                if os.path.exists(object_path):
+                    raise
+
+        object_dir = os.path.dirname(object_path)
+        try:
+            os.makedirs(object_dir)
+        except OSError as exc:
+            if exc.errno != errno.EEXIST:
+                six.reraise(*sys.exc_info())
+
+        # Copy to temporary file first so incomplete object is never used
+        tmp_path = "{}.{}.tmp".format(object_path, uuid.uuid4().hex)
+        self.log.debug("Storing file content {} -> {}".format(
+            src_path, object_path
+        ))
+        if not create_file_clone(src_path, tmp_path):
+            copyfile(src_path, tmp_path)
+        try:
+            os.rename(tmp_path, object_path)
+        except OSError:
+            # Object was stored by other process in the meantime
+            os.remove(tmp_path)
+            if not os.path.exists(object_path):
+                raise
+        return object_path
+
+    def iter_objects(self):
+        """Iterate paths of all stored objects."""
+        for root, _, filenames in os.walk(self.objects_root):
+            for filename in filenames:
+                if not filename.endswith(".tmp"):
+                    yield os.path.join(root, filename)
+
+    def cleanup(self, min_age=86400, dry_run=False):
+        """Remove objects which are not linked by any published file.
+
+        Args:
+            min_age (Optional[int]): Minimal age of object in seconds to be
+                removed. Prevents removal of objects of running publish.
+            dry_run (Optional[bool]): Only report objects to remove.
+
+        Returns:
+            tuple[int, int]: Number of removed objects and their size.
+        """
+        removed_count = 0
+        removed_size = 0
+        max_mtime = time.time() - min_age
+        for path in self.iter_objects():
+            stat = os.stat(path)
+            if stat.st_nlink > 1 or stat.st_mtime > max_mtime:
+                continue
+
+            self.log.debug("Removing unused object {}".format(path))
+            removed_count += 1
+            removed_size += stat.st_size
+            if not dry_run:
+                os.remove(path)
+
+        return removed_count, removed_size
+
+
+def get_content_store(project_name, anatomy, project_settings, log=None):
+    """Content store of project if is enabled in settings.
+
+    Args:
+        project_name (str): Project name.
+        anatomy (Anatomy): Project anatomy.
+        project_settings (dict[str, Any]): Project settings.
+        log (Optional[logging.Logger]): Logger.
+
+    Returns:
+        Union[ContentStore, None]: Content store or None if disabled.
+    """
+    content_store_settings = (
+        project_settings
+        ["global"]
+        ["publish"]
+        ["IntegrateAsset"]
+        .get("content_store")
+    ) or {}
+    if not content_store_settings.get("enabled"):
+        return None
+
+    template = content_store_settings.get("path")
+    if not template:
+        return None
+
+    root = StringTemplate.format_strict_template(template, {
+        "root": anatomy.roots,
+        "project": {
+            "name": project_name,
+            "code": anatomy["attributes"].get("code") or ""
+        }
+    })
+    return ContentStore(root, log=log)
@@ -14,6 +14,8 @@ from openpype.lib import (
     import_filepath,
     filter_profiles,
     is_func_signature_supported,
+    get_ffprobe_data,
+    FileExistenceIndex,
 )
 from openpype.settings import (
     get_project_settings,
@@ -888,6 +890,50 @@ def add_repre_files_for_cleanup(instance, repre):
         instance.context.data["cleanupFullPaths"].append(expected_file)
 
 
+def get_cached_ffprobe_data(context, path, logger=None):
+    """Data from ffprobe about file cached on publish context.
+
+    Plugins processing the same file during publishing don't have to run
+    ffprobe again. Cache is invalidated when modification time or size of the
+    file changes.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+        path (str): Path to probed file.
+        logger (Optional[logging.Logger]): Logger used for ffprobe output.
+
+    Returns:
+        dict[str, Any]: Data from ffprobe.
+    """
+    stat = os.stat(path)
+    key = "{}|{}|{}".format(
+        os.path.normpath(path), stat.st_mtime, stat.st_size
+    )
+    cache = context.data.setdefault("ffprobeDataCache", {})
+    if key not in cache:
+        cache[key] = get_ffprobe_data(path, logger)
+    return copy.deepcopy(cache[key])
+
+
+def get_file_existence_index(context):
+    """Index of existing files shared by plugins on publish context.
+
+    Each directory is listed only once during publishing. Plugins which
+    create files in directory already listed must call 'reset' on the index.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+
+    Returns:
+        FileExistenceIndex: Index of existing files.
+    """
+    index = context.data.get("fileExistenceIndex")
+    if index is None:
+        index = FileExistenceIndex()
+        context.data["fileExistenceIndex"] = index
+    return index
+
+
 def get_publish_instance_label(instance):
     """Try to get label from pyblish instance.
 
@@ -0,0 +1,98 @@
+"""Index of published textures by their source hash.
+
+Texture extractors store 'sourceHashes' on published version which maps
+hash of source texture (including conversion arguments) to published file.
+Querying version documents by the hash can't use an index, so the same
+information is stored in dedicated collection with one document per hash.
+"""
+import os
+import datetime
+import threading
+
+from pymongo import ASCENDING, UpdateOne
+
+from openpype.client.mongo import OpenPypeMongoConnection
+
+TEXTURE_CACHE_COLLECTION = "texture_cache"
+
+
+class _TextureCacheState:
+    indexes_lock = threading.Lock()
+    indexes_created = False
+
+
+def get_texture_cache_collection():
+    """Collection with published textures by source hash.
+
+    Indexes are created on first access in process.
+
+    Returns:
+        pymongo.collection.Collection: Texture cache collection.
+    """
+    mongo_client = OpenPypeMongoConnection.get_mongo_client()
+    database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+    collection = mongo_client[database_name][TEXTURE_CACHE_COLLECTION]
+    if not _TextureCacheState.indexes_created:
+        with _TextureCacheState.indexes_lock:
+            if not _TextureCacheState.indexes_created:
+                collection.create_index(
+                    [("project_name", ASCENDING), ("hash", ASCENDING)],
+                    unique=True
+                )
+                _TextureCacheState.indexes_created = True
+    return collection
+
+
+def find_texture_paths_by_hash(project_name, texture_hash):
+    """Published paths of texture with the source hash.
+
+    Args:
+        project_name (str): Name of project where texture was published.
+        texture_hash (str): Source hash of texture created by
+            'openpype.lib.source_hash' with conversion arguments.
+
+    Returns:
+        list[str]: Published paths, last published path is first.
+    """
+    doc = get_texture_cache_collection().find_one(
+        {"project_name": project_name, "hash": texture_hash},
+        projection={"paths": True, "last_path": True}
+    )
+    if not doc:
+        return []
+
+    paths = list(reversed(doc.get("paths") or []))
+    last_path = doc.get("last_path")
+    if last_path in paths:
+        paths.remove(last_path)
+        paths.insert(0, last_path)
+    return paths
+
+
+def register_texture_hashes(project_name, hashes, version_id=None):
+    """Store published textures into texture cache.
+
+    Args:
+        project_name (str): Name of project where textures were published.
+        hashes (dict[str, str]): Published paths by source hash.
+        version_id (Optional[ObjectId]): Version which published textures.
+    """
+    if not hashes:
+        return
+
+    now = datetime.datetime.utcnow()
+    operations = []
+    for texture_hash, path in hashes.items():
+        operations.append(UpdateOne(
+            {"project_name": project_name, "hash": texture_hash},
+            {
+                "$addToSet": {"paths": path},
+                "$set": {
+                    "last_path": path,
+                    "version_id": version_id,
+                    "updated": now,
+                }
+            },
+            upsert=True
+        ))
+    get_texture_cache_collection().bulk_write(operations, ordered=False)
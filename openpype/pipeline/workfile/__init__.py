@@ -5,6 +5,7 @@ from .path_resolving import (
     get_workdir,
 
     get_last_workfile_with_version,
+    get_last_workfiles_with_version,
     get_last_workfile,
 
     get_custom_workfile_template,
@@ -23,6 +24,7 @@ __all__ = (
     "get_workdir",
 
     "get_last_workfile_with_version",
+    "get_last_workfiles_with_version",
     "get_last_workfile",
 
     "get_custom_workfile_template",
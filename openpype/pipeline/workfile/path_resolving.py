@@ -1,6 +1,8 @@
 import os
 import re
 import copy
+import time
+import bisect
 import platform
 
 from openpype.client import get_project, get_asset_by_name
@@ -188,6 +190,144 @@ def get_workdir(
     )
 
 
+# Cache of workfile template regex patterns before filling of data
+_WORKFILE_PATTERNS_CACHE = {}
+# Cache of compiled workfile regexes by filled pattern
+_WORKFILE_REGEX_CACHE = {}
+# Cache of work directory listings validated by directory modification time
+_WORKDIR_LISTING_CACHE = {}
+# Listing made this many seconds after modification of directory may miss
+#   changes made within the same modification time granularity
+_WORKDIR_RACY_MTIME_SECONDS = 2
+# Characters which end literal prefix of regex pattern
+_REGEX_SPECIAL_CHARS = set(".^$*+?{}[]\\|()")
+
+
+def _get_dotted_extensions(extensions):
+    dotted_extensions = set()
+    for ext in extensions:
+        if not ext.startswith("."):
+            ext = ".{}".format(ext)
+        dotted_extensions.add(ext)
+    return dotted_extensions
+
+
+def _get_workfile_template_pattern(file_template, dotted_extensions):
+    """Workfile template converted to regex pattern which is not filled.
+
+    Build template without optionals, version to digits only regex
+    and comment to any definable value.
+    """
+
+    cache_key = (file_template, tuple(sorted(dotted_extensions)))
+    pattern = _WORKFILE_PATTERNS_CACHE.get(cache_key)
+    if pattern is not None:
+        return pattern
+
+    # Escape extensions dot for regex
+    regex_exts = [
+        "\\" + ext
+        for ext in sorted(dotted_extensions)
+    ]
+    ext_expression = "(?:" + "|".join(regex_exts) + ")"
+
+    # Replace `.{ext}` with `{ext}` so we are sure there is not dot at the end
+    pattern = re.sub(r"\.?{ext}", ext_expression, file_template)
+    # Replace optional keys with optional content regex
+    pattern = re.sub(r"<.*?>", r".*?", pattern)
+    # Replace `{version}` with group regex
+    pattern = re.sub(r"{version.*?}", r"([0-9]+)", pattern)
+    pattern = re.sub(r"{comment.*?}", r".+?", pattern)
+    _WORKFILE_PATTERNS_CACHE[cache_key] = pattern
+    return pattern
+
+
+def _compile_workfile_regex(pattern):
+    regex = _WORKFILE_REGEX_CACHE.get(pattern)
+    if regex is None:
+        # Match with ignore case on Windows due to the Windows
+        # OS not being case-sensitive. This avoids later running
+        # into the error that the file did exist if it existed
+        # with a different upper/lower-case.
+        flags = 0
+        if _is_case_insensitive():
+            flags = re.IGNORECASE
+        regex = re.compile(pattern, flags)
+        _WORKFILE_REGEX_CACHE[pattern] = regex
+    return regex
+
+
+def _is_case_insensitive():
+    return platform.system().lower() == "windows"
+
+
+def _get_workdir_index(workdir, dotted_extensions):
+    """Sorted filenames with extensions in work directory.
+
+    Listing is cached and directory is listed again only if its
+    modification time changed. Listing made shortly after modification is
+    not trusted because following changes may not change coarse
+    modification time (e.g. on network storage). Filenames are lowered on
+    case insensitive platforms.
+
+    Returns:
+        Union[list[tuple[str, str]], None]: Filenames to search in with
+            filenames sorted by them. None if directory does not exist.
+    """
+
+    try:
+        mtime = os.stat(workdir).st_mtime
+    except OSError:
+        _WORKDIR_LISTING_CACHE.pop(workdir, None)
+        return None
+
+    cached = _WORKDIR_LISTING_CACHE.get(workdir)
+    if (
+        cached is None
+        or cached[0] != mtime
+        or cached[1] - mtime < _WORKDIR_RACY_MTIME_SECONDS
+    ):
+        listed_at = time.time()
+        cached = (mtime, listed_at, os.listdir(workdir), {})
+        _WORKDIR_LISTING_CACHE[workdir] = cached
+
+    _, _, filenames, indexes = cached
+    index_key = tuple(sorted(dotted_extensions))
+    index = indexes.get(index_key)
+    if index is None:
+        lower = _is_case_insensitive()
+        index = sorted(
+            (filename.lower() if lower else filename, filename)
+            for filename in filenames
+            if os.path.splitext(filename)[-1] in dotted_extensions
+        )
+        indexes[index_key] = index
+    return index
+
+
+def _get_literal_prefix(pattern):
+    """Part of regex pattern before first special character."""
+
+    for idx, char in enumerate(pattern):
+        if char in _REGEX_SPECIAL_CHARS:
+            return pattern[:idx]
+    return pattern
+
+
+def _iter_index_with_prefix(index, prefix):
+    """Filenames from index which start with prefix."""
+
+    if _is_case_insensitive():
+        prefix = prefix.lower()
+    idx = bisect.bisect_left(index, (prefix, ""))
+    while idx < len(index):
+        search_name, filename = index[idx]
+        if not search_name.startswith(prefix):
+            break
+        yield filename
+        idx += 1
+
+
 def get_last_workfile_with_version(
     workdir, file_template, fill_data, extensions
 ):
@@ -213,55 +353,26 @@ def get_last_workfile_with_version(
             if there is any workfile otherwise None for both.
     """
 
-    if not os.path.exists(workdir):
-        return None, None
-
-    dotted_extensions = set()
-    for ext in extensions:
-        if not ext.startswith("."):
-            ext = ".{}".format(ext)
-        dotted_extensions.add(ext)
-
+    dotted_extensions = _get_dotted_extensions(extensions)
     # Fast match on extension
-    filenames = [
-        filename
-        for filename in os.listdir(workdir)
-        if os.path.splitext(filename)[-1] in dotted_extensions
-    ]
-
-    # Build template without optionals, version to digits only regex
-    # and comment to any definable value.
-    # Escape extensions dot for regex
-    regex_exts = [
-        "\\" + ext
-        for ext in dotted_extensions
-    ]
-    ext_expression = "(?:" + "|".join(regex_exts) + ")"
+    index = _get_workdir_index(workdir, dotted_extensions)
+    if not index:
+        return None, None
 
-    # Replace `.{ext}` with `{ext}` so we are sure there is not dot at the end
-    file_template = re.sub(r"\.?{ext}", ext_expression, file_template)
-    # Replace optional keys with optional content regex
-    file_template = re.sub(r"<.*?>", r".*?", file_template)
-    # Replace `{version}` with group regex
-    file_template = re.sub(r"{version.*?}", r"([0-9]+)", file_template)
-    file_template = re.sub(r"{comment.*?}", r".+?", file_template)
-    file_template = StringTemplate.format_strict_template(
-        file_template, fill_data
+    pattern = StringTemplate.format_strict_template(
+        _get_workfile_template_pattern(file_template, dotted_extensions),
+        fill_data
     )
-
-    # Match with ignore case on Windows due to the Windows
-    # OS not being case-sensitive. This avoids later running
-    # into the error that the file did exist if it existed
-    # with a different upper/lower-case.
-    kwargs = {}
-    if platform.system().lower() == "windows":
-        kwargs["flags"] = re.IGNORECASE
+    regex = _compile_workfile_regex(pattern)
 
     # Get highest version among existing matching files
+    #   - only files starting with literal part of pattern can match
     version = None
     output_filenames = []
-    for filename in sorted(filenames):
-        match = re.match(file_template, filename, **kwargs)
+    for filename in _iter_index_with_prefix(
+        index, _get_literal_prefix(pattern)
+    ):
+        match = regex.match(filename)
         if not match:
             continue
 
@@ -293,6 +404,31 @@ def get_last_workfile_with_version(
     return output_filename, version
 
 
+def get_last_workfiles_with_version(workfile_contexts):
+    """Return last workfile versions for many contexts at once.
+
+    Each work directory is listed only once and regexes of the same
+    templates are shared, which is useful e.g. for task lists.
+
+    Args:
+        workfile_contexts (Iterable[Tuple[str, str, Dict[str, Any],
+            Iterable[str]]]): Work directory, file template, fill data and
+            extensions for each context. Same as arguments of
+            'get_last_workfile_with_version'.
+
+    Returns:
+        List[Tuple[Union[str, None], Union[int, None]]]: Last workfile with
+            version for each context in order of passed contexts.
+    """
+
+    return [
+        get_last_workfile_with_version(
+            workdir, file_template, fill_data, extensions
+        )
+        for workdir, file_template, fill_data, extensions in workfile_contexts
+    ]
+
+
 def get_last_workfile(
     workdir, file_template, fill_data, extensions, full_path=False
 ):
@@ -19,6 +19,7 @@ from openpype.pipeline.delivery import (
     check_destination_path,
     deliver_single_file,
     deliver_sequence,
+    DeliveryTransfers,
 )
 
 
@@ -178,6 +179,9 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
 
         selected_repres = self._get_selected_repres()
 
+        # Transfers are collected first and processed concurrently
+        transfers = DeliveryTransfers(log=self.log)
+
         datetime_data = get_datetime_data()
         template_name = self.dropdown.currentText()
         format_dict = get_format_dict(self.anatomy, self.root_line_edit.text())
@@ -208,7 +212,8 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 anatomy_data,
                 format_dict,
                 report_items,
-                self.log
+                self.log,
+                transfers
             ]
 
             if repre.get("files"):
@@ -224,7 +229,6 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                         anatomy_data["frame"] = frame
                     new_report_items, uploaded = deliver_single_file(*args)
                     report_items.update(new_report_items)
-                    self._update_progress(uploaded)
             else:  # fallback for Pype2 and representations without files
                 frame = repre['context'].get('frame')
                 if frame:
@@ -235,9 +239,16 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
                 else:
                     new_report_items, uploaded = deliver_sequence(*args)
                 report_items.update(new_report_items)
-                self._update_progress(uploaded)
 
-        self.text_area.setText(self._format_report(report_items))
+        result = transfers.process(self._update_progress)
+        for src_path, dst_path, error in result["errors"]:
+            report_items["Failed to copy files"].append(
+                "{} -> {}: {}".format(src_path, dst_path, error)
+            )
+
+        self.text_area.setText(
+            self._format_report(report_items, result)
+        )
         self.text_area.setVisible(True)
 
     def _get_representation_names(self):
@@ -315,14 +326,18 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
             self.template_label.setText(template_value)
             self.btn_delivery.setEnabled(bool(self._get_selected_repres()))
 
-    def _update_progress(self, uploaded):
-        """Update progress bar after each repre copied."""
-        self.currently_uploaded += uploaded
+    def _update_progress(self, processed_count, all_count, size):
+        """Update progress bar after each file copied."""
+        self.currently_uploaded = processed_count
 
-        ratio = self.currently_uploaded / self.files_selected
-        self.progress_bar.setValue(ratio * self.progress_bar.maximum())
+        if all_count:
+            ratio = float(processed_count) / all_count
+            self.progress_bar.setValue(
+                int(ratio * self.progress_bar.maximum())
+            )
+        QtWidgets.QApplication.processEvents()
 
-    def _format_report(self, report_items):
+    def _format_report(self, report_items, result=None):
         """Format final result and error details as html."""
         msg = "Delivery finished"
         if not report_items:
@@ -330,6 +345,23 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         else:
             msg += " with errors"
         txt = "<h2>{}</h2>".format(msg)
+        if result is not None:
+            duration = result["duration"]
+            throughput = 0
+            if duration > 0:
+                throughput = result["size"] / duration
+            txt += (
+                "Copied {} files ({}) in {:.1f}s, {}/s<br>"
+            ).format(
+                result["count"],
+                format_file_size(result["size"]),
+                duration,
+                format_file_size(throughput)
+            )
+            if result["skipped"]:
+                txt += "Skipped {} files delivered previously<br>".format(
+                    result["skipped"]
+                )
         for header, data in report_items.items():
             txt += "<h3>{}</h3>".format(header)
             for item in data:
@@ -28,25 +28,24 @@ class PushToLibraryProject(load.SubsetLoaderPlugin):
         if not filtered_contexts:
             raise LoadError("Nothing to push for your selection")
 
-        if len(filtered_contexts) > 1:
-            raise LoadError("Please select only one item")
+        project_names = {
+            context["project"]["name"]
+            for context in filtered_contexts
+        }
+        if len(project_names) > 1:
+            raise LoadError("Please select items from only one project")
 
-        context = tuple(filtered_contexts)[0]
         push_tool_script_path = os.path.join(
             PACKAGE_DIR,
             "tools",
             "push_to_project",
             "app.py"
         )
-        project_doc = context["project"]
-        version_doc = context["version"]
-        project_name = project_doc["name"]
-        version_id = str(version_doc["_id"])
-
         args = get_openpype_execute_args(
             "run",
             push_tool_script_path,
-            "--project", project_name,
-            "--version", version_id
+            "--project", project_names.pop()
         )
+        for context in filtered_contexts:
+            args.extend(["--version", str(context["version"]["_id"])])
         run_detached_process(args)
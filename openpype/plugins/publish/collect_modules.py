@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Collect OpenPype modules."""
-from openpype.modules import ModulesManager
+from openpype.modules import get_modules_manager
 import pyblish.api
 
 
@@ -11,5 +11,5 @@ class CollectModules(pyblish.api.ContextPlugin):
     label = "OpenPype Modules"
 
     def process(self, context):
-        manager = ModulesManager()
+        manager = get_modules_manager()
         context.data["openPypeModules"] = manager.modules_by_name
@@ -1,25 +1,224 @@
 import os
+import sys
 import json
 import copy
 import tempfile
 import platform
 import shutil
+import threading
+import subprocess
 
 import clique
 import six
+from six.moves import queue
 import pyblish.api
 
 from openpype import resources, PACKAGE_DIR
 from openpype.pipeline import publish
 from openpype.lib import (
-    run_openpype_process,
+    get_openpype_execute_args,
+    clean_envs_for_openpype_process,
+    is_running_from_build,
 
     get_transcode_temp_directory,
     convert_input_paths_for_ffmpeg,
     should_convert_for_ffmpeg
 )
 from openpype.lib.profiles_filtering import filter_profiles
-from openpype.pipeline.publish.lib import add_repre_files_for_cleanup
+from openpype.pipeline.publish.lib import (
+    add_repre_files_for_cleanup,
+    get_cached_ffprobe_data,
+)
+
+# Prefix of worker output line with job result
+# - must match 'WORKER_RESULT_PREFIX' in 'openpype/scripts/otio_burnin.py'
+BURNIN_WORKER_RESULT_PREFIX = "__OP_BURNIN_RESULT__ "
+
+
+class BurninWorker(object):
+    """OpenPype process rendering burnins of jobs passed to its stdin.
+
+    The process is reused for multiple burnins so OpenPype bootstrap is
+    not processed for each of them.
+
+    Args:
+        script_path (str): Path to burnin script.
+        logger (logging.Logger): Logger for output of the process.
+    """
+
+    def __init__(self, script_path, logger):
+        self.log = logger
+
+        env = clean_envs_for_openpype_process(os.environ)
+        # Only keep OpenPype version if we are running from build.
+        if not is_running_from_build():
+            env.pop("OPENPYPE_VERSION", None)
+
+        args = get_openpype_execute_args("run", script_path, "--worker")
+        self.log.debug("Starting burnin worker: {}".format(" ".join(args)))
+        self._process = subprocess.Popen(
+            args,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True
+        )
+
+    def process(self, script_data):
+        """Render burnin of passed data and wait until is finished."""
+        # Store data to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(json.dumps(script_data))
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        try:
+            self._process.stdin.write(temporary_json_filepath + "\n")
+            self._process.stdin.flush()
+
+            result = None
+            output = []
+            while result is None:
+                line = self._process.stdout.readline()
+                if not line:
+                    raise RuntimeError(
+                        "Burnin worker ended unexpectedly:\n{}".format(
+                            "".join(output)
+                        )
+                    )
+
+                if line.startswith(BURNIN_WORKER_RESULT_PREFIX):
+                    result = json.loads(
+                        line[len(BURNIN_WORKER_RESULT_PREFIX):]
+                    )
+                else:
+                    output.append(line)
+
+        finally:
+            os.remove(temporary_json_filepath)
+
+        if output:
+            self.log.debug("".join(output))
+
+        if result["error"]:
+            raise RuntimeError(
+                "Burnin rendering failed:\n{}".format(result["error"])
+            )
+
+    def stop(self):
+        if self._process.poll() is None:
+            self._process.stdin.close()
+            self._process.wait()
+
+
+class BurninRenderer(object):
+    """Render burnins concurrently in the process or in worker processes.
+
+    Burnin script is imported and used directly if it is possible in the
+    current process. Otherwise are burnins rendered by 'BurninWorker'
+    processes which are reused until the renderer is stopped.
+
+    Args:
+        script_path (str): Path to burnin script.
+        max_parallel (int): Maximum number of burnins rendered at once.
+        logger (logging.Logger): Logger.
+    """
+
+    def __init__(self, script_path, max_parallel, logger):
+        self.log = logger
+        self._script_path = script_path
+        self._max_parallel = max(int(max_parallel or 1), 1)
+        self._idle_workers = queue.Queue()
+        self._workers = []
+        self._engine = self._import_engine()
+
+    def _import_engine(self):
+        if not six.PY3:
+            return None
+
+        try:
+            from openpype.scripts import otio_burnin
+
+        except Exception:
+            self.log.debug(
+                "Burnin script can't be imported in current process.",
+                exc_info=True
+            )
+            return None
+        return otio_burnin
+
+    def _get_worker(self):
+        try:
+            return self._idle_workers.get_nowait()
+        except queue.Empty:
+            pass
+        worker = BurninWorker(self._script_path, self.log)
+        self._workers.append(worker)
+        return worker
+
+    def _render(self, script_data):
+        if self._engine is not None:
+            # Pass copy of data as burnin script modifies them
+            self._engine.process_burnin_data(
+                json.loads(json.dumps(script_data))
+            )
+            return
+
+        worker = self._get_worker()
+        try:
+            worker.process(script_data)
+        finally:
+            self._idle_workers.put(worker)
+
+    def render(self, scripts_data):
+        """Render burnins and wait until all of them are finished.
+
+        Args:
+            scripts_data (list[dict[str, Any]]): Data for burnin script.
+        """
+        jobs = queue.Queue()
+        for script_data in scripts_data:
+            jobs.put(script_data)
+
+        errors = []
+
+        def _process_jobs():
+            while not errors:
+                try:
+                    script_data = jobs.get_nowait()
+                except queue.Empty:
+                    break
+
+                try:
+                    self._render(script_data)
+                except Exception:
+                    errors.append(sys.exc_info())
+
+        threads_count = min(self._max_parallel, len(scripts_data))
+        if threads_count < 2:
+            _process_jobs()
+        else:
+            threads = [
+                threading.Thread(target=_process_jobs)
+                for _ in range(threads_count)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            six.reraise(*errors[0])
+
+    def stop(self):
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
 
 
 class ExtractBurnin(publish.Extractor):
@@ -75,6 +274,7 @@ class ExtractBurnin(publish.Extractor):
     # Configurable by Settings
     profiles = None
     options = None
+    max_parallel_burnins = 2
 
     def process(self, instance):
         if not self.profiles:
@@ -86,7 +286,13 @@ class ExtractBurnin(publish.Extractor):
                 "Instance does not have filled representations. Skipping")
             return
 
-        self.main_process(instance)
+        renderer = BurninRenderer(
+            self.burnin_script_path(), self.max_parallel_burnins, self.log
+        )
+        try:
+            self.main_process(instance, renderer)
+        finally:
+            renderer.stop()
 
         # Remove any representations tagged for deletion.
         # QUESTION Is possible to have representation with "delete" tag?
@@ -144,7 +350,7 @@ class ExtractBurnin(publish.Extractor):
 
         return filtered_repres
 
-    def main_process(self, instance):
+    def main_process(self, instance, renderer):
         host_name = instance.context.data["hostName"]
         family = instance.data["family"]
         task_data = instance.data["anatomyData"].get("task", {})
@@ -188,10 +394,7 @@ class ExtractBurnin(publish.Extractor):
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
         anatomy = instance.context.data["anatomy"]
-        scriptpath = self.burnin_script_path()
 
-        # Args that will execute the script
-        executable_args = ["run", scriptpath]
         burnins_per_repres = self._get_burnins_per_representations(
             instance, burnin_defs
         )
@@ -277,6 +480,9 @@ class ExtractBurnin(publish.Extractor):
                 #  it in review?
                 # burnin_data["fps"] = fps
 
+            ffprobe_data = None
+            new_repres = []
+            scripts_data = []
             for filename_suffix, burnin_def in repre_burnin_defs.items():
                 new_repre = copy.deepcopy(repre)
                 new_repre["stagingDir"] = src_repre_staging_dir
@@ -314,6 +520,13 @@ class ExtractBurnin(publish.Extractor):
                     repre, new_repre, temp_data, filename_suffix
                 )
 
+                # Input is same for all burnin definitions
+                full_input_path = temp_data["full_input_paths"][0]
+                if ffprobe_data is None:
+                    ffprobe_data = get_cached_ffprobe_data(
+                        instance.context, full_input_path, self.log
+                    )
+
                 # Data for burnin script
                 script_data = {
                     "input": temp_data["full_input_path"],
@@ -321,7 +534,7 @@ class ExtractBurnin(publish.Extractor):
                     "burnin_data": burnin_data,
                     "options": repre_burnin_options,
                     "values": burnin_values,
-                    "full_input_path": temp_data["full_input_paths"][0],
+                    "full_input_path": full_input_path,
                     "first_frame": temp_data["first_frame"],
                     "ffmpeg_cmd": new_repre.get("ffmpeg_cmd", "")
                 }
@@ -329,39 +542,19 @@ class ExtractBurnin(publish.Extractor):
                 self.log.debug(
                     "script_data: {}".format(json.dumps(script_data, indent=4))
                 )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log
-                }
-
-                run_openpype_process(*args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                script_data["ffprobe_data"] = ffprobe_data
+                scripts_data.append(script_data)
+                new_repres.append(new_repre)
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
                     if filepath not in files_to_delete:
                         files_to_delete.append(filepath)
 
+            # Render burnins of all definitions
+            renderer.render(scripts_data)
+
+            for new_repre in new_repres:
                 # Add new representation to instance
                 instance.data["representations"].append(new_repre)
 
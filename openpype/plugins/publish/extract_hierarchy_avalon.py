@@ -5,6 +5,7 @@ from openpype.client import (
     get_assets,
     get_archived_assets
 )
+from openpype.client.operations import mark_project_entities_changed
 from openpype.pipeline import legacy_io
 
 
@@ -80,6 +81,9 @@ class ExtractHierarchyToAvalon(pyblish.api.ContextPlugin):
             for child_name, child_data in children.items():
                 hierarchy_queue.append((child_name, child_data, new_parent))
 
+        # Let other processes know that cached asset documents are outdated
+        mark_project_entities_changed(project_name)
+
     def extract_asset_names(self, hierarchy_context):
         """Extract all possible asset names from hierarchy context.
 
@@ -6,7 +6,6 @@ import shutil
 from abc import ABCMeta, abstractmethod
 
 import six
-import clique
 import speedcopy
 import pyblish.api
 
@@ -14,7 +13,12 @@ from openpype.lib import (
     get_ffmpeg_tool_path,
     filter_profiles,
     path_to_subprocess_arg,
-    run_subprocess,
+    create_hard_link,
+    SequenceIndex,
+)
+from openpype.lib.process_executor import (
+    SubprocessExecutor,
+    wait_for_futures,
 )
 from openpype.lib.transcoding import (
     IMAGE_EXTENSIONS,
@@ -77,6 +81,9 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Render outputs with matching input from single decode pass
+    single_decode_outputs = False
+    max_parallel_outputs = 2
 
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
@@ -303,112 +310,43 @@ class ExtractReview(pyblish.api.InstancePlugin):
         self, instance, repre, src_repre_staging_dir, output_definitions
     ):
         fill_data = copy.deepcopy(instance.data["anatomyData"])
-        for _output_def in output_definitions:
-            output_def = copy.deepcopy(_output_def)
-            # Make sure output definition has "tags" key
-            if "tags" not in output_def:
-                output_def["tags"] = []
-
-            if "burnins" not in output_def:
-                output_def["burnins"] = []
-
-            # Create copy of representation
-            new_repre = copy.deepcopy(repre)
-            # Make sure new representation has origin staging dir
-            #   - this is because source representation may change
-            #       it's staging dir because of ffmpeg conversion
-            new_repre["stagingDir"] = src_repre_staging_dir
-
-            # Remove "delete" tag from new repre if there is
-            if "delete" in new_repre["tags"]:
-                new_repre["tags"].remove("delete")
-
-            # Add additional tags from output definition to representation
-            for tag in output_def["tags"]:
-                if tag not in new_repre["tags"]:
-                    new_repre["tags"].append(tag)
-
-            # Add burnin link from output definition to representation
-            for burnin in output_def["burnins"]:
-                if burnin not in new_repre.get("burnins", []):
-                    if not new_repre.get("burnins"):
-                        new_repre["burnins"] = []
-                    new_repre["burnins"].append(str(burnin))
-
-            self.log.debug(
-                "Linked burnins: `{}`".format(new_repre.get("burnins"))
-            )
-
-            self.log.debug(
-                "New representation tags: `{}`".format(
-                    new_repre.get("tags"))
-            )
-
-            temp_data = self.prepare_temp_data(instance, repre, output_def)
-            files_to_clean = []
-            if temp_data["input_is_sequence"]:
-                self.log.debug("Checking sequence to fill gaps in sequence..")
-                files_to_clean = self.fill_sequence_gaps(
-                    files=temp_data["origin_repre"]["files"],
-                    staging_dir=new_repre["stagingDir"],
-                    start_frame=temp_data["frame_start"],
-                    end_frame=temp_data["frame_end"]
-                )
-
-            # create or update outputName
-            output_name = new_repre.get("outputName", "")
-            output_ext = new_repre["ext"]
-            if output_name:
-                output_name += "_"
-            output_name += output_def["filename_suffix"]
-            if temp_data["without_handles"]:
-                output_name += "_noHandles"
-
-            # add outputName to anatomy format fill_data
-            fill_data.update({
-                "output": output_name,
-                "ext": output_ext
-            })
-
-            try:  # temporary until oiiotool is supported cross platform
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def, instance, new_repre, temp_data, fill_data
+        jobs = []
+        files_to_clean = []
+        filled_frame_ranges = set()
+        try:
+            for _output_def in output_definitions:
+                job = self._prepare_output_job(
+                    instance,
+                    repre,
+                    src_repre_staging_dir,
+                    _output_def,
+                    fill_data,
+                    files_to_clean,
+                    filled_frame_ranges
                 )
-            except ZeroDivisionError:
-                # TODO recalculate width and height using OIIO before
-                #   conversion
-                if 'exr' in temp_data["origin_repre"]["ext"]:
-                    self.log.warning(
-                        (
-                            "Unsupported compression on input files."
-                            " Skipping!!!"
-                        ),
-                        exc_info=True
-                    )
-                    return
-                raise NotImplementedError
-
-            subprcs_cmd = " ".join(ffmpeg_args)
-
-            # run subprocess
-            self.log.debug("Executing: {}".format(subprcs_cmd))
+                # Output can't be processed and following outputs are
+                #   skipped too
+                if job is None:
+                    break
+                jobs.append(job)
 
-            run_subprocess(subprcs_cmd, shell=True, logger=self.log)
+            self._render_output_jobs(jobs)
 
+        finally:
             # delete files added to fill gaps
-            if files_to_clean:
-                for f in files_to_clean:
-                    os.unlink(f)
-
-            new_repre.update({
-                "fps": temp_data["fps"],
-                "name": "{}_{}".format(output_name, output_ext),
-                "outputName": output_name,
-                "outputDef": output_def,
-                "frameStartFtrack": temp_data["output_frame_start"],
-                "frameEndFtrack": temp_data["output_frame_end"],
-                "ffmpeg_cmd": subprcs_cmd
-            })
+            for filepath in files_to_clean:
+                if os.path.exists(filepath):
+                    os.unlink(filepath)
+
+        for job in jobs:
+            new_repre = job["new_repre"]
+            self.log.info("Output \"{}\" rendered in {:.3f}s{}".format(
+                new_repre["outputName"],
+                job["duration"],
+                " (single decode pass with {} outputs)".format(
+                    job["group_size"]
+                ) if job["group_size"] > 1 else ""
+            ))
 
             # Force to pop these key if are in new repre
             new_repre.pop("thumbnail", None)
@@ -423,6 +361,230 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
             add_repre_files_for_cleanup(instance, new_repre)
 
+    def _prepare_output_job(
+        self,
+        instance,
+        repre,
+        src_repre_staging_dir,
+        _output_def,
+        fill_data,
+        files_to_clean,
+        filled_frame_ranges
+    ):
+        """Prepare new representation and ffmpeg arguments of an output.
+
+        Returns:
+            Union[dict[str, Any], None]: Data of output to render or None
+                if input is not supported.
+        """
+        output_def = copy.deepcopy(_output_def)
+        # Make sure output definition has "tags" key
+        if "tags" not in output_def:
+            output_def["tags"] = []
+
+        if "burnins" not in output_def:
+            output_def["burnins"] = []
+
+        # Create copy of representation
+        new_repre = copy.deepcopy(repre)
+        # Make sure new representation has origin staging dir
+        #   - this is because source representation may change
+        #       it's staging dir because of ffmpeg conversion
+        new_repre["stagingDir"] = src_repre_staging_dir
+
+        # Remove "delete" tag from new repre if there is
+        if "delete" in new_repre["tags"]:
+            new_repre["tags"].remove("delete")
+
+        # Add additional tags from output definition to representation
+        for tag in output_def["tags"]:
+            if tag not in new_repre["tags"]:
+                new_repre["tags"].append(tag)
+
+        # Add burnin link from output definition to representation
+        for burnin in output_def["burnins"]:
+            if burnin not in new_repre.get("burnins", []):
+                if not new_repre.get("burnins"):
+                    new_repre["burnins"] = []
+                new_repre["burnins"].append(str(burnin))
+
+        self.log.debug(
+            "Linked burnins: `{}`".format(new_repre.get("burnins"))
+        )
+
+        self.log.debug(
+            "New representation tags: `{}`".format(
+                new_repre.get("tags"))
+        )
+
+        temp_data = self.prepare_temp_data(instance, repre, output_def)
+        # Gaps are filled only once for all outputs as they may be
+        #   rendered at the same time
+        frame_range = (temp_data["frame_start"], temp_data["frame_end"])
+        if (
+            temp_data["input_is_sequence"]
+            and frame_range not in filled_frame_ranges
+        ):
+            filled_frame_ranges.add(frame_range)
+            self.log.debug("Checking sequence to fill gaps in sequence..")
+            files_to_clean.extend(self.fill_sequence_gaps(
+                files=temp_data["origin_repre"]["files"],
+                staging_dir=new_repre["stagingDir"],
+                start_frame=temp_data["frame_start"],
+                end_frame=temp_data["frame_end"]
+            ))
+
+        # create or update outputName
+        output_name = new_repre.get("outputName", "")
+        output_ext = new_repre["ext"]
+        if output_name:
+            output_name += "_"
+        output_name += output_def["filename_suffix"]
+        if temp_data["without_handles"]:
+            output_name += "_noHandles"
+
+        # add outputName to anatomy format fill_data
+        fill_data.update({
+            "output": output_name,
+            "ext": output_ext
+        })
+
+        try:  # temporary until oiiotool is supported cross platform
+            input_args, video_filters, audio_filters, output_args = (
+                self._prepare_ffmpeg_arguments(
+                    output_def, instance, new_repre, temp_data, fill_data
+                )
+            )
+        except ZeroDivisionError:
+            # TODO recalculate width and height using OIIO before
+            #   conversion
+            if 'exr' in temp_data["origin_repre"]["ext"]:
+                self.log.warning(
+                    (
+                        "Unsupported compression on input files."
+                        " Skipping!!!"
+                    ),
+                    exc_info=True
+                )
+                return None
+            raise NotImplementedError
+
+        output_args = self._move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        new_repre.update({
+            "fps": temp_data["fps"],
+            "name": "{}_{}".format(output_name, output_ext),
+            "outputName": output_name,
+            "outputDef": output_def,
+            "frameStartFtrack": temp_data["output_frame_start"],
+            "frameEndFtrack": temp_data["output_frame_end"],
+        })
+        return {
+            "new_repre": new_repre,
+            "ffmpeg_args": (
+                input_args, video_filters, audio_filters, output_args
+            ),
+            "with_audio": not temp_data["output_ext_is_image"],
+            "duration": 0.0,
+            "group_size": 1
+        }
+
+    def _can_share_decode(self, job):
+        """Output can be rendered from input decoded for other outputs.
+
+        Outputs with additional inputs (e.g. audio), audio filters or
+        labeled filter graphs are always rendered in own process.
+        """
+        input_args, video_filters, audio_filters, output_args = (
+            job["ffmpeg_args"]
+        )
+        if input_args.count("-i") != 1 or audio_filters:
+            return False
+
+        for video_filter in video_filters:
+            if "[" in video_filter or ";" in video_filter:
+                return False
+
+        for arg in output_args:
+            if (
+                arg.startswith("-map")
+                or arg.startswith("-filter_complex")
+                or arg.startswith("-lavfi")
+            ):
+                return False
+        return True
+
+    def _group_output_jobs(self, jobs):
+        """Group outputs which can be rendered in single decode pass.
+
+        Args:
+            jobs (list[dict[str, Any]]): Prepared output jobs.
+
+        Returns:
+            list[list[dict[str, Any]]]: Groups of output jobs.
+        """
+        if not self.single_decode_outputs:
+            return [[job] for job in jobs]
+
+        groups = []
+        groups_by_input = {}
+        for job in jobs:
+            if not self._can_share_decode(job):
+                groups.append([job])
+                continue
+
+            input_key = tuple(job["ffmpeg_args"][0])
+            group = groups_by_input.get(input_key)
+            if group is None:
+                group = []
+                groups_by_input[input_key] = group
+                groups.append(group)
+            group.append(job)
+        return groups
+
+    def _get_output_group_cmd(self, group):
+        if len(group) == 1:
+            ffmpeg_args = self.ffmpeg_full_args(*group[0]["ffmpeg_args"])
+        else:
+            ffmpeg_args = self.ffmpeg_split_args(
+                [job["ffmpeg_args"] for job in group],
+                [job["with_audio"] for job in group]
+            )
+        return " ".join(ffmpeg_args)
+
+    def _render_output_jobs(self, jobs):
+        """Render prepared outputs.
+
+        Outputs are rendered concurrently up to 'max_parallel_outputs'
+        ffmpeg processes. When 'single_decode_outputs' is enabled, outputs
+        with matching input are rendered by single ffmpeg process.
+        """
+        executor = SubprocessExecutor(
+            max_workers=max(int(self.max_parallel_outputs or 1), 1),
+            logger=self.log
+        )
+        futures_by_group = []
+        try:
+            for group in self._group_output_jobs(jobs):
+                subprcs_cmd = self._get_output_group_cmd(group)
+                # run subprocess
+                self.log.debug("Executing: {}".format(subprcs_cmd))
+                future = executor.submit(subprcs_cmd, shell=True)
+                futures_by_group.append((future, group, subprcs_cmd))
+
+            wait_for_futures([item[0] for item in futures_by_group])
+
+        finally:
+            executor.shutdown(cancel=True)
+
+        for future, group, subprcs_cmd in futures_by_group:
+            for job in group:
+                job["duration"] = future.duration
+                job["group_size"] = len(group)
+                job["new_repre"]["ffmpeg_cmd"] = subprcs_cmd
+
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
         # TODO GLOBAL ISSUE - Find better way how to find out if input
@@ -493,8 +655,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
         first_sequence_frame = None
         if input_is_sequence and repre["files"]:
             # Calculate first frame that should be used
-            cols, _ = clique.assemble(repre["files"])
-            input_frames = list(sorted(cols[0].indexes))
+            sequences = SequenceIndex(repre["files"]).sequences
+            input_frames = list(sequences[0].frames)
             first_sequence_frame = input_frames[0]
             # WARNING: This is an issue as we don't know if first frame
             #   is with or without handles!
@@ -548,6 +710,27 @@ class ExtractReview(pyblish.api.InstancePlugin):
             temp_data (dict): Base data for successful process.
         """
 
+        return self.ffmpeg_full_args(*self._prepare_ffmpeg_arguments(
+            output_def, instance, new_repre, temp_data, fill_data
+        ))
+
+    def _prepare_ffmpeg_arguments(
+        self, output_def, instance, new_repre, temp_data, fill_data
+    ):
+        """Prepare ffmpeg arguments split by their purpose.
+
+        Args:
+            output_def (dict): Currently processed output definition.
+            instance (Instance): Currently processed instance.
+            new_repre (dict): Representation representing output of this
+                process.
+            temp_data (dict): Base data for successful process.
+
+        Returns:
+            tuple[list, list, list, list]: Input arguments, video filters,
+                audio filters and output arguments with output filepath.
+        """
+
         # Get FFmpeg arguments from profile presets
         out_def_ffmpeg_args = output_def.get("ffmpeg_args") or {}
 
@@ -722,7 +905,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             path_to_subprocess_arg(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -770,6 +953,83 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self._move_filters_from_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def ffmpeg_split_args(self, outputs_args, outputs_with_audio):
+        """Arguments rendering multiple outputs from single decoded input.
+
+        Input is decoded only once and video stream is split using ffmpeg
+        'split' filter to each output with its own filters chain. All
+        outputs must have same input arguments with single input, must not
+        have audio filters and their video filters must not use labels.
+
+        Args:
+            outputs_args (list[tuple[list, list, list, list]]): Input
+                arguments, video filters, audio filters and output arguments
+                of each output.
+            outputs_with_audio (list[bool]): Which outputs should keep audio
+                stream of the input.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        input_args = outputs_args[0][0]
+        split_labels = "".join(
+            "[split{}]".format(idx)
+            for idx in range(len(outputs_args))
+        )
+        filter_chains = ["[0:v]split={}{}".format(
+            len(outputs_args), split_labels
+        )]
+        all_output_args = []
+        for idx, output_args in enumerate(outputs_args):
+            _, video_filters, audio_filters, output_args = output_args
+            output_args = self._move_filters_from_output_args(
+                video_filters, audio_filters, output_args
+            )
+            filter_chains.append("[split{}]{}[out{}]".format(
+                idx, ",".join(video_filters) or "null", idx
+            ))
+            all_output_args.extend(["-map", "\"[out{}]\"".format(idx)])
+            if outputs_with_audio[idx]:
+                # Keep audio stream of input as ffmpeg would do by default
+                all_output_args.extend(["-map", "\"0:a:0?\""])
+            all_output_args.extend(output_args)
+
+        all_args = []
+        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(";".join(filter_chains)))
+        all_args.extend(all_output_args)
+
+        return all_args
+
+    def _move_filters_from_output_args(
+        self, video_filters, audio_filters, output_args
+    ):
+        """Move video and audio filters from output arguments to filters.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -786,29 +1046,16 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
-
-        all_args = []
-        all_args.append(path_to_subprocess_arg(self.ffmpeg_path))
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
         """Fill missing files in sequence by duplicating existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
+        This will take nearest frame file and link it with so as to fill
         gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        hole ahead. Hardlinks are used when possible, then symlinks and
+        file is copied only if filesystem does not support any of them.
 
         Args:
             files (list): List of representation files.
@@ -824,27 +1071,31 @@ class ExtractReview(pyblish.api.InstancePlugin):
             KnownPublishError: if more than one collection is obtained.
         """
 
-        collections = clique.assemble(files)[0]
-        if len(collections) != 1:
+        sequences = SequenceIndex(files).sequences
+        if len(sequences) != 1:
             raise KnownPublishError(
-                "Multiple collections {} found.".format(collections))
+                "Multiple collections {} found.".format(sequences))
 
-        col = collections[0]
+        sequence = sequences[0]
 
         # Prepare which hole is filled with what frame
         #   - the frame is filled only with already existing frames
-        prev_frame = next(iter(col.indexes))
-        hole_frame_to_nearest = {}
-        for frame in range(int(start_frame), int(end_frame) + 1):
-            if frame in col.indexes:
-                prev_frame = frame
-            else:
-                # Use previous frame as source for hole
-                hole_frame_to_nearest[frame] = prev_frame
+        #   - previous frame is used as source for hole
+        hole_frame_to_nearest = {
+            frame: sequence.get_previous_frame(frame)
+            for frame in sequence.get_missing_frames(
+                int(start_frame), int(end_frame)
+            )
+        }
 
         # Calculate paths
         added_files = []
-        col_format = col.format("{head}{padding}{tail}")
+        duplicate_methods = [
+            self._hardlink_frame,
+            self._symlink_frame,
+            speedcopy.copyfile
+        ]
+        col_format = sequence.format_template
         for hole_frame, src_frame in hole_frame_to_nearest.items():
             hole_fpath = os.path.join(staging_dir, col_format % hole_frame)
             src_fpath = os.path.join(staging_dir, col_format % src_frame)
@@ -852,11 +1103,41 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 raise KnownPublishError(
                     "Missing previously detected file: {}".format(src_fpath))
 
-            speedcopy.copyfile(src_fpath, hole_fpath)
+            if os.path.lexists(hole_fpath):
+                os.remove(hole_fpath)
+
+            # Method which failed is not used for following frames
+            while True:
+                method = duplicate_methods[0]
+                try:
+                    method(src_fpath, hole_fpath)
+                    break
+                except (OSError, NotImplementedError):
+                    if len(duplicate_methods) == 1:
+                        raise
+                    self.log.debug(
+                        "Failed to duplicate frame using {}.".format(
+                            method.__name__
+                        ),
+                        exc_info=True
+                    )
+                    duplicate_methods.pop(0)
             added_files.append(hole_fpath)
 
+        if added_files:
+            self.log.debug("Filled {} missing frames using {}".format(
+                len(added_files), duplicate_methods[0].__name__
+            ))
         return added_files
 
+    def _hardlink_frame(self, src_path, dst_path):
+        create_hard_link(src_path, dst_path)
+
+    def _symlink_frame(self, src_path, dst_path):
+        if not hasattr(os, "symlink"):
+            raise NotImplementedError("Symlinks are not supported")
+        os.symlink(os.path.abspath(src_path), dst_path)
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
@@ -875,13 +1156,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
         dst_staging_dir = new_repre["stagingDir"]
 
         if temp_data["input_is_sequence"]:
-            collections = clique.assemble(repre["files"])[0]
+            sequence = SequenceIndex(repre["files"]).sequences[0]
             full_input_path = os.path.join(
-                src_staging_dir,
-                collections[0].format("{head}{padding}{tail}")
+                src_staging_dir, sequence.format_template
             )
 
-            filename = collections[0].format("{head}")
+            filename = sequence.head
             if filename.endswith("."):
                 filename = filename[:-1]
 
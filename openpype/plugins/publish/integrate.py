@@ -32,6 +32,7 @@ from openpype.pipeline.publish import (
     KnownPublishError,
     get_publish_template_name,
 )
+from openpype.pipeline.publish.content_store import get_content_store
 
 log = logging.getLogger(__name__)
 
@@ -201,6 +202,28 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         # the try, except.
         file_transactions.finalize()
 
+    def _add_file_transfer(
+        self,
+        file_transactions,
+        content_store,
+        src,
+        dst,
+        mode=FileTransaction.MODE_COPY
+    ):
+        """Add file transfer to file transaction.
+
+        Copied files are stored into content store (if is enabled) and
+        destination is hardlinked to the stored object.
+        """
+        if (
+            content_store is not None
+            and mode == FileTransaction.MODE_COPY
+            and content_store.can_link(dst)
+        ):
+            src = content_store.add_file(src)
+            mode = FileTransaction.MODE_HARDLINK
+        file_transactions.add(src, dst, mode=mode)
+
     def _temp_skip_instance_by_settings(self, instance):
         """Decide if instance will be processed with new or legacy integrator.
 
@@ -290,6 +313,15 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
         instance.data["versionEntity"] = version
 
         anatomy = instance.context.data["anatomy"]
+        content_store = get_content_store(
+            project_name,
+            anatomy,
+            instance.context.data["project_settings"],
+            log=self.log
+        )
+        if content_store is not None:
+            self.log.debug(
+                "Using content store: {}".format(content_store.root))
 
         # Get existing representations (if any)
         existing_repres_by_name = {
@@ -315,7 +347,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
             for src, dst in prepared["transfers"]:
                 # todo: add support for hardlink transfers
-                file_transactions.add(src, dst)
+                self._add_file_transfer(
+                    file_transactions, content_store, src, dst
+                )
 
             prepared_representations.append(prepared)
 
@@ -333,7 +367,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
             for src, dst in instance.data.get(files_type, []):
                 self._validate_path_in_project_roots(anatomy, dst)
 
-                file_transactions.add(src, dst, mode=copy_mode)
+                self._add_file_transfer(
+                    file_transactions, content_store, src, dst, copy_mode
+                )
                 resource_destinations.add(os.path.abspath(dst))
 
         # Bulk write to the database
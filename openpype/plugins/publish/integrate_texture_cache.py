@@ -0,0 +1,30 @@
+import pyblish.api
+
+from openpype.pipeline.publish.texture_cache import register_texture_hashes
+
+
+class IntegrateTextureCache(pyblish.api.InstancePlugin):
+    """Store published textures by source hash into texture cache.
+
+    Texture extractors can reuse already published (and converted) textures
+    found by the hash instead of processing them again.
+    """
+
+    order = pyblish.api.IntegratorOrder + 0.1
+    label = "Integrate Texture Cache"
+
+    def process(self, instance):
+        hashes = instance.data.get("sourceHashes")
+        if not hashes:
+            return
+
+        version_doc = instance.data.get("versionEntity")
+        if not version_doc:
+            self.log.debug("Instance was not integrated. Skipping.")
+            return
+
+        project_name = instance.context.data["projectName"]
+        register_texture_hashes(project_name, hashes, version_doc["_id"])
+        self.log.debug(
+            "Stored {} texture hashes to texture cache.".format(len(hashes))
+        )
@@ -89,7 +89,7 @@ class PypeCommands:
 
         from openpype.lib import Logger
         from openpype.lib.applications import get_app_environments_for_context
-        from openpype.modules import ModulesManager
+        from openpype.modules import get_modules_manager
         from openpype.pipeline import install_openpype_plugins
         from openpype.tools.utils.host_tools import show_publish
         from openpype.tools.utils.lib import qt_app_context
@@ -102,7 +102,7 @@ class PypeCommands:
 
         install_openpype_plugins()
 
-        manager = ModulesManager()
+        manager = get_modules_manager()
 
         publish_paths = manager.collect_plugin_paths()["publish"]
 
@@ -342,9 +342,9 @@ class PypeCommands:
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
 
-        from openpype.modules import ModulesManager
+        from openpype.modules import get_modules_manager
 
-        manager = ModulesManager()
+        manager = get_modules_manager()
         sync_server_module = manager.modules_by_name["sync_server"]
 
         sync_server_module.server_init()
@@ -360,7 +360,9 @@ class PypeCommands:
         version_packer = VersionRepacker(directory)
         version_packer.process()
 
-    def pack_project(self, project_name, dirpath, database_only):
+    def pack_project(
+        self, project_name, dirpath, database_only, volume_size=None
+    ):
         from openpype.lib.project_backpack import pack_project
 
         if database_only and not dirpath:
@@ -370,9 +372,41 @@ class PypeCommands:
                 " to specify directory."
             ))
 
-        pack_project(project_name, dirpath, database_only)
+        max_volume_size = None
+        if volume_size:
+            max_volume_size = volume_size * 1024 * 1024
+        pack_project(
+            project_name,
+            dirpath,
+            database_only,
+            max_volume_size=max_volume_size
+        )
 
     def unpack_project(self, zip_filepath, new_root, database_only):
         from openpype.lib.project_backpack import unpack_project
 
         unpack_project(zip_filepath, new_root, database_only)
+
+    def cleanup_content_store(self, project_name, min_age, dry_run):
+        from openpype.lib import format_file_size
+        from openpype.pipeline import Anatomy
+        from openpype.pipeline.publish.content_store import get_content_store
+        from openpype.settings import get_project_settings
+
+        content_store = get_content_store(
+            project_name,
+            Anatomy(project_name),
+            get_project_settings(project_name)
+        )
+        if content_store is None:
+            print("Content store is not enabled for project {}".format(
+                project_name))
+            return
+
+        count, size = content_store.cleanup(min_age, dry_run)
+        print("{} {} unused files ({}) from {}".format(
+            "Found" if dry_run else "Removed",
+            count,
+            format_file_size(size),
+            content_store.root
+        ))
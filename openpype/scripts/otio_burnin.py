@@ -4,6 +4,7 @@ import subprocess
 import platform
 import json
 import tempfile
+import traceback
 from string import Formatter
 
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
@@ -39,6 +40,8 @@ CURRENT_FRAME_KEY = "{current_frame}"
 CURRENT_FRAME_SPLITTER = "_-_CURRENT_FRAME_-_"
 TIMECODE_KEY = "{timecode}"
 SOURCE_TIMECODE_KEY = "{source_timecode}"
+# Prefix of output line with result of job processed by worker
+WORKER_RESULT_PREFIX = "__OP_BURNIN_RESULT__ "
 
 
 def _get_ffprobe_data(source):
@@ -587,7 +590,8 @@ def prepare_fill_values(burnin_template, data):
 def burnins_from_data(
     input_path, output_path, data,
     codec_data=None, options=None, burnin_values=None, overwrite=True,
-    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None
+    full_input_path=None, first_frame=None, source_ffmpeg_cmd=None,
+    ffprobe_data=None
 ):
     """This method adds burnins to video/image file based on presets setting.
 
@@ -603,6 +607,8 @@ def burnins_from_data(
         burnin_values (dict): Contain positioned values.
         overwrite (bool): Output will be overwritten if already exists,
             True by default.
+        ffprobe_data (dict): Data of 'full_input_path' from ffprobe. Input
+            is probed if not passed.
 
     Presets must be set separately. Should be dict with 2 keys:
     - "options" - sets look of burnins - colors, opacity,...
@@ -646,8 +652,7 @@ def burnins_from_data(
         "shot": "sh0010"
     }
     """
-    ffprobe_data = None
-    if full_input_path:
+    if not ffprobe_data and full_input_path:
         ffprobe_data = _get_ffprobe_data(full_input_path)
 
     burnin = ModifiedBurnins(input_path, ffprobe_data, options, first_frame)
@@ -818,12 +823,12 @@ def burnins_from_data(
         os.remove(path)
 
 
-if __name__ == "__main__":
-    print("* Burnin script started")
-    in_data_json_path = sys.argv[-1]
-    with open(in_data_json_path, "r") as file_stream:
-        in_data = json.load(file_stream)
+def process_burnin_data(in_data):
+    """Render burnins using data prepared by 'ExtractBurnin' plugin.
 
+    Args:
+        in_data (dict[str, Any]): Burnin data with input and output paths.
+    """
     burnins_from_data(
         in_data["input"],
         in_data["output"],
@@ -833,6 +838,49 @@ if __name__ == "__main__":
         burnin_values=in_data.get("values"),
         full_input_path=in_data.get("full_input_path"),
         first_frame=in_data.get("first_frame"),
-        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd")
+        source_ffmpeg_cmd=in_data.get("ffmpeg_cmd"),
+        ffprobe_data=in_data.get("ffprobe_data")
     )
+
+
+def run_worker():
+    """Process burnin jobs until stdin is closed.
+
+    Each line of stdin is path to json file with burnin data. Result of each
+    job is printed as json on a line starting with 'WORKER_RESULT_PREFIX'.
+    """
+    print("* Burnin worker started")
+    sys.stdout.flush()
+    for line in sys.stdin:
+        in_data_json_path = line.strip()
+        if not in_data_json_path:
+            continue
+
+        error = None
+        try:
+            with open(in_data_json_path, "r") as file_stream:
+                in_data = json.load(file_stream)
+            process_burnin_data(in_data)
+        except Exception:
+            error = traceback.format_exc()
+
+        print(WORKER_RESULT_PREFIX + json.dumps({
+            "path": in_data_json_path,
+            "error": error
+        }))
+        sys.stdout.flush()
+    print("* Burnin worker has finished")
+
+
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        run_worker()
+        sys.exit(0)
+
+    print("* Burnin script started")
+    in_data_json_path = sys.argv[-1]
+    with open(in_data_json_path, "r") as file_stream:
+        in_data = json.load(file_stream)
+
+    process_burnin_data(in_data)
     print("* Burnin script has finished")
@@ -892,9 +892,12 @@ def apply_local_settings_on_project_settings(
 
 def get_system_settings(clear_metadata=True, exclude_locals=None):
     """System settings with applied studio overrides."""
-    default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
-    studio_values = get_studio_system_settings_overrides()
-    result = apply_overrides(default_values, studio_values)
+    from openpype.lib.profiling import startup_phase
+
+    with startup_phase("settings.system"):
+        default_values = get_default_settings()[SYSTEM_SETTINGS_KEY]
+        studio_values = get_studio_system_settings_overrides()
+        result = apply_overrides(default_values, studio_values)
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -1002,12 +1005,15 @@ def get_project_settings(
             " Call `get_default_project_settings` to get project defaults."
         )
 
-    studio_overrides = get_default_project_settings(False)
-    project_overrides = get_project_settings_overrides(
-        project_name
-    )
+    from openpype.lib.profiling import startup_phase
+
+    with startup_phase("settings.project"):
+        studio_overrides = get_default_project_settings(False)
+        project_overrides = get_project_settings_overrides(
+            project_name
+        )
 
-    result = apply_overrides(studio_overrides, project_overrides)
+        result = apply_overrides(studio_overrides, project_overrides)
 
     # Clear overrides metadata from settings
     if clear_metadata:
@@ -0,0 +1,75 @@
+import time
+import logging
+
+import pymongo
+
+from openpype.lib.log import MongoFormatter, MongoQueueHandler
+
+try:
+    from log4mongo.handlers import MongoHandler
+except ImportError:
+    MongoHandler = None
+
+
+class LogPerformance():
+    '''
+        Compare throughput of logging to mongo with synchronous log4mongo
+        handler and batched 'MongoQueueHandler'.
+
+        Prints number of records emitted per second from caller thread and
+        total time until all records are stored in collection.
+    '''
+
+    MONGO_URL = 'mongodb://localhost:27017'
+    MONGO_DB = 'performance_test'
+    MONGO_COLLECTION = 'log_performance_test'
+
+    def __init__(self):
+        self.client = pymongo.MongoClient(self.MONGO_URL)
+        self.collection = self.client[self.MONGO_DB][self.MONGO_COLLECTION]
+
+    def _run_logger(self, name, handler, number_of_records):
+        self.collection.delete_many({})
+
+        logger = logging.getLogger(name)
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(handler)
+
+        start = time.time()
+        for idx in range(number_of_records):
+            logger.info("Record number %s", idx)
+        emitted = time.time() - start
+
+        handler.flush()
+        stored = time.time() - start
+        logger.removeHandler(handler)
+        handler.close()
+
+        print("{}: emit {:.0f} rec/s, stored {} records in {:.3f}s".format(
+            name,
+            number_of_records / max(emitted, 0.000001),
+            self.collection.count_documents({}),
+            stored
+        ))
+
+    def run(self, number_of_records=10000):
+        if MongoHandler is not None:
+            handler = MongoHandler(
+                host=self.MONGO_URL,
+                database_name=self.MONGO_DB,
+                collection=self.MONGO_COLLECTION,
+                formatter=MongoFormatter()
+            )
+            self._run_logger("sync", handler, number_of_records)
+
+        handler = MongoQueueHandler(
+            self.collection, max_queue_size=number_of_records
+        )
+        handler.setFormatter(MongoFormatter())
+        self._run_logger("batched", handler, number_of_records)
+
+
+if __name__ == '__main__':
+    lp = LogPerformance()
+    lp.run(10000)
@@ -13,7 +13,10 @@ from openpype.client import (
     get_assets,
     get_asset_ids_with_subsets,
 )
-from openpype.client.operations import CURRENT_ASSET_DOC_SCHEMA
+from openpype.client.operations import (
+    CURRENT_ASSET_DOC_SCHEMA,
+    mark_project_entities_changed,
+)
 from openpype.lib import Logger
 
 from .constants import (
@@ -1416,6 +1419,8 @@ class HierarchyModel(QtCore.QAbstractItemModel):
         if bulk_writes:
             project_col.bulk_write(bulk_writes)
 
+        mark_project_entities_changed(project_name)
+
         self.log.info((
             "Save finished."
             " Created {} | Updated {} | Removed {} asset documents"
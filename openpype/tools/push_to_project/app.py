@@ -6,13 +6,17 @@ from openpype.tools.push_to_project.window import PushToContextSelectWindow
 
 @click.command()
 @click.option("--project", help="Source project name")
-@click.option("--version", help="Source version id")
+@click.option(
+    "--version",
+    multiple=True,
+    help="Source version id (can be used multiple times)"
+)
 def main(project, version):
-    """Run PushToProject tool to integrate version in different project.
+    """Run PushToProject tool to integrate versions in different project.
 
     Args:
         project (str): Source project name.
-        version (str): Version id.
+        version (tuple[str]): Version ids.
     """
 
     app = QtWidgets.QApplication.instance()
@@ -32,7 +36,8 @@ def main(project, version):
 
     window = PushToContextSelectWindow()
     window.show()
-    window.controller.set_source(project, version)
+    version_id = version[0] if version else None
+    window.controller.set_source(project, version_id, version)
 
     app.exec_()
 
@@ -22,6 +22,7 @@ from .control_integrate import (
     ProjectPushItem,
     ProjectPushItemProcess,
     ProjectPushItemStatus,
+    ProjectPushBatchProcess,
 )
 
 
@@ -366,9 +367,23 @@ class UserPublishValues:
 
 
 class PushToContextController:
-    def __init__(self, project_name=None, version_id=None):
+    """Controller of push to project tool.
+
+    Source is defined by one version which is used to fill default values
+    in UI. Other versions selected by user can be passed with 'version_ids'
+    and all of them are pushed with one batch to the same context.
+
+    Args:
+        project_name (Optional[str]): Source project name.
+        version_id (Optional[str]): Source version id.
+        version_ids (Optional[Iterable[str]]): All source version ids to
+            push. Only 'version_id' is pushed if not passed.
+    """
+
+    def __init__(self, project_name=None, version_id=None, version_ids=None):
         self._src_project_name = None
         self._src_version_id = None
+        self._src_version_ids = []
         self._src_asset_doc = None
         self._src_subset_doc = None
         self._src_version_doc = None
@@ -392,7 +407,7 @@ class PushToContextController:
         self._process_thread = None
         self._process_item = None
 
-        self.set_source(project_name, version_id)
+        self.set_source(project_name, version_id, version_ids)
 
     def _get_task_info_from_repre_docs(self, asset_doc, repre_docs):
         asset_tasks = asset_doc["data"].get("tasks") or {}
@@ -483,15 +498,24 @@ class PushToContextController:
             subset_name = subset_name[:len(subset_e)]
         return subset_name
 
-    def set_source(self, project_name, version_id):
+    def set_source(self, project_name, version_id, version_ids=None):
+        src_version_ids = []
+        if version_id:
+            src_version_ids.append(version_id)
+        for src_version_id in version_ids or []:
+            if src_version_id not in src_version_ids:
+                src_version_ids.append(src_version_id)
+
         if (
             project_name == self._src_project_name
             and version_id == self._src_version_id
+            and src_version_ids == self._src_version_ids
         ):
             return
 
         self._src_project_name = project_name
         self._src_version_id = version_id
+        self._src_version_ids = src_version_ids
         asset_doc = None
         subset_doc = None
         version_doc = None
@@ -533,6 +557,10 @@ class PushToContextController:
     def src_version_id(self):
         return self._src_version_id
 
+    @property
+    def src_version_ids(self):
+        return list(self._src_version_ids)
+
     @property
     def src_label(self):
         if not self._src_project_name or not self._src_version_id:
@@ -547,12 +575,16 @@ class PushToContextController:
         asset_path = "/".join(asset_path_parts)
         subset_doc = self.src_subset_doc
         version_doc = self.src_version_doc
-        return "Source: {}/{}/{}/v{:0>3}".format(
+        label = "Source: {}/{}/{}/v{:0>3}".format(
             self._src_project_name,
             asset_path,
             subset_doc["name"],
             version_doc["name"]
         )
+        other_versions = len(self._src_version_ids) - 1
+        if other_versions > 0:
+            label += " (+{} other versions)".format(other_versions)
+        return label
 
     @property
     def src_version_doc(self):
@@ -636,20 +668,18 @@ class PushToContextController:
         if self._process_thread is not None:
             return
 
-        item = ProjectPushItem(
-            self.src_project_name,
-            self.src_version_id,
-            self.selection_model.project_name,
-            self.selection_model.asset_id,
-            self.selection_model.task_name,
-            self.user_values.variant,
-            comment=self.user_values.comment,
-            new_asset_name=self.user_values.new_asset_name,
-            dst_version=1
-        )
-
         status_item = ProjectPushItemStatus(event_system=self._event_system)
-        process_item = ProjectPushItemProcess(item, status_item)
+        if len(self._src_version_ids) > 1:
+            # Destination versions are reserved by batch so versions pushed
+            #   to the same subset don't override each other
+            items = [
+                self._create_push_item(version_id)
+                for version_id in self._src_version_ids
+            ]
+            process_item = ProjectPushBatchProcess(items, status_item)
+        else:
+            item = self._create_push_item(self.src_version_id, 1)
+            process_item = ProjectPushItemProcess(item, status_item)
         self._process_item = process_item
         self._event_system.emit("submit.started", {}, "controller")
         if wait:
@@ -662,6 +692,19 @@ class PushToContextController:
         thread.start()
         return process_item
 
+    def _create_push_item(self, version_id, dst_version=None):
+        return ProjectPushItem(
+            self.src_project_name,
+            version_id,
+            self.selection_model.project_name,
+            self.selection_model.asset_id,
+            self.selection_model.task_name,
+            self.user_values.variant,
+            comment=self.user_values.comment,
+            new_asset_name=self.user_values.new_asset_name,
+            dst_version=dst_version
+        )
+
     def wait_for_process_thread(self):
         if self._process_thread is None:
             return
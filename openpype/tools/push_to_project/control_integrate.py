@@ -1,10 +1,12 @@
 import os
 import re
 import copy
+import time
 import socket
 import itertools
 import datetime
 import sys
+import threading
 import traceback
 
 from bson.objectid import ObjectId
@@ -266,6 +268,41 @@ class ProjectPushItemStatus:
 
         return self._traceback
 
+    def set_progress(
+        self,
+        processed_items,
+        items_count,
+        transferred_files=0,
+        files_count=0,
+        transferred_size=0,
+        duration=0.0
+    ):
+        """Report progress of push.
+
+        Args:
+            processed_items (int): Number of processed push items.
+            items_count (int): Number of all push items.
+            transferred_files (int): Number of transferred files.
+            files_count (int): Number of all files to transfer.
+            transferred_size (int): Transferred size in bytes.
+            duration (float): Duration of transfers in seconds.
+        """
+
+        throughput = 0
+        if duration > 0:
+            throughput = transferred_size / duration
+        self.emit_event(
+            "push.progress.changed",
+            {
+                "processed_items": processed_items,
+                "items_count": items_count,
+                "transferred_files": transferred_files,
+                "files_count": files_count,
+                "transferred_size": transferred_size,
+                "throughput": throughput
+            }
+        )
+
     # Loggin helpers
     # TODO better logging
     def add_message(self, message, level):
@@ -294,6 +331,28 @@ class ProjectPushItemStatus:
         return self.add_message(message, "critical")
 
 
+def get_representation_sites(project_name):
+    """Sites of published representation files in project.
+
+    Args:
+        project_name (str): Destination project name.
+
+    Returns:
+        list[dict[str, Any]]: Sites of representation files.
+    """
+
+    modules_manager = ModulesManager()
+    sync_server_module = modules_manager.get("sync_server")
+    if sync_server_module is None or not sync_server_module.enabled:
+        return [{
+            "name": "studio",
+            "created_dt": datetime.datetime.now()
+        }]
+    return sync_server_module.compute_resource_sync_sites(
+        project_name=project_name
+    )
+
+
 class ProjectPushRepreItem:
     """Representation item.
 
@@ -509,13 +568,16 @@ class ProjectPushItemProcess:
     Args:
         item (ProjectPushItem): Item which is being processed.
         item_status (ProjectPushItemStatus): Object to store status.
+        batch (Optional[ProjectPushBatchProcess]): Batch which commits
+            database operations and processes file transfers of the item.
     """
 
     # TODO where to get host?!!!
     host_name = "republisher"
 
-    def __init__(self, item, item_status=None):
+    def __init__(self, item, item_status=None, batch=None):
         self._item = item
+        self._batch = batch
 
         self._src_project_doc = None
         self._src_asset_doc = None
@@ -538,11 +600,17 @@ class ProjectPushItemProcess:
         self._project_settings = None
         self._template_name = None
 
+        self._integration_data = None
+
         if item_status is None:
             item_status = ProjectPushItemStatus()
         self._status = item_status
-        self._operations = OperationsSession()
-        self._file_transaction = FileTransaction()
+        if batch is None:
+            self._operations = OperationsSession()
+            self._file_transaction = FileTransaction()
+        else:
+            self._operations = batch.operations
+            self._file_transaction = batch.file_transaction
 
     @property
     def status(self):
@@ -722,9 +790,18 @@ class ProjectPushItemProcess:
                 tools = list(_tools)
 
         asset_name_low = asset_name.lower()
-        other_asset_docs = get_assets(
-            project_doc["name"], fields=["_id", "name", "data.visualParent"]
-        )
+        if self._batch is not None:
+            other_asset_docs = self._batch.get_asset_docs(project_doc["name"])
+            created_asset_doc = self._batch.get_created_entity(
+                project_doc["name"], "asset", asset_name_low
+            )
+            if created_asset_doc is not None:
+                other_asset_docs = [created_asset_doc]
+        else:
+            other_asset_docs = get_assets(
+                project_doc["name"],
+                fields=["_id", "name", "data.visualParent"]
+            )
         for other_asset_doc in other_asset_docs:
             other_name = other_asset_doc["name"]
             other_parent_id = other_asset_doc["data"].get("visualParent")
@@ -742,6 +819,10 @@ class ProjectPushItemProcess:
                 f"Found already existing asset with name \"{other_name}\""
                 f" which match requested name \"{asset_name}\""
             ))
+            if self._batch is not None and self._batch.get_created_entity(
+                project_doc["name"], "asset", asset_name_low
+            ):
+                return other_asset_doc
             return get_asset_by_id(project_doc["name"], other_asset_doc["_id"])
 
         data_keys = (
@@ -783,6 +864,10 @@ class ProjectPushItemProcess:
             f"Creating new asset with name \"{asset_name}\""
         )
         self._created_asset_doc = asset_doc
+        if self._batch is not None:
+            self._batch.add_created_entity(
+                project_doc["name"], "asset", asset_name_low, asset_doc
+            )
         return asset_doc
 
     def fill_or_create_destination_asset(self):
@@ -900,7 +985,16 @@ class ProjectPushItemProcess:
         asset_id = self.asset_doc["_id"]
         subset_name = self.subset_name
         family = self.family
-        subset_doc = get_subset_by_name(project_name, subset_name, asset_id)
+        subset_key = (asset_id, subset_name.lower())
+        subset_doc = None
+        if self._batch is not None:
+            subset_doc = self._batch.get_created_entity(
+                project_name, "subset", subset_key
+            )
+        if subset_doc is None:
+            subset_doc = get_subset_by_name(
+                project_name, subset_name, asset_id
+            )
         if subset_doc:
             self._subset_doc = subset_doc
             return subset_doc
@@ -913,6 +1007,10 @@ class ProjectPushItemProcess:
         )
         self._operations.create_entity(project_name, "subset", subset_doc)
         self._subset_doc = subset_doc
+        if self._batch is not None:
+            self._batch.add_created_entity(
+                project_name, "subset", subset_key, subset_doc
+            )
 
     def make_sure_version_exists(self):
         """Make sure version document exits in database."""
@@ -944,6 +1042,23 @@ class ProjectPushItemProcess:
             if last_version_doc:
                 version += int(last_version_doc["name"])
 
+            # Versions of the same subset may be created in the batch
+            if self._batch is not None:
+                version = max(
+                    version,
+                    self._batch.get_next_version(project_name, subset_id)
+                )
+
+        if self._batch is not None:
+            if not self._batch.reserve_version(
+                project_name, subset_id, version
+            ):
+                self._status.set_failed((
+                    f"Version {version} of subset \"{self.subset_name}\""
+                    " is already pushed by other item of the batch"
+                ))
+                raise PushToProjectError(self._status.fail_reason)
+
         existing_version_doc = get_version_by_name(
             project_name, version, subset_id
         )
@@ -990,6 +1105,16 @@ class ProjectPushItemProcess:
             raise
 
     def _integrate_representations(self):
+        self.prepare_representations_transfers()
+        self._file_transaction.process()
+        self.prepare_representations_database_operations()
+        self._status.info("Finalization")
+        self._operations.commit()
+        self._file_transaction.finalize()
+
+    def prepare_representations_transfers(self):
+        """Add files of representations to file transaction."""
+
         version_doc = self.version_doc
         version_id = version_doc["_id"]
         existing_repres = get_representations(
@@ -1024,17 +1149,32 @@ class ProjectPushItemProcess:
         processed_repre_items = self._prepare_file_transactions(
             anatomy, template_name, formatting_data, file_template
         )
-        self._file_transaction.process()
-        self._status.info("Preparing database changes")
-        self._prepare_database_operations(
+        self._integration_data = (
             version_id,
             processed_repre_items,
             path_template,
             existing_repres_by_low_name
         )
-        self._status.info("Finalization")
-        self._operations.commit()
-        self._file_transaction.finalize()
+
+    @property
+    def files_count(self):
+        """Number of files prepared for transfer."""
+
+        if self._integration_data is None:
+            return 0
+        return sum(
+            len(repre_filepaths)
+            for _, repre_filepaths, _, _ in self._integration_data[1]
+        )
+
+    def prepare_representations_database_operations(self):
+        """Add representations to operations session.
+
+        Files must be already transferred.
+        """
+
+        self._status.info("Preparing database changes")
+        self._prepare_database_operations(*self._integration_data)
 
     def _prepare_file_transactions(
         self, anatomy, template_name, formatting_data, file_template
@@ -1103,17 +1243,10 @@ class ProjectPushItemProcess:
         path_template,
         existing_repres_by_low_name
     ):
-        modules_manager = ModulesManager()
-        sync_server_module = modules_manager.get("sync_server")
-        if sync_server_module is None or not sync_server_module.enabled:
-            sites = [{
-                "name": "studio",
-                "created_dt": datetime.datetime.now()
-            }]
+        if self._batch is not None:
+            sites = self._batch.get_sites(self._item.dst_project_name)
         else:
-            sites = sync_server_module.compute_resource_sync_sites(
-                project_name=self._item.dst_project_name
-            )
+            sites = get_representation_sites(self._item.dst_project_name)
 
         added_repre_names = set()
         for item in processed_repre_items:
@@ -1176,21 +1309,26 @@ class ProjectPushItemProcess:
                 {"type": "archived_representation"}
             )
 
+    def prepare_prerequirements(self):
+        """Find source entities and prepare destination entities."""
+
+        self.fill_source_variables()
+        self._status.info("Source entities were found")
+        self.fill_destination_project()
+        self._status.info("Destination project was found")
+        self.fill_or_create_destination_asset()
+        self._status.info("Destination asset was determined")
+        self.determine_family()
+        self.determine_publish_template_name()
+        self.determine_subset_name()
+        self.make_sure_subset_exists()
+        self.make_sure_version_exists()
+        self._status.info("Prerequirements were prepared")
+
     def process(self):
         try:
             self._status.info("Process started")
-            self.fill_source_variables()
-            self._status.info("Source entities were found")
-            self.fill_destination_project()
-            self._status.info("Destination project was found")
-            self.fill_or_create_destination_asset()
-            self._status.info("Destination asset was determined")
-            self.determine_family()
-            self.determine_publish_template_name()
-            self.determine_subset_name()
-            self.make_sure_subset_exists()
-            self.make_sure_version_exists()
-            self._status.info("Prerequirements were prepared")
+            self.prepare_prerequirements()
             self.integrate_representations()
             self._status.info("Integration finished")
 
@@ -1207,3 +1345,181 @@ class ProjectPushItemProcess:
 
         finally:
             self._status.set_finished()
+
+
+class ProjectPushBatchProcess:
+    """Push multiple versions to project in batches.
+
+    Database operations of all items in a batch are committed at once and
+    files of all items in a batch are transferred concurrently. Batch is
+    rolled back as a whole when any of its items fails and processing of
+    following batches is stopped. Progress is reported with
+    'push.progress.changed' events of status.
+
+    Args:
+        items (list[ProjectPushItem]): Items to push.
+        status (Optional[ProjectPushItemStatus]): Object to store status.
+        batch_size (Optional[int]): Number of items in one batch.
+        max_workers (Optional[int]): Number of files transferred at once.
+    """
+
+    default_batch_size = 50
+    default_max_workers = 8
+
+    def __init__(self, items, status=None, batch_size=None, max_workers=None):
+        if status is None:
+            status = ProjectPushItemStatus()
+
+        self._items = list(items)
+        self._status = status
+        self._batch_size = batch_size or self.default_batch_size
+        self._max_workers = max_workers or self.default_max_workers
+
+        self.operations = None
+        self.file_transaction = None
+
+        self._processed_items = 0
+        self._progress_lock = threading.Lock()
+        self._progress = {}
+        self._created_entities = {}
+        self._reserved_versions = {}
+        self._asset_docs_by_project = {}
+        self._sites_by_project = {}
+
+    @property
+    def status(self):
+        return self._status
+
+    def get_asset_docs(self, project_name):
+        """Cached asset documents used to find existing assets."""
+
+        if project_name not in self._asset_docs_by_project:
+            self._asset_docs_by_project[project_name] = list(get_assets(
+                project_name, fields=["_id", "name", "data.visualParent"]
+            ))
+        return self._asset_docs_by_project[project_name]
+
+    def get_sites(self, project_name):
+        if project_name not in self._sites_by_project:
+            self._sites_by_project[project_name] = (
+                get_representation_sites(project_name)
+            )
+        return self._sites_by_project[project_name]
+
+    def get_created_entity(self, project_name, entity_type, key):
+        """Entity created by other item of the batch."""
+
+        return self._created_entities.get((project_name, entity_type, key))
+
+    def add_created_entity(self, project_name, entity_type, key, doc):
+        self._created_entities[(project_name, entity_type, key)] = doc
+
+    def get_next_version(self, project_name, subset_id):
+        """Next version of subset after versions reserved in the batch."""
+
+        versions = self._reserved_versions.get((project_name, subset_id))
+        if not versions:
+            return 1
+        return max(versions) + 1
+
+    def reserve_version(self, project_name, subset_id, version):
+        """Reserve version of subset for an item.
+
+        Returns:
+            bool: Version was not reserved by other item of the batch.
+        """
+
+        versions = self._reserved_versions.setdefault(
+            (project_name, subset_id), set()
+        )
+        if version in versions:
+            return False
+        versions.add(version)
+        return True
+
+    def _clear_batch_cache(self):
+        self._created_entities = {}
+        self._reserved_versions = {}
+        self._asset_docs_by_project = {}
+
+    def _on_file_transferred(self, _dst_path, size):
+        with self._progress_lock:
+            self._progress["transferred_files"] += 1
+            self._progress["transferred_size"] += size
+            progress = dict(self._progress)
+        self._emit_progress(progress)
+
+    def _emit_progress(self, progress):
+        self._status.set_progress(
+            self._processed_items,
+            len(self._items),
+            progress["transferred_files"],
+            progress["files_count"],
+            progress["transferred_size"],
+            time.time() - progress["started"]
+        )
+
+    def _process_batch(self, items):
+        self.operations = OperationsSession()
+        self.file_transaction = FileTransaction(max_workers=self._max_workers)
+        self._clear_batch_cache()
+        try:
+            processes = []
+            for item in items:
+                self._status.info(f"Preparing push of {item}")
+                process = ProjectPushItemProcess(
+                    item, self._status, batch=self
+                )
+                process.prepare_prerequirements()
+                process.prepare_representations_transfers()
+                processes.append(process)
+
+            self._progress = {
+                "transferred_files": 0,
+                "files_count": sum(
+                    process.files_count for process in processes
+                ),
+                "transferred_size": 0,
+                "started": time.time()
+            }
+            self._status.info(
+                f"Transferring {self._progress['files_count']} files"
+            )
+            self.file_transaction.process(self._on_file_transferred)
+            for process in processes:
+                process.prepare_representations_database_operations()
+
+            self._status.info("Committing database changes")
+            self.operations.commit()
+
+        except Exception:
+            self.operations.clear()
+            self.file_transaction.rollback()
+            raise
+
+        self.file_transaction.finalize()
+        self._processed_items += len(items)
+        self._emit_progress(self._progress)
+
+    def process(self):
+        try:
+            self._status.info(
+                f"Batch push of {len(self._items)} items started"
+            )
+            for idx in range(0, len(self._items), self._batch_size):
+                self._process_batch(self._items[idx:idx + self._batch_size])
+            self._status.info("Integration finished")
+
+        except PushToProjectError as exc:
+            if not self._status.failed:
+                self._status.set_failed(str(exc))
+
+        except Exception as exc:
+            _exc, _value, _tb = sys.exc_info()
+            self._status.set_failed(
+                "Unhandled error happened: {}".format(str(exc)),
+                (_exc, _value, _tb)
+            )
+
+        finally:
+            self._status.set_finished()
@@ -8,6 +8,7 @@ from openpype.client import (
     get_subsets,
     get_versions,
     get_representations,
+    get_workfile_infos,
 )
 from openpype.style import (
     get_default_entity_icon_color,
@@ -23,6 +24,69 @@ DATE_MODIFIED_ROLE = QtCore.Qt.UserRole + 3
 ITEM_ID_ROLE = QtCore.Qt.UserRole + 4
 
 
+class WorkfileInfoCache(object):
+    """Cache of workfile info documents by task.
+
+    Workfile info documents of all files of a task are queried at once when
+    a file of the task is requested for the first time. Cache is updated
+    with created or changed documents so it doesn't have to be queried
+    again.
+    """
+
+    def __init__(self):
+        self._docs_by_task = {}
+
+    def reset(self, asset_id=None, task_name=None):
+        """Reset cached documents of a task or of all tasks."""
+
+        if asset_id is None:
+            self._docs_by_task = {}
+        else:
+            self._docs_by_task.pop((str(asset_id), task_name), None)
+
+    def load(self, project_name, asset_id, task_names):
+        """Query workfile info documents of multiple tasks at once."""
+
+        task_names = [
+            task_name
+            for task_name in task_names
+            if (str(asset_id), task_name) not in self._docs_by_task
+        ]
+        if not task_names:
+            return
+
+        for task_name in task_names:
+            self._docs_by_task[(str(asset_id), task_name)] = {}
+
+        for workfile_doc in get_workfile_infos(
+            project_name, asset_ids=[asset_id], task_names=task_names
+        ):
+            self.update_doc(workfile_doc)
+
+    def get_doc(self, project_name, asset_id, task_name, filename):
+        """Workfile info document of a file.
+
+        Returns:
+            Union[dict[str, Any], None]: Workfile info document or None if
+                file does not have any.
+        """
+
+        if not asset_id or not task_name or not filename:
+            return None
+        self.load(project_name, asset_id, [task_name])
+        return self._docs_by_task[(str(asset_id), task_name)].get(filename)
+
+    def update_doc(self, workfile_doc):
+        """Update cache with created or changed workfile info document."""
+
+        key = (str(workfile_doc["parent"]), workfile_doc["task_name"])
+        docs_by_filename = self._docs_by_task.get(key)
+        # Task was not loaded yet and would be queried with the document
+        if docs_by_filename is None:
+            return
+        docs_by_filename[workfile_doc["filename"]] = workfile_doc
+
+
 class WorkAreaFilesModel(QtGui.QStandardItemModel):
     """Model is looking into one folder for files with extension."""
 
@@ -4,10 +4,7 @@ import copy
 import platform
 from qtpy import QtCore, QtWidgets, QtGui
 
-from openpype.client import (
-    get_asset_by_name,
-    get_workfile_info,
-)
+from openpype.client import get_asset_by_name
 from openpype.client.operations import (
     OperationsSession,
     new_workfile_info_doc,
@@ -21,6 +18,7 @@ from openpype.tools.utils.assets_widget import SingleSelectAssetsWidget
 from openpype.tools.utils.tasks_widget import TasksWidget
 
 from .files_widget import FilesWidget
+from .model import WorkfileInfoCache
 
 
 def file_size_to_string(file_size):
@@ -250,6 +248,7 @@ class Window(QtWidgets.QWidget):
 
         self._first_show = True
         self._context_to_set = None
+        self._workfile_info_cache = WorkfileInfoCache()
 
     def ensure_visible(
         self, use_context=None, save=None, on_top=None
@@ -326,7 +325,7 @@ class Window(QtWidgets.QWidget):
         if asset_id and task_name and filepath:
             filename = os.path.split(filepath)[1]
             project_name = legacy_io.active_project()
-            workfile_doc = get_workfile_info(
+            workfile_doc = self._workfile_info_cache.get_doc(
                 project_name, asset_id, task_name, filename
             )
         self.side_panel.set_context(
@@ -363,6 +362,7 @@ class Window(QtWidgets.QWidget):
             project_name, "workfile", workfile_doc["_id"], update_data
         )
         session.commit()
+        self._workfile_info_cache.update_doc(new_workfile_doc)
 
     def _get_current_workfile_doc(self, filepath=None):
         if filepath is None:
@@ -374,7 +374,7 @@ class Window(QtWidgets.QWidget):
 
         filename = os.path.split(filepath)[1]
         project_name = legacy_io.active_project()
-        return get_workfile_info(
+        return self._workfile_info_cache.get_doc(
             project_name, asset_id, task_name, filename
         )
 
@@ -403,9 +403,12 @@ class Window(QtWidgets.QWidget):
         session = OperationsSession()
         session.create_entity(project_name, "workfile", workfile_doc)
         session.commit()
+        self._workfile_info_cache.update_doc(workfile_doc)
         return workfile_doc
 
     def refresh(self):
+        # Workfile info may be changed by other processes
+        self._workfile_info_cache.reset()
         # Refresh asset widget
         self.assets_widget.refresh()
 
@@ -97,6 +97,7 @@ import os
 import re
 import sys
 import platform
+import contextlib
 import traceback
 import subprocess
 import site
@@ -133,6 +134,34 @@ else:
 vendor_python_path = os.path.join(OPENPYPE_ROOT, "vendor", "python")
 sys.path.insert(0, vendor_python_path)
 
+# Startup profiler must be installed before other imports to measure them
+# - report path can be defined with 'OPENPYPE_STARTUP_PROFILE'
+if "--profile-startup" in sys.argv:
+    sys.argv.remove("--profile-startup")
+    os.environ["OPENPYPE_STARTUP_PROFILE"] = (
+        os.environ.get("OPENPYPE_STARTUP_PROFILE") or "1"
+    )
+
+_startup_profiler = None
+if os.getenv("OPENPYPE_STARTUP_PROFILE"):
+    import importlib.util
+
+    # Import profiling module directly as 'openpype' can't be imported yet
+    _profiling_spec = importlib.util.spec_from_file_location(
+        "_openpype_startup_profiling",
+        os.path.join(OPENPYPE_ROOT, "openpype", "lib", "profiling.py")
+    )
+    _profiling = importlib.util.module_from_spec(_profiling_spec)
+    _profiling_spec.loader.exec_module(_profiling)
+    _startup_profiler = _profiling.install_startup_profiler()
+
+
+def _startup_phase(name):
+    if _startup_profiler is None:
+        return contextlib.nullcontext()
+    return _startup_profiler.phase(name)
+
+
 import blessed  # noqa: E402
 import certifi  # noqa: E402
 
@@ -980,7 +1009,8 @@ def boot():
     # ------------------------------------------------------------------------
 
     try:
-        openpype_mongo = _determine_mongodb()
+        with _startup_phase("bootstrap.determine_mongodb"):
+            openpype_mongo = _determine_mongodb()
     except RuntimeError as e:
         # without mongodb url we are done for.
         _print(f"!!! {e}")
@@ -999,10 +1029,12 @@ def boot():
         if "_tests" not in avalon_db:
             os.environ["AVALON_DB"] = avalon_db + "_tests"
 
-    global_settings = get_openpype_global_settings(openpype_mongo)
+    with _startup_phase("bootstrap.global_settings"):
+        global_settings = get_openpype_global_settings(openpype_mongo)
 
     _print(">>> run disk mapping command ...")
-    run_disk_mapping_commands(global_settings)
+    with _startup_phase("bootstrap.disk_mapping"):
+        run_disk_mapping_commands(global_settings)
 
     # Logging to server enabled/disabled
     log_to_server = global_settings.get("log_to_server", True)
@@ -1042,32 +1074,33 @@ def boot():
     # ------------------------------------------------------------------------
     # WARNING: Environment OPENPYPE_REPOS_ROOT may change if frozen OpenPype
     # is executed
-    if getattr(sys, 'frozen', False):
-        # find versions of OpenPype to be used with frozen code
-        try:
-            version_path = _find_frozen_openpype(use_version, use_staging)
-        except OpenPypeVersionNotFound as exc:
-            _boot_handle_missing_version(local_version, str(exc))
-            sys.exit(1)
+    with _startup_phase("bootstrap.find_version"):
+        if getattr(sys, 'frozen', False):
+            # find versions of OpenPype to be used with frozen code
+            try:
+                version_path = _find_frozen_openpype(use_version, use_staging)
+            except OpenPypeVersionNotFound as exc:
+                _boot_handle_missing_version(local_version, str(exc))
+                sys.exit(1)
 
-        except RuntimeError as e:
-            # no version to run
-            _print(f"!!! {e}")
-            sys.exit(1)
-        # validate version
-        _print(f">>> Validating version [ {str(version_path)} ]")
-        result = bootstrap.validate_openpype_version(version_path)
-        if not result[0]:
-            _print(f"!!! Invalid version: {result[1]}")
-            sys.exit(1)
-        _print("--- version is valid")
-    else:
-        try:
-            version_path = _bootstrap_from_code(use_version)
+            except RuntimeError as e:
+                # no version to run
+                _print(f"!!! {e}")
+                sys.exit(1)
+            # validate version
+            _print(f">>> Validating version [ {str(version_path)} ]")
+            result = bootstrap.validate_openpype_version(version_path)
+            if not result[0]:
+                _print(f"!!! Invalid version: {result[1]}")
+                sys.exit(1)
+            _print("--- version is valid")
+        else:
+            try:
+                version_path = _bootstrap_from_code(use_version)
 
-        except OpenPypeVersionNotFound as exc:
-            _boot_handle_missing_version(local_version, str(exc))
-            sys.exit(1)
+            except OpenPypeVersionNotFound as exc:
+                _boot_handle_missing_version(local_version, str(exc))
+                sys.exit(1)
 
     # set this to point either to `python` from venv in case of live code
     # or to `openpype` or `openpype_console` in case of frozen code
@@ -1092,11 +1125,14 @@ def boot():
     _print(">>> loading environments ...")
     # Avalon environments must be set before avalon module is imported
     _print("  - for Avalon ...")
-    set_avalon_environments()
+    with _startup_phase("bootstrap.avalon_environments"):
+        set_avalon_environments()
     _print("  - global OpenPype ...")
-    set_openpype_global_environments()
+    with _startup_phase("bootstrap.global_environments"):
+        set_openpype_global_environments()
     _print("  - for modules ...")
-    set_modules_environments()
+    with _startup_phase("bootstrap.modules_environments"):
+        set_modules_environments()
 
     assert version_path, "Version path not defined."
 
@@ -1121,9 +1157,11 @@ def boot():
         for i in info:
             t.echo(i)
 
-    from openpype import cli
+    with _startup_phase("cli.import"):
+        from openpype import cli
     try:
-        cli.main(obj={}, prog_name="openpype")
+        with _startup_phase("cli.main"):
+            cli.main(obj={}, prog_name="openpype")
     except Exception:  # noqa
         exc_info = sys.exc_info()
         _print("!!! OpenPype crashed:")
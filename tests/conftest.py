@@ -29,6 +29,16 @@ def pytest_addoption(parser):
         help="True - only setup test, do not run any tests"
     )
 
+    parser.addoption(
+        "--startup_baseline", action="store", default=None,
+        help="Path to json with cold start baseline times of commands"
+    )
+
+    parser.addoption(
+        "--startup_threshold", action="store", default=None,
+        help="Allowed cold start regression as ratio (e.g. 0.2)"
+    )
+
 
 @pytest.fixture(scope="module")
 def test_data_folder(request):
@@ -55,6 +65,16 @@ def setup_only(request):
     return request.config.getoption("--setup_only")
 
 
+@pytest.fixture(scope="module")
+def startup_baseline(request):
+    return request.config.getoption("--startup_baseline")
+
+
+@pytest.fixture(scope="module")
+def startup_threshold(request):
+    return request.config.getoption("--startup_threshold")
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     # execute all other hooks to obtain the report object
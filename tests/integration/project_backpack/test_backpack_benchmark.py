@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of project files packing on synthetic project.
+
+Synthetic project contains compressible workfiles and incompressible
+(random) image sequences. Packing to volumes in parallel is compared with
+packing into single deflated zip on one thread (previous behavior) and
+unpacked files are compared with source files.
+"""
+import os
+import time
+import zipfile
+import filecmp
+
+from openpype.lib.project_backpack import (
+    _collect_project_files,
+    _split_files_to_volumes,
+    _pack_volumes,
+    _extract_volumes,
+)
+
+PROJECT_NAME = "synthetic"
+SEQUENCES_COUNT = 8
+FRAMES_COUNT = 24
+FRAME_SIZE = 512 * 1024
+WORKFILES_COUNT = 16
+
+
+def _create_synthetic_project(root_path):
+    project_path = os.path.join(root_path, PROJECT_NAME)
+    for seq_idx in range(SEQUENCES_COUNT):
+        render_dir = os.path.join(
+            project_path, "sh{:03d}".format(seq_idx), "publish", "render"
+        )
+        os.makedirs(render_dir)
+        for frame in range(FRAMES_COUNT):
+            filepath = os.path.join(
+                render_dir, "render.{:04d}.exr".format(1001 + frame)
+            )
+            with open(filepath, "wb") as stream:
+                stream.write(os.urandom(FRAME_SIZE))
+
+    work_dir = os.path.join(project_path, "work")
+    os.makedirs(work_dir)
+    for idx in range(WORKFILES_COUNT):
+        filepath = os.path.join(work_dir, "scene_v{:03d}.ma".format(idx))
+        with open(filepath, "w") as stream:
+            stream.write("createNode transform -n \"node\";\n" * 20000)
+    return project_path
+
+
+def _pack_single_thread(zip_path, files):
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zip_stream:
+        for filepath, archive_name, _ in files:
+            zip_stream.write(filepath, archive_name)
+
+
+def test_pack_unpack_benchmark(tmp_path):
+    root_path = str(tmp_path / "root")
+    project_path = _create_synthetic_project(root_path)
+    files = _collect_project_files(project_path, root_path)
+    total_size = sum(item[2] for item in files)
+
+    start = time.time()
+    _pack_single_thread(str(tmp_path / "single.zip"), files)
+    single_duration = time.time() - start
+
+    volumes = _split_files_to_volumes(files, total_size // 4)
+    zip_path = str(tmp_path / "package" / (PROJECT_NAME + ".zip"))
+    os.makedirs(os.path.dirname(zip_path))
+    start = time.time()
+    volume_names = _pack_volumes(
+        zip_path, volumes, 4, lambda zip_stream: None
+    )
+    parallel_duration = time.time() - start
+
+    volume_paths = [
+        os.path.join(os.path.dirname(zip_path), filename)
+        for filename in volume_names
+    ]
+    new_root = str(tmp_path / "new_root")
+    start = time.time()
+    extracted_count = _extract_volumes(
+        volume_paths,
+        new_root,
+        {archive_name: size for _, archive_name, size in files},
+        4
+    )
+    unpack_duration = time.time() - start
+
+    print((
+        "Packed {} files ({} MB): single thread {:.3f}s,"
+        " {} volumes in parallel {:.3f}s, unpacked in {:.3f}s"
+    ).format(
+        len(files),
+        total_size // (1024 * 1024),
+        single_duration,
+        len(volume_paths),
+        parallel_duration,
+        unpack_duration
+    ))
+
+    assert len(volume_paths) > 1
+    assert extracted_count == len(files)
+    for filepath, _, _ in files:
+        new_path = os.path.join(
+            new_root, os.path.relpath(filepath, root_path)
+        )
+        assert filecmp.cmp(filepath, new_path, shallow=False)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Cold start benchmark of OpenPype commands.
+
+Each command is launched multiple times in new process with startup profiler
+enabled and median of wall times is compared with baseline. Baseline is json
+file with seconds by command name:
+
+    {"run": 4.2, "publish": 9.8}
+
+Path to baseline file is defined with '--startup_baseline' argument. If the
+file does not exist it is created from current results and test is skipped.
+Allowed regression is defined with '--startup_threshold' as ratio
+(default 0.2 = 20%).
+
+Publish is launched with publish data without instances, context of
+publishing is taken from 'AVALON_PROJECT', 'AVALON_ASSET' and 'AVALON_TASK'
+environment variables.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+import statistics
+
+import pytest
+
+OPENPYPE_ROOT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "..")
+)
+RUNS_COUNT = 3
+DEFAULT_THRESHOLD = 0.2
+
+
+def _get_publish_data(tmpdir):
+    """Publish data of farm job without instances."""
+    session = {
+        key: os.environ.get(key) or ""
+        for key in ("AVALON_PROJECT", "AVALON_ASSET", "AVALON_TASK")
+    }
+    session["AVALON_WORKDIR"] = os.environ.get("AVALON_WORKDIR") or tmpdir
+    return {
+        "asset": session["AVALON_ASSET"],
+        "user": "startup_benchmark",
+        "comment": "",
+        "version": None,
+        "job": {"_id": "startup_benchmark"},
+        "session": session,
+        "instances": []
+    }
+
+
+def _get_command_args(command, tmpdir):
+    if command == "run":
+        script_path = os.path.join(tmpdir, "empty_script.py")
+        with open(script_path, "w") as stream:
+            stream.write("")
+        return ["run", script_path]
+
+    # Publish data file is removed after publishing
+    publish_data_path = os.path.join(tmpdir, "publish_data.json")
+    with open(publish_data_path, "w") as stream:
+        json.dump(_get_publish_data(tmpdir), stream)
+    return ["publish", publish_data_path]
+
+
+def _measure_command(command):
+    durations = []
+    reports = []
+    tmpdir = tempfile.mkdtemp(prefix="openpype_startup_")
+    for idx in range(RUNS_COUNT):
+        command_args = _get_command_args(command, tmpdir)
+        report_path = os.path.join(
+            tmpdir, "{}_{}.json".format(command, idx)
+        )
+        env = os.environ.copy()
+        env["OPENPYPE_STARTUP_PROFILE"] = report_path
+        args = [
+            sys.executable,
+            os.path.join(OPENPYPE_ROOT, "start.py"),
+            "--headless"
+        ] + command_args
+
+        start = time.time()
+        returncode = subprocess.call(args, env=env, cwd=OPENPYPE_ROOT)
+        durations.append(time.time() - start)
+
+        # Failed command would be measured as fast start
+        assert returncode == 0, (
+            "Command '{}' failed with return code {}".format(
+                command, returncode
+            )
+        )
+
+        assert os.path.exists(report_path), (
+            "Command '{}' did not write startup report".format(command)
+        )
+        with open(report_path, "r") as stream:
+            reports.append(json.load(stream))
+
+    return statistics.median(durations), reports[-1]
+
+
+def _format_report(report):
+    lines = ["Phases:"]
+    for name, phase in report["phases"].items():
+        lines.append("    {}: {:.3f}s".format(name, phase["duration"]))
+    lines.append("Slowest imports:")
+    for item in report["imports"][:10]:
+        lines.append("    {}: {:.3f}s".format(
+            item["name"], item["cumulative"]
+        ))
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("command", ["run", "publish"])
+def test_cold_start(command, startup_baseline, startup_threshold):
+    if not startup_baseline:
+        pytest.skip("Path to baseline ('--startup_baseline') not defined")
+
+    threshold = DEFAULT_THRESHOLD
+    if startup_threshold:
+        threshold = float(startup_threshold)
+
+    duration, report = _measure_command(command)
+    print("Cold start of '{}' took {:.3f}s\n{}".format(
+        command, duration, _format_report(report)
+    ))
+
+    baseline = {}
+    if os.path.exists(startup_baseline):
+        with open(startup_baseline, "r") as stream:
+            baseline = json.load(stream)
+
+    if command not in baseline:
+        baseline[command] = duration
+        with open(startup_baseline, "w") as stream:
+            json.dump(baseline, stream, indent=4)
+        pytest.skip("Baseline of '{}' recorded ({:.3f}s)".format(
+            command, duration
+        ))
+
+    limit = baseline[command] * (1 + threshold)
+    assert duration <= limit, (
+        "Cold start of '{}' regressed: {:.3f}s > {:.3f}s"
+        " (baseline {:.3f}s)\n{}"
+    ).format(
+        command, duration, limit, baseline[command], _format_report(report)
+    )
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Benchmark of last workfile lookup in directory with 10k files.
+
+Last workfile of many tasks is resolved from one work directory. Cached
+directory listing and regexes are compared with first (uncached) lookup.
+"""
+import os
+import time
+
+from openpype.pipeline.workfile import path_resolving
+from openpype.pipeline.workfile import (
+    get_last_workfile_with_version,
+    get_last_workfiles_with_version,
+)
+
+FILES_COUNT = 10000
+TASKS_COUNT = 50
+FILE_TEMPLATE = "{asset}_{task}_v{version:0>3}<_{comment}>.{ext}"
+EXTENSIONS = [".ma", ".mb"]
+
+
+def _clear_caches():
+    path_resolving._WORKDIR_LISTING_CACHE.clear()
+    path_resolving._WORKFILE_PATTERNS_CACHE.clear()
+    path_resolving._WORKFILE_REGEX_CACHE.clear()
+
+
+def test_last_workfile_benchmark(tmp_path):
+    workdir = str(tmp_path)
+    versions_count = FILES_COUNT // TASKS_COUNT
+    for task_idx in range(TASKS_COUNT):
+        for version in range(1, versions_count + 1):
+            filename = "sh010_task{}_v{:0>3}.ma".format(task_idx, version)
+            open(os.path.join(workdir, filename), "w").close()
+    # Listing of recently modified directory is not cached
+    dir_mtime = time.time() - 60
+    os.utime(workdir, (dir_mtime, dir_mtime))
+
+    contexts = [
+        (
+            workdir,
+            FILE_TEMPLATE,
+            {"asset": "sh010", "task": "task{}".format(task_idx)},
+            EXTENSIONS
+        )
+        for task_idx in range(TASKS_COUNT)
+    ]
+
+    _clear_caches()
+    start = time.time()
+    uncached_results = []
+    for context in contexts:
+        _clear_caches()
+        uncached_results.append(get_last_workfile_with_version(*context))
+    uncached_duration = time.time() - start
+
+    _clear_caches()
+    start = time.time()
+    results = get_last_workfiles_with_version(contexts)
+    batch_duration = time.time() - start
+
+    print((
+        "Last workfile of {} tasks in directory with {} files:"
+        " uncached {:.3f}s, batch {:.3f}s"
+    ).format(TASKS_COUNT, FILES_COUNT, uncached_duration, batch_duration))
+
+    assert results == uncached_results
+    assert results[0] == (
+        "sh010_task0_v{:0>3}.ma".format(versions_count), versions_count
+    )
+
+    # New file invalidates cached listing
+    new_filename = "sh010_task0_v{:0>3}.ma".format(versions_count + 1)
+    open(os.path.join(workdir, new_filename), "w").close()
+    os.utime(workdir, (0, 0))
+    assert get_last_workfile_with_version(*contexts[0]) == (
+        new_filename, versions_count + 1
+    )
+
+    # Listing made right after modification is not trusted even if
+    #   modification time did not change
+    dir_mtime = time.time()
+    os.utime(workdir, (dir_mtime, dir_mtime))
+    get_last_workfile_with_version(*contexts[0])
+    racy_filename = "sh010_task0_v{:0>3}.ma".format(versions_count + 2)
+    open(os.path.join(workdir, racy_filename), "w").close()
+    os.utime(workdir, (dir_mtime, dir_mtime))
+    assert get_last_workfile_with_version(*contexts[0]) == (
+        racy_filename, versions_count + 2
+    )
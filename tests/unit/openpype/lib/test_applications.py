@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Test suite for application launch caches."""
+import os
+
+from openpype.lib.applications import _get_launch_hook_classes
+
+HOOK_CONTENT = """from openpype.lib import PreLaunchHook
+
+
+class {name}(PreLaunchHook):
+    def execute(self):
+        pass
+"""
+
+
+def test_launch_hook_classes_cache(tmp_path):
+    hook_path = tmp_path / "pre_hook.py"
+    hook_path.write_text(HOOK_CONTENT.format(name="FirstHook"))
+
+    classes = _get_launch_hook_classes(str(tmp_path))
+    assert [klass.__name__ for klass in classes["pre"]] == ["FirstHook"]
+    assert _get_launch_hook_classes(str(tmp_path)) is classes
+
+    # Modified file is imported again
+    hook_path.write_text(HOOK_CONTENT.format(name="SecondHook"))
+    os.utime(str(hook_path), (0, 0))
+    classes = _get_launch_hook_classes(str(tmp_path))
+    assert [klass.__name__ for klass in classes["pre"]] == ["SecondHook"]
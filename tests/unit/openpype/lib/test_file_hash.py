@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""Test suite for content based file hashing."""
+import os
+import hashlib
+
+from openpype.lib.file_hash import (
+    CHUNK_SIZE,
+    SAMPLES_COUNT,
+    FileHashCache,
+    compute_file_content_hash,
+)
+from openpype.lib.plugin_tools import (
+    CONTENT_HASH_PREFIX,
+    validate_source_content_hash,
+)
+
+
+def test_content_hash_ignores_modification(tmp_path):
+    src_path = tmp_path / "src.exr"
+    copy_path = tmp_path / "copy.exr"
+    src_path.write_bytes(b"texture" * 1000)
+    copy_path.write_bytes(b"texture" * 1000)
+    os.utime(str(copy_path), (0, 0))
+
+    assert (
+        compute_file_content_hash(str(src_path), 0)
+        == compute_file_content_hash(str(copy_path), 0)
+    )
+
+
+def test_file_hash_cache(tmp_path):
+    filepath = tmp_path / "texture.exr"
+    filepath.write_bytes(b"first")
+    cache = FileHashCache(str(tmp_path / "cache.db"))
+
+    first_hash = cache.get_hash(str(filepath), 0)
+    assert first_hash == compute_file_content_hash(str(filepath), 0)
+    assert cache.get_hash(str(filepath), 0) == first_hash
+
+    filepath.write_bytes(b"second content")
+    assert cache.get_hash(str(filepath), 0) != first_hash
+
+    os.remove(str(filepath))
+    assert cache.remove_missing() == 1
+    cache.close()
+
+
+def test_validate_hash_from_other_machine(tmp_path):
+    filepath = tmp_path / "render.exr"
+    content = os.urandom(1024 * 1024) * 9
+    filepath.write_bytes(content)
+
+    # Sampled md5 digest created on machine without xxhash
+    md5_hash = hashlib.md5()
+    md5_hash.update(str(len(content)).encode("utf-8"))
+    step = (len(content) - CHUNK_SIZE) // (SAMPLES_COUNT - 1)
+    for idx in range(SAMPLES_COUNT):
+        md5_hash.update(content[idx * step:idx * step + CHUNK_SIZE])
+
+    value = "|".join([
+        CONTENT_HASH_PREFIX,
+        "md5s:" + md5_hash.hexdigest(),
+        str(len(content))
+    ])
+    assert validate_source_content_hash(str(filepath), value)
+    assert not validate_source_content_hash(
+        str(filepath), value.replace("md5s:", "md5s:0")
+    )
+    # Unknown algorithm can't be validated
+    assert validate_source_content_hash(
+        str(filepath), value.replace("md5s:", "sha3s:")
+    )
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""Test suite for index of file sequences."""
+import os
+
+import clique
+
+from openpype.lib.file_sequences import (
+    SequenceIndex,
+    FileExistenceIndex,
+    format_file_sequences,
+)
+from openpype.pipeline.farm.patterning import match_aov_pattern
+
+
+def test_sequences_match_clique():
+    filenames = [
+        "/renders/sh010/beauty_v001.{:04d}.exr".format(frame)
+        for frame in range(998, 1011)
+        if frame != 1005
+    ]
+    filenames.extend([
+        "/renders/sh010/diffuse_v001.{}.exr".format(frame)
+        for frame in range(1, 4)
+    ])
+    filenames.extend([
+        "/renders/sh010/preview.mp4",
+        "/renders/sh010/thumbnail.1001.jpg",
+    ])
+
+    index = SequenceIndex(filenames)
+    collections, remainders = clique.assemble(filenames)
+    assert sorted(index.remainders) == sorted(remainders)
+    assert len(index.sequences) == len(collections)
+    for sequence, collection in zip(index.sequences, collections):
+        assert list(sequence) == list(collection)
+        assert sequence.format_template == collection.format(
+            "{head}{padding}{tail}"
+        )
+
+    sequence = index.get_sequence_for_filename(filenames[0])
+    assert sequence.padding == 4
+    assert sequence.get_ranges() == [(998, 1004), (1006, 1010)]
+    assert sequence.get_missing_frames(995, 1012) == [
+        995, 996, 997, 1005, 1011, 1012
+    ]
+    assert sequence.get_previous_frame(1005) == 1004
+    assert sequence.get_previous_frame(990) == 998
+
+
+def test_frame_before_other_digits_match_clique():
+    filenames = [
+        "shot_{}_v2.exr".format(frame)
+        for frame in (1001, 1002, 1004)
+    ]
+    filenames.extend([
+        "render_v003.{:04d}.exr".format(frame)
+        for frame in (1, 2)
+    ])
+    filenames.extend(["shot_v1_x.exr", "shot_v2_x.exr", "notes.txt"])
+
+    index = SequenceIndex(filenames)
+    collections, remainders = clique.assemble(filenames)
+    assert index.remainders == remainders
+    assert [
+        (sequence.format_template, list(sequence))
+        for sequence in index.sequences
+    ] == [
+        (collection.format("{head}{padding}{tail}"), list(collection))
+        for collection in collections
+    ]
+    sequence = index.get_sequence_for_filename("shot_1004_v2.exr")
+    assert sequence.format_template == "shot_%d_v2.exr"
+    assert sequence.get_ranges() == [(1001, 1002), (1004, 1004)]
+
+
+def test_file_existence_index(tmp_path):
+    for frame in (1001, 1002, 1005):
+        (tmp_path / "beauty.{}.exr".format(frame)).write_bytes(b"")
+    expected = [
+        str(tmp_path / "beauty.{}.exr".format(frame))
+        for frame in range(1001, 1007)
+    ]
+    expected.append(str(tmp_path / "missing" / "beauty.mov"))
+
+    index = FileExistenceIndex()
+    missing = index.get_missing(expected)
+    assert missing == expected[2:4] + expected[5:]
+    assert format_file_sequences(missing) == [
+        str(tmp_path / "beauty.%d.exr [1003-1004, 1006]"),
+        str(tmp_path / "missing" / "beauty.mov"),
+    ]
+
+    # Listing is cached until reset
+    (tmp_path / "beauty.1003.exr").write_bytes(b"")
+    assert not index.exists(expected[2])
+    index.reset(str(tmp_path))
+    assert index.exists(expected[2])
+
+
+def test_file_existence_index_case_insensitive(tmp_path, monkeypatch):
+    # Simulate case insensitive platform
+    monkeypatch.setattr(os.path, "normcase", lambda path: path.lower())
+    (tmp_path / "Beauty.1001.EXR").write_bytes(b"")
+
+    index = FileExistenceIndex()
+    assert index.exists(str(tmp_path / "beauty.1001.exr"))
+    assert index.get_missing([
+        str(tmp_path / "BEAUTY.1001.exr"),
+        str(tmp_path / "beauty.1002.exr"),
+    ]) == [str(tmp_path / "beauty.1002.exr")]
+
+
+def test_match_aov_pattern():
+    aov_patterns = {"maya": [".*([Bb]eauty).*"]}
+    assert match_aov_pattern("maya", aov_patterns, "sh010_beauty.1001.exr")
+    assert not match_aov_pattern("maya", aov_patterns, "sh010_Z.1001.exr")
+    assert not match_aov_pattern("nuke", aov_patterns, "sh010_beauty.exr")
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Test suite for concurrent file transaction."""
+import os
+
+import pytest
+
+from openpype.lib.file_transaction import FileTransaction
+
+
+def test_concurrent_transfer_rollback(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    dst_dir = tmp_path / "dst"
+    dst_dir.mkdir()
+    existing_path = dst_dir / "file_0.txt"
+    existing_path.write_text("original")
+
+    transaction = FileTransaction(max_workers=4)
+    for idx in range(8):
+        src_path = src_dir / "file_{}.txt".format(idx)
+        src_path.write_text("content")
+        transaction.add(str(src_path), str(dst_dir / src_path.name))
+
+    transferred = []
+    transaction.process(lambda path, size: transferred.append(size))
+    assert transferred == [7] * 8
+    transaction.rollback()
+    assert existing_path.read_text() == "original"
+    assert sorted(os.listdir(str(dst_dir))) == ["file_0.txt"]
+
+    # Failed transfer does not prevent rollback of other files
+    transaction = FileTransaction(max_workers=4)
+    transaction.add(str(src_dir / "file_1.txt"), str(dst_dir / "file_1.txt"))
+    transaction.add(str(src_dir / "missing.txt"), str(dst_dir / "missing.txt"))
+    with pytest.raises(IOError):
+        transaction.process()
+    transaction.rollback()
+    assert sorted(os.listdir(str(dst_dir))) == ["file_0.txt"]
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+"""Test suite for mongo log handler."""
+import os
+import sys
+import subprocess
+
+from bson import json_util
+
+from openpype.lib.log import MongoQueueHandler
+
+
+class _Collection(object):
+    def __init__(self):
+        self.documents = []
+
+    def insert_many(self, documents, ordered=True):
+        self.documents.extend(documents)
+
+
+def test_spilled_records_of_finished_process_are_inserted(tmp_path):
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    spill_path = tmp_path / "{}_1700000000.0.jsonl".format(proc.pid)
+    spill_path.write_text(json_util.dumps({"message": "spilled"}) + "\n")
+
+    collection = _Collection()
+    handler = MongoQueueHandler(collection, spill_dir=str(tmp_path))
+    handler.close()
+    handler._insert_spilled()
+
+    assert collection.documents == [{"message": "spilled"}]
+    assert os.listdir(str(tmp_path)) == []
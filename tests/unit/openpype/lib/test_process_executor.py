@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""Test suite for concurrent subprocess execution."""
+import sys
+import time
+import subprocess
+
+import pytest
+
+from openpype.lib import process_executor
+from openpype.lib.execute import run_subprocess, ProcessTimeoutError
+from openpype.lib.process_executor import (
+    SubprocessExecutor,
+    wait_for_futures,
+)
+
+
+def _python_args(code):
+    return [sys.executable, "-c", code]
+
+
+def test_run_subprocess_timeout():
+    with pytest.raises(ProcessTimeoutError):
+        run_subprocess(
+            _python_args("import time; time.sleep(10)"), timeout=0.5
+        )
+
+
+def test_run_subprocess_timeout_kills_shell_children():
+    # Child of shell keeps output pipes open if only shell is killed
+    command = subprocess.list2cmdline(
+        _python_args("import time; time.sleep(10)")
+    )
+    started = time.time()
+    with pytest.raises(ProcessTimeoutError):
+        run_subprocess(command, shell=True, timeout=0.5)
+    assert time.time() - started < 5
+
+
+def test_executor_results_and_error():
+    executor = SubprocessExecutor(max_workers=2)
+    futures = [
+        executor.submit(_python_args("print({})".format(idx)))
+        for idx in range(4)
+    ]
+    outputs = wait_for_futures(futures)
+    assert [output.strip() for output in outputs] == ["0", "1", "2", "3"]
+
+    futures = [
+        executor.submit(_python_args("import sys; sys.exit(1)")),
+        executor.submit(_python_args("import time; time.sleep(10)")),
+    ]
+    with pytest.raises(RuntimeError):
+        wait_for_futures(futures)
+    assert futures[1].cancelled()
+    executor.shutdown()
+
+
+def test_executor_reserves_memory(monkeypatch):
+    executor = SubprocessExecutor(max_workers=4, memory_per_process_mb=1)
+    memory_per_process = 1024 * 1024
+    running_counts = []
+
+    def _get_available_memory():
+        # Each running process uses its expected memory
+        running_count = executor._running_count
+        running_counts.append(running_count)
+        # Slow check gives other workers time to check the same memory
+        time.sleep(0.1)
+        return (3 - running_count) * memory_per_process
+
+    monkeypatch.setattr(
+        process_executor, "_get_available_memory", _get_available_memory
+    )
+    futures = [
+        executor.submit(_python_args("import time; time.sleep(0.5)"))
+        for _ in range(4)
+    ]
+    wait_for_futures(futures)
+    executor.shutdown()
+    assert max(running_counts) == 3
+    assert executor._running_count == 0
+    assert futures[0].kwargs["output_limit"] == (
+        SubprocessExecutor.default_output_limit
+    )
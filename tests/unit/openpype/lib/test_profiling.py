@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Test suite for startup profiler."""
+import sys
+import zipfile
+import importlib
+
+from openpype.lib.profiling import StartupProfiler
+
+
+def test_shared_loader_is_not_modified(tmp_path):
+    zip_path = str(tmp_path / "library.zip")
+    module_names = ["profiled_zip_module_{}".format(idx) for idx in range(3)]
+    with zipfile.ZipFile(zip_path, "w") as zip_file:
+        for module_name in module_names:
+            zip_file.writestr(module_name + ".py", "value = 1\n")
+
+    profiler = StartupProfiler(str(tmp_path / "report.json"))
+    sys.path.insert(0, zip_path)
+    sys.meta_path.insert(0, profiler)
+    try:
+        modules = [
+            importlib.import_module(module_name)
+            for module_name in module_names
+        ]
+    finally:
+        sys.meta_path.remove(profiler)
+        sys.path.remove(zip_path)
+        for module_name in module_names:
+            sys.modules.pop(module_name, None)
+
+    loader = modules[0].__spec__.loader._loader
+    assert "exec_module" not in vars(loader)
+    assert all(module.value == 1 for module in modules)
+    imported = {item["name"] for item in profiler.get_report()["imports"]}
+    assert imported.issuperset(module_names)
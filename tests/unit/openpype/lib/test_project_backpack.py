@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Test suite for project pack and unpack."""
+import zipfile
+
+import pytest
+
+from openpype.lib.project_backpack import (
+    PROJECT_FILES_DIR,
+    _get_existing_volume_paths,
+    _extract_volumes,
+)
+
+
+@pytest.mark.parametrize("member_name", [
+    PROJECT_FILES_DIR + "/../../escaped.txt",
+    PROJECT_FILES_DIR + "//tmp/escaped.txt",
+])
+def test_extract_rejects_members_outside_root(tmp_path, member_name):
+    zip_path = str(tmp_path / "project.zip")
+    with zipfile.ZipFile(zip_path, "w") as zip_stream:
+        zip_stream.writestr(PROJECT_FILES_DIR + "/project/file.txt", b"data")
+        zip_stream.writestr(member_name, b"data")
+
+    root_path = tmp_path / "root"
+    with pytest.raises(ValueError):
+        _extract_volumes([zip_path], str(root_path), {}, 1)
+    assert not root_path.exists()
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+def test_existing_volumes_of_package(tmp_path):
+    for filename in ("project.zip", "project.001.zip", "project.002.zip"):
+        (tmp_path / filename).write_bytes(b"")
+    (tmp_path / "other.001.zip").write_bytes(b"")
+
+    volume_paths = _get_existing_volume_paths(str(tmp_path / "project.zip"))
+    assert volume_paths == [
+        (0, str(tmp_path / "project.zip")),
+        (1, str(tmp_path / "project.001.zip")),
+        (2, str(tmp_path / "project.002.zip")),
+    ]
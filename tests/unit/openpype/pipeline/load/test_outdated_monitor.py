@@ -0,0 +1,111 @@
+"""Test incremental check of outdated containers."""
+from openpype.pipeline.load import outdated_monitor
+from openpype.pipeline.load.outdated_monitor import OutdatedContainersMonitor
+
+
+def _container(name, repre_id):
+    return {"objectName": name, "representation": repre_id}
+
+
+def test_monitor_queries_only_changes(monkeypatch):
+    version_id_by_repre_id = {
+        "repre_1": "version_1",
+        "repre_2": "version_2",
+        "repre_3": "version_3",
+    }
+    subset_id_by_version_id = {
+        "version_1": "subset_1",
+        "version_2": "subset_2",
+        "version_3": "subset_3",
+    }
+    last_version_id_by_subset_id = {
+        "subset_1": "version_1",
+        "subset_2": "version_2",
+        "subset_3": "version_3",
+    }
+    new_version_subset_ids = set()
+    queries = []
+
+    def get_representations(project_name, representation_ids, fields):
+        queries.append(("representations", set(representation_ids)))
+        return [
+            {"_id": repre_id, "parent": version_id_by_repre_id[repre_id]}
+            for repre_id in representation_ids
+        ]
+
+    def get_versions(project_name, version_ids, hero, fields):
+        return [
+            {
+                "_id": version_id,
+                "parent": subset_id_by_version_id[version_id],
+                "type": "version"
+            }
+            for version_id in version_ids
+        ]
+
+    def get_last_versions(project_name, subset_ids, fields):
+        queries.append(("last_versions", set(subset_ids)))
+        return {
+            subset_id: {"_id": last_version_id_by_subset_id[subset_id]}
+            for subset_id in subset_ids
+        }
+
+    def get_subset_ids_with_new_versions(project_name, subset_ids, since):
+        queries.append(("new_versions", set(subset_ids)))
+        return set(new_version_subset_ids)
+
+    monkeypatch.setattr(
+        outdated_monitor, "get_representations", get_representations
+    )
+    monkeypatch.setattr(outdated_monitor, "get_versions", get_versions)
+    monkeypatch.setattr(
+        outdated_monitor, "get_last_versions", get_last_versions
+    )
+    monkeypatch.setattr(
+        outdated_monitor,
+        "get_subset_ids_with_new_versions",
+        get_subset_ids_with_new_versions
+    )
+    events = []
+    monkeypatch.setattr(
+        outdated_monitor,
+        "emit_event",
+        lambda topic, data, source: events.append(data)
+    )
+
+    monitor = OutdatedContainersMonitor("project")
+    containers = [
+        _container("model_1", "repre_1"),
+        _container("model_2", "repre_2"),
+    ]
+    monitor.set_containers(containers)
+    result = monitor.check()
+    assert not result.outdated
+    assert queries == [
+        ("representations", {"repre_1", "repre_2"}),
+        ("last_versions", {"subset_1", "subset_2"}),
+    ]
+
+    # New container and new version of first subset
+    del queries[:]
+    containers.append(_container("model_3", "repre_3"))
+    new_version_subset_ids.add("subset_1")
+    last_version_id_by_subset_id["subset_1"] = "version_4"
+    monitor.set_containers(containers)
+    result = monitor.check()
+    assert [c["objectName"] for c in result.outdated] == ["model_1"]
+    assert queries == [
+        ("representations", {"repre_3"}),
+        ("new_versions", {"subset_1", "subset_2"}),
+        ("last_versions", {"subset_1", "subset_3"}),
+    ]
+    assert events[-1]["outdated_count"] == 1
+
+    # Nothing changed
+    del queries[:]
+    new_version_subset_ids.clear()
+    result = monitor.check()
+    assert [c["objectName"] for c in result.outdated] == ["model_1"]
+    assert queries == [
+        ("new_versions", {"subset_1", "subset_2", "subset_3"}),
+    ]
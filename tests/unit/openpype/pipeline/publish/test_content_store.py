@@ -0,0 +1,29 @@
+"""Test content store of published files."""
+import os
+
+from openpype.pipeline.publish.content_store import ContentStore
+
+
+def test_content_store_links_and_cleanup(tmp_path):
+    store = ContentStore(str(tmp_path / "store"))
+    src_path = tmp_path / "texture.exr"
+    src_path.write_bytes(b"texture content")
+
+    object_path = store.add_file(str(src_path))
+    # Reused old object is not removed before it's linked
+    os.utime(object_path, (0, 0))
+    assert store.add_file(str(src_path)) == object_path
+    assert store.cleanup() == (0, 0)
+    assert store.can_link(str(tmp_path / "publish" / "v001" / "texture.exr"))
+
+    published_path = str(tmp_path / "texture_v001.exr")
+    os.link(object_path, published_path)
+
+    # Object linked from published file is kept
+    assert store.cleanup(min_age=0) == (0, 0)
+
+    os.remove(published_path)
+    assert store.cleanup(min_age=0, dry_run=True) == (1, 15)
+    assert os.path.exists(object_path)
+    assert store.cleanup(min_age=0) == (1, 15)
+    assert not os.path.exists(object_path)
@@ -0,0 +1,41 @@
+"""Test concurrent delivery transfers."""
+import os
+
+from openpype.pipeline.delivery import DeliveryTransfers
+
+
+def test_delivery_transfers_resume(tmp_path):
+    src_dir = tmp_path / "publish"
+    src_dir.mkdir()
+    manifest_path = str(tmp_path / "manifest.jsonl")
+    transfers = DeliveryTransfers(max_workers=2, manifest_path=manifest_path)
+    for frame in range(1001, 1005):
+        src_path = src_dir / "render.{}.exr".format(frame)
+        src_path.write_bytes(b"frame")
+        transfers.add(
+            str(src_path),
+            str(tmp_path / "delivery" / "shot" / src_path.name)
+        )
+    assert len(transfers.list_dir(str(src_dir))) == 4
+
+    # Missing source file fails only its own transfer
+    missing_dst = str(tmp_path / "delivery" / "missing.exr")
+    transfers.add(str(src_dir / "missing.exr"), missing_dst)
+
+    result = transfers.process()
+    assert result["count"] == 4
+    assert result["size"] == 20
+    assert len(result["errors"]) == 1
+    assert os.path.exists(manifest_path)
+
+    # Finished transfers are skipped on next run
+    (src_dir / "missing.exr").write_bytes(b"frame")
+    progress = []
+    result = transfers.process(
+        lambda processed, count, size: progress.append(processed)
+    )
+    assert result["skipped"] == 4
+    assert result["count"] == 1
+    assert progress[-1] == 5
+    assert os.path.exists(missing_dst)
+    assert not os.path.exists(manifest_path)
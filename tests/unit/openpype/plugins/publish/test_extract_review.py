@@ -1,3 +1,5 @@
+import os
+
 from openpype.plugins.publish.extract_review import ExtractReview
 
 
@@ -27,3 +29,25 @@ def test_fix_ffmpeg_full_args_filters():
     assert ret[-1] == output_arg
     assert ret[-2] == '"adeclick,adeclick"'  # TODO fix this duplication
     assert ret[-3] == "-filter:a"
+
+
+def test_fill_sequence_gaps(tmp_path):
+    """Gaps are filled with links to nearest previous frame."""
+    plugin = ExtractReview()
+    files = ["seq.1001.exr", "seq.1004.exr"]
+    for filename in files:
+        (tmp_path / filename).write_text(filename)
+
+    added_files = plugin.fill_sequence_gaps(
+        files, str(tmp_path), 1001, 1005
+    )
+    added_names = sorted(
+        os.path.basename(filepath) for filepath in added_files
+    )
+    assert added_names == ["seq.1002.exr", "seq.1003.exr", "seq.1005.exr"]
+    assert (tmp_path / "seq.1003.exr").read_text() == "seq.1001.exr"
+    assert (tmp_path / "seq.1005.exr").read_text() == "seq.1004.exr"
+
+    for filepath in added_files:
+        os.unlink(filepath)
+    assert sorted(os.listdir(str(tmp_path))) == files
@@ -0,0 +1,197 @@
+"""Test batch push of multiple versions to project."""
+import pytest
+
+from openpype.tools.push_to_project import control_integrate
+from openpype.tools.push_to_project.control_integrate import (
+    ProjectPushItem,
+    ProjectPushBatchProcess,
+)
+
+SRC_PROJECT = "src_project"
+DST_PROJECT = "dst_project"
+DST_ASSET_ID = "dst_asset_id"
+DST_SUBSET_ID = "dst_subset_id"
+
+
+class _Operations:
+    sessions = []
+
+    def __init__(self):
+        self.created = []
+        self.committed = False
+        self.cleared = False
+        self.sessions.append(self)
+
+    def create_entity(self, project_name, entity_type, data):
+        self.created.append((entity_type, data))
+
+    def update_entity(self, project_name, entity_type, entity_id, data):
+        pass
+
+    def commit(self):
+        self.committed = True
+
+    def clear(self):
+        self.cleared = True
+
+
+class _FileTransaction:
+    transactions = []
+
+    def __init__(self, max_workers=None):
+        self.processed = False
+        self.rolled_back = False
+        self.finalized = False
+        self.transactions.append(self)
+
+    def process(self, callback=None):
+        self.processed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+    def finalize(self):
+        self.finalized = True
+
+
+class _Anatomy:
+    roots = {}
+
+    def __init__(self, project_name):
+        pass
+
+
+@pytest.fixture
+def push_env(monkeypatch):
+    version_docs = {
+        "version_{}".format(idx): {
+            "_id": "version_{}".format(idx),
+            "name": idx,
+            "parent": "src_subset_id",
+            "data": {}
+        }
+        for idx in range(1, 4)
+    }
+    subset_doc = {
+        "_id": "src_subset_id",
+        "name": "modelMain",
+        "parent": "src_asset_id",
+        "data": {"family": "model"}
+    }
+    asset_docs = {
+        "src_asset_id": {"_id": "src_asset_id", "name": "src", "data": {}},
+        DST_ASSET_ID: {"_id": DST_ASSET_ID, "name": "dst", "data": {}},
+    }
+    dst_subset_doc = {
+        "_id": DST_SUBSET_ID,
+        "name": "modelMain",
+        "parent": DST_ASSET_ID,
+        "data": {"family": "model"}
+    }
+
+    def get_representations(project_name, version_ids=None):
+        if project_name == SRC_PROJECT:
+            return [{"_id": "repre_id", "name": "abc"}]
+        return []
+
+    mocked_functions = {
+        "get_project": lambda project_name: {"name": project_name},
+        "get_version_by_id": lambda _, version_id: version_docs.get(
+            version_id
+        ),
+        "get_subset_by_id": lambda *args: subset_doc,
+        "get_asset_by_id": lambda _, asset_id: asset_docs.get(asset_id),
+        "get_representations": get_representations,
+        "get_project_settings": lambda project_name: {},
+        "get_publish_template_name": lambda *args, **kwargs: "publish",
+        "get_subset_name": lambda *args, **kwargs: "modelMain",
+        "get_subset_by_name": lambda *args: dst_subset_doc,
+        "get_last_version_by_subset_id": lambda *args: {"name": 2},
+        "get_version_by_name": lambda *args: None,
+        "get_openpype_username": lambda: "tester",
+        "Anatomy": _Anatomy,
+        "OperationsSession": _Operations,
+        "FileTransaction": _FileTransaction,
+    }
+    for attr_name, value in mocked_functions.items():
+        monkeypatch.setattr(control_integrate, attr_name, value)
+
+    # Files and representations are not part of the test
+    process_cls = control_integrate.ProjectPushItemProcess
+    monkeypatch.setattr(
+        process_cls, "prepare_representations_transfers", lambda self: None
+    )
+    monkeypatch.setattr(
+        process_cls,
+        "prepare_representations_database_operations",
+        lambda self: None
+    )
+    monkeypatch.setattr(_Operations, "sessions", [])
+    monkeypatch.setattr(_FileTransaction, "transactions", [])
+
+
+def _create_item(version_id, dst_version=None):
+    return ProjectPushItem(
+        SRC_PROJECT,
+        version_id,
+        DST_PROJECT,
+        DST_ASSET_ID,
+        None,
+        "Main",
+        dst_version=dst_version
+    )
+
+
+def _created_versions(operations):
+    return [
+        doc["name"]
+        for entity_type, doc in operations.created
+        if entity_type == "version"
+    ]
+
+
+def test_batch_push_reserves_versions(push_env):
+    batch = ProjectPushBatchProcess(
+        [_create_item("version_1"), _create_item("version_2")]
+    )
+    batch.process()
+
+    assert not batch.status.failed
+    assert batch.status.finished
+    operations = _Operations.sessions[-1]
+    assert operations.committed
+    assert _created_versions(operations) == [3, 4]
+    assert _FileTransaction.transactions[-1].finalized
+
+
+def test_batch_push_failed_item_rolls_back(push_env):
+    batch = ProjectPushBatchProcess(
+        [_create_item("version_1"), _create_item("missing_version")]
+    )
+    batch.process()
+
+    assert batch.status.failed
+    assert "missing_version" in batch.status.fail_reason
+    operations = _Operations.sessions[-1]
+    # Version of first item was prepared but never committed
+    assert _created_versions(operations) == [3]
+    assert operations.cleared
+    assert not operations.committed
+    file_transaction = _FileTransaction.transactions[-1]
+    assert file_transaction.rolled_back
+    assert not file_transaction.processed
+
+
+def test_batch_push_version_conflict(push_env):
+    batch = ProjectPushBatchProcess([
+        _create_item("version_1", dst_version=5),
+        _create_item("version_2", dst_version=5),
+    ])
+    batch.process()
+
+    assert batch.status.failed
+    assert "already pushed" in batch.status.fail_reason
+    operations = _Operations.sessions[-1]
+    assert operations.cleared
+    assert not operations.committed
+    assert _FileTransaction.transactions[-1].rolled_back